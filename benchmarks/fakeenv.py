@@ -0,0 +1,131 @@
+"""
+Headless stand-in for the Maya environment.
+
+Makes the tlc package importable outside Maya: the fake maya modules used to
+build the documentation (docs/sphinx/fake_modules) are put in the python path
+and the Qt bindings (PySide6, shiboken6), as well as any maya module missing
+from the fake ones, are replaced by mock modules (the same approach used by
+sphinx autodoc_mock_imports).
+
+The fake maya.cmds and maya.api.OpenMaya modules work on an in-memory scene
+(maya.fakescene), so the full mesh checker can also run headless.
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import sys
+import types
+import importlib.abc
+import importlib.machinery
+
+
+repoDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+"""Root directory of the repository
+"""
+
+fakeModulesDir = os.path.join(repoDir, "docs", "sphinx", "fake_modules")
+"""Fake maya modules (used to build the documentation)
+"""
+
+pythonDir = os.path.join(repoDir, "maya", "python")
+"""Directory of the tlc package
+"""
+
+mockedModules = [ "PySide6", "shiboken6", "maya" ]
+"""Top level modules whose missing submodules are mocked
+"""
+
+
+class _MockObject():
+    """Object accepting any attribute access, call or subclassing
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __mro_entries__(self, bases):
+        return (_MockObject,)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _MockObject()
+
+    def __call__(self, *args, **kwargs):
+        return _MockObject()
+
+    def __iter__(self):
+        return iter([])
+
+    def __bool__(self):
+        return False
+
+    def __int__(self):
+        return 0
+
+    def __or__(self, other):
+        return self
+
+    __ror__ = __or__
+
+
+class _MockModule(types.ModuleType):
+    """Module returning mock objects for any attribute
+    """
+
+    __path__ = []
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _MockObject()
+
+
+class _MockFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Import hook creating mock modules for the modules not found elsewhere
+    """
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split(".")[0] not in mockedModules:
+            return None
+        # Real (or fake) modules have priority over mocks
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find = getattr(finder, "find_spec", None)
+            if find and find(fullname, path, target):
+                return None
+        return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+
+    def create_module(self, spec):
+        return _MockModule(spec.name)
+
+    def exec_module(self, module):
+        pass
+
+
+def activate():
+    """Set up the headless environment (python path and import hooks).
+    Calling it more than once has no effect
+    """
+    for d in (pythonDir, fakeModulesDir):
+        if d not in sys.path:
+            sys.path.insert(0, d)
+    if not any(isinstance(f, _MockFinder) for f in sys.meta_path):
+        sys.meta_path.append(_MockFinder())
@@ -0,0 +1,361 @@
+"""
+Benchmarks of the mesh checker and texture analyzer hot paths.
+
+Synthetic scenes (see synthetic.py) of several sizes are generated and the
+analysis engines are timed on them: face analysis (geometry and UVs,
+including normalized texel density), edge and vertex analysis (topology and
+valences), UV overlap detection (also checked on layouts with known
+overlaps) and texture file name verification. The full mesh checker is also timed on meshes created in the
+scene. The results are written to a JSON file, so they can be compared
+across commits.
+
+It runs in a headless mayapy session or, with --fake, in a plain python
+interpreter using the fake maya modules (see fakeenv.py).
+
+Usage:
+    mayapy run_benchmarks.py [-s 10k 100k 1M] [-r <repeat>] [-o <results.json>] [-c <baseline.json>]
+    python run_benchmarks.py --fake [...]
+
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import datetime
+import subprocess
+import statistics
+
+import fakeenv
+
+
+defaultSizes = [ "10k", "100k", "1M" ]
+"""Scene sizes (number of faces) benchmarked by default
+"""
+
+defaultRepeat = 3
+"""Number of times each benchmark is run (the minimum time is the reference)
+"""
+
+numTextureNames = 10000
+"""Number of texture file names verified in the texture names benchmark
+"""
+
+
+def parseSize(size):
+    """Parse a number of faces (e.g. 10k, 1M, 5000)
+
+    Args:
+        size (str): Number with an optional k/M suffix
+
+    Returns:
+        int: Number of faces
+    """
+    multipliers = { "k": 1000, "K": 1000, "m": 1000000, "M": 1000000 }
+    if size[-1] in multipliers:
+        return int(float(size[:-1]) * multipliers[size[-1]])
+    return int(size)
+
+
+def timeIt(func, repeat):
+    """Run a function several times
+
+    Args:
+        func (function): Function to run (without arguments)
+        repeat (int): Number of runs
+
+    Returns:
+        float[]: Time of each run (seconds)
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def meshBenchmarks(mesh):
+    """Benchmarks of the mesh analysis engines (plain arrays, no Maya needed)
+
+    Args:
+        mesh (MeshData): Mesh to analyze
+
+    Returns:
+        dict: Map of benchmark name to function (without arguments)
+    """
+    from tlc.modeling import meshanalysis
+    from tlc.modeling import meshtopology
+    from tlc.modeling import uvoverlap
+
+    topology = meshtopology.MeshTopology(mesh)
+    return {
+        "faces.geometry": lambda: meshanalysis.analyzeFaceGeometry(mesh),
+        "faces.uvs_ntd": lambda: meshanalysis.analyzeFaceUVs(mesh),
+        "edges.topology": lambda: meshtopology.MeshTopology(mesh),
+        "edges.analysis": lambda: meshtopology.analyzeTopology(mesh, topology=topology),
+        "vertices.valences": lambda: meshtopology.analyzeValences(mesh, topology=topology),
+        "uvs.overlap": lambda: uvoverlap.findOverlappingFaces([ mesh ]),
+    }
+
+
+def checkUVOverlaps(numFaces):
+    """Check the UV overlap detector on grids with known overlaps, with and
+    without a stray UV stretching a face over many tiles
+
+    Args:
+        numFaces (int): Approximate number of faces of the grid
+
+    Returns:
+        str[]: Errors found (empty if the results are right)
+    """
+    import numpy as np
+    import synthetic
+    from tlc.modeling import uvoverlap
+
+    errors = []
+    mesh = synthetic.grid(numFaces)
+    expected = synthetic.injectUVOverlaps(mesh)
+    found = uvoverlap.overlappingFacesPerMesh(uvoverlap.findOverlappingFaces([ mesh ]), 1)[0]
+    if not np.array_equal(found, expected):
+        errors.append("%d overlapping faces expected, %d found (%d missing)" % (len(expected), len(found), len(np.setdiff1d(expected, found))))
+    # The stray face overlaps the faces it is stretched over, the rest must be found anyway
+    stray = int(np.setdiff1d(np.arange(mesh.numFaces()), expected)[0])
+    synthetic.injectStrayUV(mesh, (300., 300.), stray)
+    found = uvoverlap.overlappingFacesPerMesh(uvoverlap.findOverlappingFaces([ mesh ]), 1)[0]
+    missing = np.setdiff1d(np.append(expected, stray), found)
+    if len(missing):
+        errors.append("stray UV: %d overlapping faces missing" % len(missing))
+    return errors
+
+
+def createMayaMesh(mesh, name):
+    """Create a mesh in the Maya scene from plain arrays
+
+    Args:
+        mesh (MeshData): Mesh
+        name (str): Transform node name
+
+    Returns:
+        str: Transform node name
+    """
+    import maya.api.OpenMaya as om
+    import maya.cmds as cmds
+
+    points = om.MPointArray([ om.MPoint(p[0], p[1], p[2]) for p in mesh.points.tolist() ])
+    fn = om.MFnMesh()
+    obj = fn.create(points, mesh.faceVertexCounts.tolist(), mesh.faceVertexIndices.tolist(), mesh.u.tolist(), mesh.v.tolist())
+    fn.assignUVs(mesh.uvCounts.tolist(), mesh.uvIds.tolist())
+    transform = om.MFnDagNode(obj).name()
+    return cmds.rename(transform, name)
+
+
+def mayaBenchmarks(mesh, name):
+    """Benchmarks of the full mesh checker (MeshChecker.analyze) on a mesh
+    created in the scene, without and with cached results
+
+    Args:
+        mesh (MeshData): Mesh
+        name (str): Scene name (used for the node name)
+
+    Returns:
+        dict: Map of benchmark name to function (without arguments)
+    """
+    import maya.cmds as cmds
+    import tlc.modeling.meshcheck
+
+    node = createMayaMesh(mesh, name)
+
+    def analyze():
+        checker = tlc.modeling.meshcheck.MeshChecker()
+        cmds.select(node, replace=True)
+        checker.analyze()
+
+    def analyzeCached():
+        cmds.select(node, replace=True)
+        cached_checker.analyze()
+
+    cached_checker = tlc.modeling.meshcheck.MeshChecker()
+    cmds.select(node, replace=True)
+    cached_checker.analyze()
+    return {
+        "meshcheck.analyze": analyze,
+        "meshcheck.analyze_cached": analyzeCached,
+    }
+
+
+def textureNames(num):
+    """Texture file names of all the supported sources, with correct and
+    wrong names
+
+    Args:
+        num (int): Number of names
+
+    Returns:
+        (str, str, str, int)[]: File name (without extension), file format, map type and resolution
+    """
+    templates = [
+        ("PROJ_CH_hero_body_albedo_4k_v{0}", "png", "albedo", 4096),
+        ("PROJ_PR_chair_wood_roughness_2k_v{0}", "tif", "roughness", 2048),
+        ("PROJ_PR_chair_wood_normal_1k_{0}", "png", "normal", 1024),
+        ("vgvmdd2_4K_Albedo", "jpg", "albedo", 4096),
+        ("rock_wall_nor_gl_2k", "exr", "normal", 2048),
+        ("Bricks059_2K_Color", "jpg", "albedo", 2048),
+        ("T_Concrete_N", "png", "normal", 1024),
+        ("studio_small_{0}k", "exr", "hdri", 4096),
+        ("untitled{0}", "png", "albedo", 512),
+    ]
+    names = []
+    for i in range(num):
+        template, fmt, map_type, res = templates[i % len(templates)]
+        names.append((template.format(i % 10 + 1), fmt, map_type, res))
+    return names
+
+
+def textureBenchmarks(num):
+    """Benchmarks of the texture file name verification
+
+    Args:
+        num (int): Number of texture names
+
+    Returns:
+        dict: Map of benchmark name to function (without arguments)
+    """
+    import tlc.shading.textureanalyzer as ta
+
+    textures = []
+    for file_name, fmt, map_type, res in textureNames(num):
+        # Bypass the constructor (it reads the attributes of a file node)
+        tex = ta.FileTexture.__new__(ta.FileTexture)
+        tex.fileName = file_name
+        tex.fileFormat = fmt
+        tex.mapType = map_type
+        tex.resX = res
+        tex.resY = res
+        tex.assetFile = None
+        tex.errors = set()
+        tex.errorMessage = ""
+        tex.normalMapType = None
+        tex.version = 0
+        tex.imgSrc = ta.ImageSource.IMG_SRC_UNKNOWN
+        textures.append(tex)
+
+    def verify():
+        for tex in textures:
+            tex.imgSrc = tex.getImageSource(False)
+            tex.verifyTextureName(True)
+
+    return { "textures.names": verify }
+
+
+def gitCommit():
+    """Current commit of the repository
+
+    Returns:
+        str: Commit hash (None if not available)
+    """
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=fakeenv.repoDir, stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compareResults(results, baseline):
+    """Print the speedup of each benchmark over a baseline
+
+    Args:
+        results (dict[]): Benchmark results
+        baseline (dict[]): Baseline benchmark results
+    """
+    reference = { (r["scene"], r["size"], r["benchmark"]): r["min"] for r in baseline }
+    for r in results:
+        key = (r["scene"], r["size"], r["benchmark"])
+        if key in reference and r["min"] > 0:
+            print("%-20s %8s %-26s %9.4fs -> %9.4fs  x%.2f" % (r["scene"], r["size"], r["benchmark"], reference[key], r["min"], reference[key] / r["min"]))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark mesh checker and texture analyzer hot paths")
+    ap.add_argument("-s", "--sizes", required=False, help="Scene sizes (number of faces)", nargs="+", default=defaultSizes)
+    ap.add_argument("--scenes", required=False, help="Synthetic scenes", nargs="+", default=None)
+    ap.add_argument("-r", "--repeat", required=False, type=int, help="Number of runs of each benchmark", default=defaultRepeat)
+    ap.add_argument("-o", "--output", required=False, help="Output JSON file", default=None)
+    ap.add_argument("-c", "--compare", required=False, help="Baseline JSON file to compare with", default=None)
+    ap.add_argument("--fake", action="store_true", help="Run without Maya (fake maya modules)")
+    args = ap.parse_args()
+
+    if args.fake:
+        fakeenv.activate()
+    else:
+        sys.path.insert(0, fakeenv.pythonDir)
+        print("Starting Maya")
+        import maya.standalone
+        maya.standalone.initialize("Python")
+
+    import numpy as np
+    import maya.cmds as cmds
+    import synthetic
+
+    scenes = args.scenes or list(synthetic.scenes.keys())
+    results = []
+
+    def record(scene, size, num_faces, name, times):
+        r = { "scene": scene, "size": size, "faces": num_faces, "benchmark": name, "times": times,
+              "min": min(times), "median": statistics.median(times) }
+        print("%-20s %8s %-26s %9.4fs" % (scene, size, name, r["min"]))
+        results.append(r)
+
+    for size in args.sizes:
+        num_faces = parseSize(size)
+        errors = checkUVOverlaps(num_faces)
+        print("%-20s %8s %-26s %s" % ("grid_uvOverlaps", size, "uvs.overlap check", "; ".join(errors) if errors else "OK"))
+        for scene in scenes:
+            mesh = synthetic.scenes[scene](num_faces)
+            node = scene + "_" + size
+            benchmarks = meshBenchmarks(mesh)
+            benchmarks.update(mayaBenchmarks(mesh, node))
+            for name, func in benchmarks.items():
+                record(scene, size, mesh.numFaces(), name, timeIt(func, args.repeat))
+            cmds.delete(node)
+    for name, func in textureBenchmarks(numTextureNames).items():
+        record("textures", str(numTextureNames), 0, name, timeIt(func, args.repeat))
+
+    output = {
+        "date": datetime.datetime.now().isoformat(),
+        "commit": gitCommit(),
+        "mode": "fake" if args.fake else "mayapy",
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+        print("Results written to " + args.output)
+    if args.compare:
+        with open(args.compare) as f:
+            compareResults(results, json.load(f)["results"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""
+Synthetic meshes for benchmarking.
+
+Generators of plain array meshes (MeshData) of a given size (grids and UV
+spheres) and functions injecting the problems detected by the checks
+(degenerated quads, flipped UVs, faces crossing UDIM tiles, overlapping and
+stray UVs). Everything is deterministic (fixed random seed), so results can
+be compared across runs.
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+import numpy as np
+from tlc.modeling.meshanalysis import MeshData
+
+
+defaultSeed = 1234
+"""Seed of the random generator used to choose the faces to modify
+"""
+
+uvMargin = .001
+"""Distance from the generated UVs to the borders of the tile
+"""
+
+
+def _gridQuads(nu, nv, stride):
+    """Vertex indices of the quads of a regular grid of vertices
+
+    Args:
+        nu (int): Number of quads in U
+        nv (int): Number of quads in V
+        stride (int): Number of vertices in a row of the grid
+
+    Returns:
+        int[][4]: Counterclockwise vertex indices of each quad
+    """
+    i, j = np.meshgrid(np.arange(nu), np.arange(nv))
+    v0 = (j * stride + i).ravel()
+    return np.stack((v0, v0 + 1, v0 + stride + 1, v0 + stride), axis=1)
+
+
+def grid(numFaces, size=10.):
+    """Planar grid of quads with UVs in the first tile
+
+    Args:
+        numFaces (int): Approximate number of faces (rounded to a square grid)
+        size (float, optional): Width of the grid (in scene units). Defaults to 10.
+
+    Returns:
+        MeshData: Grid mesh
+    """
+    n = max(1, int(round(math.sqrt(numFaces))))
+    s = np.linspace(0., 1., n + 1)
+    x, z = np.meshgrid(s, s)
+    points = np.stack(((x.ravel() - .5) * size, np.zeros(x.size), (z.ravel() - .5) * size), axis=1)
+    # UVs kept off the tile borders
+    u = uvMargin + x.ravel() * (1. - 2. * uvMargin)
+    v = uvMargin + z.ravel() * (1. - 2. * uvMargin)
+    quads = _gridQuads(n, n, n + 1)
+    counts = np.full(len(quads), 4, dtype=np.int64)
+    indices = quads.ravel()
+    return MeshData(counts, indices, points, u=u, v=v, uvCounts=counts, uvIds=indices.copy())
+
+
+def sphere(numFaces, radius=1.):
+    """UV sphere (quads and triangle fans at the poles) with a UV seam
+
+    Args:
+        numFaces (int): Approximate number of faces
+        radius (float, optional): Sphere radius. Defaults to 1.
+
+    Returns:
+        MeshData: Sphere mesh
+    """
+    rings = max(3, int(round(math.sqrt(numFaces / 2.))))
+    segments = max(3, int(round(numFaces / rings)))
+    # Vertices: south pole, (rings - 1) rows of segments vertices, north pole
+    theta = np.linspace(0., math.pi, rings + 1)[1:-1]
+    phi = np.linspace(0., 2. * math.pi, segments + 1)[:-1]
+    t, p = np.meshgrid(theta, phi, indexing="ij")
+    body = np.stack((np.sin(t) * np.cos(p), -np.cos(t), np.sin(t) * np.sin(p)), axis=1 if t.ndim == 1 else 2).reshape(-1, 3)
+    points = np.concatenate(([[0., -1., 0.]], body, [[0., 1., 0.]])) * radius
+    north = len(points) - 1
+
+    def row(r):
+        return 1 + r * segments + np.arange(segments)
+
+    # Faces: south fan, quad rows, north fan
+    south = np.stack((np.zeros(segments, dtype=np.int64), np.roll(row(0), -1), row(0)), axis=1)
+    quads = [ np.stack((row(r), np.roll(row(r), -1), np.roll(row(r + 1), -1), row(r + 1)), axis=1) for r in range(rings - 2) ]
+    quads = np.concatenate(quads) if quads else np.zeros((0, 4), dtype=np.int64)
+    top = np.stack((row(rings - 2), np.roll(row(rings - 2), -1), np.full(segments, north)), axis=1)
+    counts = np.concatenate((np.full(segments, 3), np.full(len(quads), 4), np.full(segments, 3)))
+    indices = np.concatenate((south.ravel(), quads.ravel(), top.ravel()))
+
+    # UVs: (segments + 1) x (rings + 1) grid (seam column duplicated, one UV per pole and segment)
+    stride = segments + 1
+    uu, vv = np.meshgrid(np.linspace(uvMargin, 1. - uvMargin, stride), np.linspace(uvMargin, 1. - uvMargin, rings + 1))
+    uv_quads = _gridQuads(segments, rings, stride)
+    uv_south = uv_quads[:segments][:, [0, 2, 3]]
+    uv_body = uv_quads[segments:-segments]
+    uv_north = uv_quads[-segments:][:, [0, 1, 2]]
+    uv_ids = np.concatenate((uv_south.ravel(), uv_body.ravel(), uv_north.ravel()))
+    return MeshData(counts, indices, points, u=uu.ravel(), v=vv.ravel(), uvCounts=counts, uvIds=uv_ids)
+
+
+def _pickFaces(mesh, fraction, seed, mask=None):
+    """Choose random faces of a mesh
+
+    Args:
+        mesh (MeshData): Mesh
+        fraction (float): Fraction of the faces to choose
+        seed (int): Random seed
+        mask (bool[], optional): Faces that may be chosen. Defaults to all.
+
+    Returns:
+        int[]: Sorted face indices
+    """
+    candidates = np.arange(mesh.numFaces()) if mask is None else np.flatnonzero(mask)
+    num = min(len(candidates), int(round(mesh.numFaces() * fraction)))
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(candidates, num, replace=False))
+
+
+def injectDegenerateQuads(mesh, fraction=.01, seed=defaultSeed):
+    """Collapse an edge of some quads, moving its second vertex onto the
+    first one (topology is kept). The mesh is modified in place
+
+    The faces sharing the collapsed edges (or the moved vertices) become
+    degenerated as well
+
+    Args:
+        mesh (MeshData): Mesh
+        fraction (float, optional): Fraction of the faces to modify. Defaults to .01.
+        seed (int, optional): Random seed. Defaults to defaultSeed.
+
+    Returns:
+        int[]: Modified faces
+    """
+    faces = _pickFaces(mesh, fraction, seed, mesh.faceVertexCounts == 4)
+    offsets = mesh.faceOffsets()[faces]
+    fvi = mesh.faceVertexIndices
+    points = mesh.points.copy()
+    points[fvi[offsets + 1]] = points[fvi[offsets]]
+    mesh.points = points
+    mesh.worldPoints = points
+    return faces
+
+
+def injectFlippedUVs(mesh, fraction=.01, seed=defaultSeed):
+    """Mirror the UVs of some faces (reverse winding in UV space). The
+    mesh is modified in place
+
+    Args:
+        mesh (MeshData): Mesh
+        fraction (float, optional): Fraction of the faces to modify. Defaults to .01.
+        seed (int, optional): Random seed. Defaults to defaultSeed.
+
+    Returns:
+        int[]: Modified faces
+    """
+    faces = _pickFaces(mesh, fraction, seed, mesh.uvCounts > 0)
+    uv_offsets = np.concatenate(([0], np.cumsum(mesh.uvCounts)[:-1]))
+    # Every face gets its own UVs mirrored around its first UV
+    starts = uv_offsets[faces]
+    counts = mesh.uvCounts[faces]
+    face_of = np.repeat(np.arange(len(faces)), counts)
+    corners = np.repeat(starts, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    old_ids = mesh.uvIds[corners]
+    pivot = mesh.u[mesh.uvIds[starts]][face_of]
+    new_ids = len(mesh.u) + np.arange(len(corners))
+    mesh.u = np.concatenate((mesh.u, 2. * pivot - mesh.u[old_ids]))
+    mesh.v = np.concatenate((mesh.v, mesh.v[old_ids]))
+    mesh.uvIds[corners] = new_ids
+    return faces
+
+
+def injectUDIMCrossings(mesh, tiles=4):
+    """Spread the UVs over several UDIM tiles (in U), so the faces
+    containing a tile border cross it. The mesh is modified in place
+
+    Args:
+        mesh (MeshData): Mesh
+        tiles (int, optional): Number of tiles. Defaults to 4.
+
+    Returns:
+        int: Number of tiles
+    """
+    mesh.u = mesh.u * tiles
+    return tiles
+
+
+def injectUVOverlaps(mesh, fraction=.01, seed=defaultSeed):
+    """Stack the UVs of some faces exactly onto the UVs of other faces (as
+    new UVs with the same coordinates). The mesh is modified in place
+
+    Each moved face overlaps only the face it is stacked onto (it just
+    touches the neighbors of that face), so the overlapping faces are known
+
+    Args:
+        mesh (MeshData): Mesh
+        fraction (float, optional): Fraction of the faces to move. Defaults to .01.
+        seed (int, optional): Random seed. Defaults to defaultSeed.
+
+    Returns:
+        int[]: Sorted overlapping faces (moved faces and the faces they are stacked onto)
+    """
+    candidates = np.flatnonzero(mesh.uvCounts > 0)
+    num = min(len(candidates) // 2, max(1, int(round(mesh.numFaces() * fraction))))
+    rng = np.random.default_rng(seed)
+    chosen = rng.choice(candidates, 2 * num, replace=False)
+    moved, targets = chosen[:num], chosen[num:]
+    # Only faces with the same number of UVs can be stacked
+    same = mesh.uvCounts[moved] == mesh.uvCounts[targets]
+    moved, targets = moved[same], targets[same]
+    uv_offsets = np.concatenate(([0], np.cumsum(mesh.uvCounts)[:-1]))
+    u = [ mesh.u ]
+    v = [ mesh.v ]
+    next_id = len(mesh.u)
+    for f, t in zip(moved.tolist(), targets.tolist()):
+        count = mesh.uvCounts[f]
+        target_ids = mesh.uvIds[uv_offsets[t]:uv_offsets[t] + count]
+        mesh.uvIds[uv_offsets[f]:uv_offsets[f] + count] = next_id + np.arange(count)
+        u.append(mesh.u[target_ids])
+        v.append(mesh.v[target_ids])
+        next_id += count
+    mesh.u = np.concatenate(u)
+    mesh.v = np.concatenate(v)
+    return np.sort(np.concatenate((moved, targets)))
+
+
+def injectStrayUV(mesh, position=(50., 50.), face=0):
+    """Move the first UV of a face far away from the rest (as a new UV),
+    stretching the face over many tiles. The mesh is modified in place
+
+    Args:
+        mesh (MeshData): Mesh
+        position (float[2], optional): Position of the stray UV. Defaults to (50, 50).
+        face (int, optional): Face index. Defaults to 0.
+
+    Returns:
+        int: Modified face
+    """
+    uv_offsets = np.concatenate(([0], np.cumsum(mesh.uvCounts)[:-1]))
+    mesh.uvIds[uv_offsets[face]] = len(mesh.u)
+    mesh.u = np.concatenate((mesh.u, [ position[0] ]))
+    mesh.v = np.concatenate((mesh.v, [ position[1] ]))
+    return face
+
+
+scenes = {
+    "grid": lambda n: grid(n),
+    "sphere": lambda n: sphere(n),
+    "grid_degenerate": lambda n: _modified(grid(n), injectDegenerateQuads),
+    "grid_flippedUVs": lambda n: _modified(grid(n), injectFlippedUVs),
+    "sphere_udim": lambda n: _modified(sphere(n), injectUDIMCrossings),
+    "grid_uvOverlaps": lambda n: _modified(grid(n), injectUVOverlaps),
+    "grid_strayUV": lambda n: _modified(_modified(grid(n), injectUVOverlaps), injectStrayUV),
+}
+"""Synthetic scene generators (by name). They take the approximate number of faces
+"""
+
+
+def _modified(mesh, func):
+    func(mesh)
+    return mesh
@@ -0,0 +1,60 @@
+"""
+Fake maya.OpenMaya module (Maya Python API 1.0).
+
+Only the DAG iterator is provided, working on the in-memory scene of
+maya.fakescene (which has no instancing).
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import maya.fakescene as fakescene
+
+
+class MItDag():
+    kDepthFirst = 0
+    kBreadthFirst = 1
+
+    def __init__(self, traversalType=kDepthFirst):
+        roots = fakescene.currentScene().assemblies()
+        if traversalType == MItDag.kBreadthFirst:
+            self._nodes = []
+            level = roots
+            while level:
+                self._nodes.extend(level)
+                level = [ c for n in level for c in n.children ]
+        else:
+            self._nodes = []
+            for r in roots:
+                self._nodes.append(r)
+                self._nodes.extend(r.descendants())
+        self._pos = 0
+
+    def isDone(self):
+        return self._pos >= len(self._nodes)
+
+    def next(self):
+        self._pos += 1
+
+    def fullPathName(self):
+        return self._nodes[self._pos].fullPath()
+
+    def partialPathName(self):
+        return fakescene.currentScene().shortestName(self._nodes[self._pos])
+
+    def isInstanced(self, indirect=True):
+        return False
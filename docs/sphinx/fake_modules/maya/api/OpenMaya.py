@@ -0,0 +1,816 @@
+"""
+Fake maya.api.OpenMaya module.
+
+Functional stand-in of the parts of the Maya Python API 2.0 used by the tlc
+package (selection lists, DAG paths, MFnMesh and mesh iterators), working on
+the in-memory scene of maya.fakescene.
+
+Array getters return NumPy arrays instead of M*Array objects (they are used
+as sequences, so the calling code does not need to know).
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+import maya.fakescene as fakescene
+
+
+class MFn():
+    """Function set types (values returned by apiType)
+    """
+    kInvalid = 0
+    kTransform = 110
+    kCamera = 250
+    kMesh = 296
+    kMeshEdgeComponent = 548
+    kMeshPolygonComponent = 550
+    kMeshVertComponent = 551
+
+    nodeTypes = { "transform": kTransform, "camera": kCamera, "mesh": kMesh }
+    componentTypes = { "f": kMeshPolygonComponent, "e": kMeshEdgeComponent, "vtx": kMeshVertComponent }
+
+
+class MSpace():
+    """Coordinate spaces
+    """
+    kInvalid = 0
+    kTransform = 1
+    kPreTransform = 2
+    kPostTransform = 3
+    kWorld = 4
+    kObject = kPreTransform
+
+
+class MPoint():
+    """Homogeneous point (sequence of 4 values)
+    """
+
+    def __init__(self, x=0., y=0., z=0., w=1.):
+        if isinstance(x, (list, tuple, np.ndarray, MPoint)):
+            values = list(x) + [ 0., 0., 0., 1. ][len(x):]
+            x, y, z, w = values[:4]
+        self.x, self.y, self.z, self.w = float(x), float(y), float(z), float(w)
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, i):
+        return (self.x, self.y, self.z, self.w)[i]
+
+    def __repr__(self):
+        return "MPoint(%g, %g, %g, %g)" % (self.x, self.y, self.z, self.w)
+
+
+class MPointArray(list):
+    """Array of points (list of MPoint)
+    """
+
+
+class MIntArray(list):
+    """Array of integers
+    """
+
+
+class MFloatArray(list):
+    """Array of floats
+    """
+
+
+class MMatrix():
+    """4x4 matrix (row vectors). Iterating gives its 16 values
+    """
+
+    def __init__(self, values=None):
+        self.m = np.identity(4) if values is None else np.array(values, dtype=np.float64).reshape(4, 4)
+
+    def __iter__(self):
+        return iter(self.m.ravel().tolist())
+
+    def __len__(self):
+        return 16
+
+    def __getitem__(self, i):
+        return float(self.m.ravel()[i])
+
+    def getElement(self, row, col):
+        return float(self.m[row, col])
+
+    def __mul__(self, other):
+        return MMatrix(self.m @ other.m)
+
+    def inverse(self):
+        return MMatrix(np.linalg.inv(self.m))
+
+
+class MObject():
+    """Node or component object
+    """
+
+    kNullObj = None
+
+    def __init__(self, node=None, componentType=None, elements=None):
+        self._node = node
+        self._componentType = componentType
+        self._elements = list(elements) if elements is not None else []
+
+    def isNull(self):
+        return self._node is None and self._componentType is None
+
+    def apiType(self):
+        if self._componentType is not None:
+            return MFn.componentTypes[self._componentType]
+        if self._node is None:
+            return MFn.kInvalid
+        return MFn.nodeTypes.get(self._node.type, MFn.kInvalid)
+
+    def hasFn(self, fnType):
+        return self.apiType() == fnType
+
+
+MObject.kNullObj = MObject()
+
+
+class MDagPath():
+    """Path to a DAG node
+    """
+
+    def __init__(self, node=None):
+        self._node = node
+
+    def _check(self):
+        if self._node is None:
+            raise RuntimeError("(kFailure): Object does not exist")
+
+    def fullPathName(self):
+        self._check()
+        return self._node.fullPath()
+
+    def partialPathName(self):
+        self._check()
+        return fakescene.currentScene().shortestName(self._node)
+
+    def apiType(self):
+        self._check()
+        return MFn.nodeTypes.get(self._node.type, MFn.kInvalid)
+
+    def hasFn(self, fnType):
+        return self.apiType() == fnType
+
+    def node(self):
+        return MObject(self._node)
+
+    def transform(self):
+        self._check()
+        node = self._node
+        return MObject(node if node.type == "transform" else node.parent)
+
+    def extendToShape(self):
+        self._check()
+        if self._node.isShape():
+            return self
+        shapes = [ c for c in self._node.children if c.isShape() and not c.attrs.get("intermediateObject") ]
+        if len(shapes) != 1:
+            raise RuntimeError("(kInvalidParameter): Object has " + str(len(shapes)) + " shapes")
+        self._node = shapes[0]
+        return self
+
+    def inclusiveMatrix(self):
+        self._check()
+        return MMatrix(self._node.worldMatrix())
+
+    def exclusiveMatrix(self):
+        self._check()
+        parent = self._node.parent
+        return MMatrix(parent.worldMatrix() if parent else None)
+
+    def isValid(self):
+        return self._node is not None and self._node in fakescene.currentScene().nodes
+
+    def __eq__(self, other):
+        return isinstance(other, MDagPath) and self._node is other._node
+
+    def __hash__(self):
+        return id(self._node)
+
+
+def _parseComponent(item):
+    """Split a selection item in node name and component (type and indices)
+    """
+    match = fakescene.componentPattern.match(item)
+    if not match:
+        return item, None, None
+    first = int(match.group("first"))
+    last = int(match.group("last")) if match.group("last") else first
+    return match.group("node"), match.group("type"), list(range(first, last + 1))
+
+
+class MSelectionList():
+    """List of selected nodes and components
+    """
+
+    def __init__(self, other=None):
+        self._items = list(other._items) if isinstance(other, MSelectionList) else []
+
+    def add(self, item, mergeWithExisting=True):
+        if isinstance(item, MDagPath):
+            self._items.append((item._node, None, None))
+            return self
+        name, comp_type, indices = _parseComponent(item)
+        node = fakescene.currentScene().find(name)
+        if comp_type:
+            for n, t, idx in self._items:
+                if mergeWithExisting and n is node and t == comp_type:
+                    idx.extend(i for i in indices if i not in idx)
+                    return self
+        self._items.append((node, comp_type, indices))
+        return self
+
+    def length(self):
+        return len(self._items)
+
+    def isEmpty(self):
+        return not self._items
+
+    def clear(self):
+        self._items = []
+        return self
+
+    def getDagPath(self, i):
+        node = self._items[i][0]
+        if not node.isDag():
+            raise TypeError("(kInvalidParameter): Object is not a DAG node")
+        return MDagPath(node)
+
+    def getDependNode(self, i):
+        return MObject(self._items[i][0])
+
+    def getComponent(self, i):
+        node, comp_type, indices = self._items[i]
+        comp = MObject(None, comp_type, indices) if comp_type else MObject()
+        return MDagPath(node), comp
+
+    def getSelectionStrings(self, i=None):
+        items = self._items if i is None else [ self._items[i] ]
+        strings = []
+        scene = fakescene.currentScene()
+        for node, comp_type, indices in items:
+            name = scene.shortestName(node)
+            if comp_type:
+                strings.extend(name + "." + comp_type + "[" + str(j) + "]" for j in indices)
+            else:
+                strings.append(name)
+        return strings
+
+
+class MGlobal():
+    """Global functions (selection and messages)
+    """
+    kReplaceList = 0
+    kXORWithList = 1
+    kRemoveFromList = 2
+    kAddToList = 3
+
+    @staticmethod
+    def getActiveSelectionList(orderedSelectionIfAvailable=False):
+        sel = MSelectionList()
+        for item in fakescene.currentScene().selection:
+            sel.add(item)
+        return sel
+
+    @staticmethod
+    def setActiveSelectionList(selection, listAdjustment=0):
+        scene = fakescene.currentScene()
+        items = selection.getSelectionStrings()
+        if listAdjustment == MGlobal.kAddToList:
+            scene.selection += [ i for i in items if i not in scene.selection ]
+        elif listAdjustment == MGlobal.kRemoveFromList:
+            scene.selection = [ i for i in scene.selection if i not in items ]
+        else:
+            scene.selection = items
+
+    @staticmethod
+    def displayError(msg):
+        print("# Error: " + str(msg))
+
+    @staticmethod
+    def displayWarning(msg):
+        print("# Warning: " + str(msg))
+
+    @staticmethod
+    def displayInfo(msg):
+        print(str(msg))
+
+
+def _meshNode(obj):
+    """Mesh shape node of a DAG path or MObject (transforms are extended to their shape)
+    """
+    if isinstance(obj, MDagPath):
+        obj._check()
+        node = obj._node
+    elif isinstance(obj, MObject):
+        node = obj._node
+    else:
+        node = fakescene.currentScene().find(obj)
+    if node is not None and node.type == "transform":
+        node = MDagPath(node).extendToShape()._node
+    if node is None or node.type != "mesh" or node.mesh is None:
+        raise RuntimeError("(kInvalidParameter): Object is not a mesh")
+    return node
+
+
+def _matrix(dag, space):
+    """World matrix of a DAG path (None for object space or non DAG objects)
+    """
+    if space == MSpace.kWorld and isinstance(dag, MDagPath):
+        return dag._node.worldMatrix()
+    return None
+
+
+class MPlug():
+    """Plug of a node attribute (values read from the fake scene node)
+    """
+
+    def __init__(self, node=None, attr=""):
+        self._node = node
+        self._attr = attr
+
+    def isNull(self):
+        return self._node is None
+
+    def name(self):
+        return fakescene.currentScene().shortestName(self._node) + "." + self._attr
+
+    def partialName(self):
+        return self._attr
+
+    def _value(self):
+        if self._attr not in self._node.attrs:
+            raise RuntimeError("(kInvalidParameter): No element at given index")
+        return self._node.attrs[self._attr]
+
+    def asString(self):
+        value = self._value()
+        return "" if value is None else str(value)
+
+    def asInt(self):
+        return int(self._value())
+
+    def asFloat(self):
+        return float(self._value())
+
+    def asDouble(self):
+        return float(self._value())
+
+    def asBool(self):
+        return bool(self._value())
+
+    def elementByLogicalIndex(self, index):
+        return self
+
+    def asMObject(self):
+        if self._attr == "worldMatrix" and self._node.isDag():
+            data = MObject()
+            data._matrix = MMatrix(self._node.worldMatrix())
+            return data
+        raise RuntimeError("(kInvalidParameter): Plug is not a matrix")
+
+
+class MFnMatrixData():
+    """Function set of matrix data (the value of matrix plugs)
+    """
+
+    def __init__(self, obj=None):
+        self._data = obj
+
+    def matrix(self):
+        return self._data._matrix
+
+
+class MTime():
+    """Time value (frames in the fake scene)
+    """
+
+    kFilm = 6
+
+    def __init__(self, value=0., unit=None):
+        self.value = float(value)
+        self.unit = unit
+
+    @staticmethod
+    def uiUnit():
+        return MTime.kFilm
+
+
+class MDGContext():
+    """Dependency graph evaluation context (normal or at a given time)
+    """
+
+    kNormal = None
+
+    def __init__(self, time=None):
+        self._time = time
+
+    def isNormal(self):
+        return self._time is None
+
+
+MDGContext.kNormal = MDGContext()
+
+
+class MDGContextGuard():
+    """Make a context current in a with block (attributes are the same at every frame in the fake scene)
+    """
+
+    def __init__(self, context):
+        self._context = context
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class MFnDependencyNode():
+    """Function set of dependency nodes (name, type and plugs)
+    """
+
+    def __init__(self, obj=None):
+        self._node = obj._node if obj is not None else None
+
+    def name(self):
+        return self._node.name
+
+    @property
+    def typeName(self):
+        return self._node.type
+
+    def setObject(self, obj):
+        self._node = obj._node
+        return self
+
+    def hasAttribute(self, name):
+        return name in self._node.attrs
+
+    def findPlug(self, name, wantNetworkedPlug):
+        if name not in self._node.attrs and not (name == "worldMatrix" and self._node.isDag()):
+            raise RuntimeError("(kInvalidParameter): Object does not exist")
+        return MPlug(self._node, name)
+
+
+class MFnDagNode(MFnDependencyNode):
+    """Function set of DAG nodes (paths and hierarchy)
+    """
+
+    def __init__(self, obj=None):
+        super(MFnDagNode, self).__init__(obj)
+
+    def fullPathName(self):
+        return self._node.fullPath()
+
+    def partialPathName(self):
+        return fakescene.currentScene().shortestName(self._node)
+
+    def childCount(self):
+        return len(self._node.children)
+
+    def child(self, i):
+        return MObject(self._node.children[i])
+
+    def parentCount(self):
+        return 1 if self._node.parent else 0
+
+    def parent(self, i):
+        return MObject(self._node.parent)
+
+    def getPath(self):
+        return MDagPath(self._node)
+
+
+class MFnMesh(MFnDagNode):
+    """Polygonal mesh function set (reads and writes the arrays of a mesh shape)
+    """
+
+    def __init__(self, obj=None):
+        self._dag = None
+        self._node = None
+        if obj is not None:
+            self.setObject(obj)
+
+    def setObject(self, obj):
+        self._node = _meshNode(obj)
+        self._dag = MDagPath(self._node) if isinstance(obj, MDagPath) else None
+        return self
+
+    @property
+    def _mesh(self):
+        return self._node.mesh
+
+    @property
+    def numVertices(self):
+        return len(self._mesh.points)
+
+    @property
+    def numPolygons(self):
+        return len(self._mesh.counts)
+
+    @property
+    def numEdges(self):
+        return len(self._mesh.edges()[0])
+
+    @property
+    def numFaceVertices(self):
+        return len(self._mesh.indices)
+
+    @property
+    def numUVSets(self):
+        return len(self._mesh.uvSets)
+
+    def numUVs(self, uvSet=None):
+        return len(self._mesh.uvSet(uvSet)[0])
+
+    def getVertices(self):
+        return self._mesh.counts.copy(), self._mesh.indices.copy()
+
+    def getPolygonVertices(self, polygonId):
+        offset = int(self._mesh.counts[:polygonId].sum())
+        return self._mesh.indices[offset:offset + self._mesh.counts[polygonId]].copy()
+
+    def getPoints(self, space=MSpace.kObject):
+        points = fakescene.transformPoints(self._mesh.points, _matrix(self._dag, space))
+        return np.concatenate((points, np.ones((len(points), 1))), axis=1)
+
+    def getPoint(self, vertexId, space=MSpace.kObject):
+        return MPoint(self.getPoints(space)[vertexId])
+
+    def setPoints(self, points, space=MSpace.kObject):
+        points = np.array([ list(p)[:3] for p in points ], dtype=np.float64).reshape(-1, 3)
+        matrix = _matrix(self._dag, space)
+        if matrix is not None:
+            inverse = np.linalg.inv(matrix)
+            points = points @ inverse[:3, :3] + inverse[3, :3]
+        self._mesh.points = points
+
+    def getEdgeVertices(self, edgeId):
+        a, b = self._mesh.edges()[0][edgeId]
+        return int(a), int(b)
+
+    def getUVSetNames(self):
+        return list(self._mesh.uvSets.keys())
+
+    def currentUVSetName(self, instance=-1):
+        return self._mesh.currentUVSet
+
+    def setCurrentUVSetName(self, name, modifier=None, currentSelection=None):
+        self._mesh.uvSet(name)
+        self._mesh.currentUVSet = name
+
+    def createUVSet(self, name, modifier=None, instance=-1):
+        name = fakescene.currentScene().uniqueName(name) if name in self._mesh.uvSets else name
+        self._mesh.setUVs([], [], None, None, name)
+        return name
+
+    def getUVs(self, uvSet=""):
+        u, v, _, _ = self._mesh.uvSet(uvSet or None)
+        return u.copy(), v.copy()
+
+    def setUVs(self, uArray, vArray, uvSet=""):
+        _, _, uv_counts, uv_ids = self._mesh.uvSet(uvSet or None)
+        self._mesh.setUVs(uArray, vArray, uv_counts, uv_ids, uvSet or None)
+
+    def getAssignedUVs(self, uvSet=""):
+        _, _, uv_counts, uv_ids = self._mesh.uvSet(uvSet or None)
+        return uv_counts.copy(), uv_ids.copy()
+
+    def assignUVs(self, uvCounts, uvIds, uvSet=""):
+        u, v, _, _ = self._mesh.uvSet(uvSet or None)
+        self._mesh.setUVs(u, v, uvCounts, uvIds, uvSet or None)
+
+    def getUvShellsIds(self, uvSet=""):
+        u, _, uv_counts, uv_ids = self._mesh.uvSet(uvSet or None)
+        # UVs of a face are linked to the following UV of the face
+        offsets = fakescene.faceOffsets(uv_counts)
+        face = np.repeat(np.arange(len(uv_counts)), uv_counts)
+        local = np.arange(len(uv_ids)) - offsets[face]
+        following = uv_ids[offsets[face] + (local + 1) % np.maximum(uv_counts[face], 1)]
+        labels = fakescene.connectedComponents(len(u), uv_ids, following)
+        roots, shell_ids = np.unique(labels, return_inverse=True)
+        return len(roots), shell_ids.ravel()
+
+    def create(self, vertices, polygonCounts, polygonConnects, uValues=None, vValues=None, parent=MObject.kNullObj):
+        scene = fakescene.currentScene()
+        points = np.array([ list(p)[:3] for p in vertices ], dtype=np.float64).reshape(-1, 3)
+        if parent is not None and not parent.isNull():
+            shape = scene.createNode("mesh", scene.uniqueName(parent._node.name + "Shape"), parent._node.fullPath())
+            result = shape
+        else:
+            transform = scene.createNode("transform", scene.uniqueName("polySurface1"))
+            shape = scene.createNode("mesh", scene.uniqueName("polySurfaceShape1"), transform.fullPath())
+            result = transform
+        shape.mesh = fakescene.MeshArrays(polygonCounts, polygonConnects, points)
+        if uValues is not None and len(uValues):
+            shape.mesh.setUVs(uValues, vValues)
+        self._node = shape
+        self._dag = MDagPath(shape)
+        return MObject(result)
+
+
+class MFnSingleIndexedComponent():
+    """Component with single indices (faces, edges, vertices)
+    """
+
+    def __init__(self, obj=None):
+        self._obj = obj
+
+    def create(self, componentType):
+        comp_type = { v: k for k, v in MFn.componentTypes.items() }[componentType]
+        self._obj = MObject(None, comp_type, [])
+        return self._obj
+
+    def addElement(self, element):
+        self._obj._elements.append(int(element))
+
+    def addElements(self, elements):
+        self._obj._elements.extend(int(e) for e in elements)
+
+    def getElements(self):
+        return list(self._obj._elements)
+
+    @property
+    def elementCount(self):
+        return len(self._obj._elements)
+
+    def isEmpty(self):
+        return not self._obj._elements
+
+
+class _MeshIterator():
+    """Common behaviour of the mesh component iterators
+    """
+
+    def __init__(self, obj, component, count):
+        self._dag = obj if isinstance(obj, MDagPath) else None
+        self._node = _meshNode(obj)
+        self._mesh = self._node.mesh
+        if component is not None and not component.isNull():
+            self._ids = list(component._elements)
+        else:
+            self._ids = range(count)
+        self._pos = 0
+
+    def isDone(self):
+        return self._pos >= len(self._ids)
+
+    def next(self):
+        self._pos += 1
+
+    def reset(self):
+        self._pos = 0
+
+    def count(self):
+        return len(self._ids)
+
+    def index(self):
+        return self._ids[self._pos]
+
+    def setIndex(self, index):
+        # Iterators may jump to any element of the mesh
+        if index in self._ids:
+            self._pos = self._ids.index(index)
+        else:
+            self._ids = list(self._ids) + [ index ]
+            self._pos = len(self._ids) - 1
+        return self.index()
+
+
+class MItMeshPolygon(_MeshIterator):
+    """Iterator over the faces of a mesh (or a face component)
+    """
+
+    def __init__(self, obj, component=None):
+        node = _meshNode(obj)
+        super(MItMeshPolygon, self).__init__(obj, component, len(node.mesh.counts))
+        self._offsets = fakescene.faceOffsets(self._mesh.counts)
+        self._areas = dict()
+        self._uvOffsets = dict()
+
+    def _faceAreas(self, space):
+        if space not in self._areas:
+            self._areas[space] = self._mesh.faceAreas(_matrix(self._dag, space))
+        return self._areas[space]
+
+    def polygonVertexCount(self):
+        return int(self._mesh.counts[self.index()])
+
+    def getVertices(self):
+        f = self.index()
+        return self._mesh.indices[self._offsets[f]:self._offsets[f] + self._mesh.counts[f]].tolist()
+
+    def getEdges(self):
+        f = self.index()
+        return self._mesh.edges()[1][self._offsets[f]:self._offsets[f] + self._mesh.counts[f]].tolist()
+
+    def getPoints(self, space=MSpace.kObject):
+        points = fakescene.transformPoints(self._mesh.points, _matrix(self._dag, space))
+        return [ MPoint(p) for p in points[self.getVertices()] ]
+
+    def center(self, space=MSpace.kObject):
+        points = fakescene.transformPoints(self._mesh.points, _matrix(self._dag, space))
+        return MPoint(points[self.getVertices()].mean(axis=0))
+
+    def getArea(self, space=MSpace.kObject):
+        return float(self._faceAreas(space)[self.index()])
+
+    def zeroArea(self):
+        return self._faceAreas(MSpace.kObject)[self.index()] <= 1e-12
+
+    def hasUVs(self, uvSet=""):
+        return bool(self._mesh.uvSet(uvSet or None)[2][self.index()] > 0)
+
+    def getUVArea(self, uvSet=""):
+        key = uvSet or self._mesh.currentUVSet
+        if key not in self._areas:
+            self._areas[key] = self._mesh.faceUVAreas(key)
+        return float(self._areas[key][self.index()])
+
+    def getUVs(self, uvSet=""):
+        u, v, uv_counts, uv_ids = self._mesh.uvSet(uvSet or None)
+        f = self.index()
+        offset = int(uv_counts[:f].sum())
+        ids = uv_ids[offset:offset + uv_counts[f]]
+        return u[ids].copy(), v[ids].copy()
+
+
+class MItMeshEdge(_MeshIterator):
+    """Iterator over the edges of a mesh (or an edge component)
+    """
+
+    def __init__(self, obj, component=None):
+        node = _meshNode(obj)
+        super(MItMeshEdge, self).__init__(obj, component, len(node.mesh.edges()[0]))
+
+    def vertexId(self, which):
+        return int(self._mesh.edges()[0][self.index()][which])
+
+    def point(self, which, space=MSpace.kObject):
+        points = fakescene.transformPoints(self._mesh.points, _matrix(self._dag, space))
+        return MPoint(points[self.vertexId(which)])
+
+    def length(self, space=MSpace.kObject):
+        a = self.point(0, space)
+        b = self.point(1, space)
+        return float(np.linalg.norm(np.array(a[:3]) - np.array(b[:3])))
+
+    def getConnectedFaces(self):
+        fv_edges = self._mesh.edges()[1]
+        corners = np.flatnonzero(fv_edges == self.index())
+        face = np.searchsorted(fakescene.faceOffsets(self._mesh.counts), corners, side="right") - 1
+        return face.tolist()
+
+    def onBoundary(self):
+        return len(self.getConnectedFaces()) == 1
+
+
+class MItMeshVertex(_MeshIterator):
+    """Iterator over the vertices of a mesh (or a vertex component)
+    """
+
+    def __init__(self, obj, component=None):
+        node = _meshNode(obj)
+        super(MItMeshVertex, self).__init__(obj, component, len(node.mesh.points))
+
+    def position(self, space=MSpace.kObject):
+        points = fakescene.transformPoints(self._mesh.points[self.index():self.index() + 1], _matrix(self._dag, space))
+        return MPoint(points[0])
+
+    def getConnectedEdges(self):
+        _, _, offsets, vertex_edges = self._mesh.edges()
+        v = self.index()
+        return vertex_edges[offsets[v]:offsets[v + 1]].tolist()
+
+    def numConnectedEdges(self):
+        return len(self.getConnectedEdges())
+
+    def getConnectedFaces(self):
+        corners = np.flatnonzero(self._mesh.indices == self.index())
+        face = np.searchsorted(fakescene.faceOffsets(self._mesh.counts), corners, side="right") - 1
+        return face.tolist()
+
+    def onBoundary(self):
+        edge_faces = np.bincount(self._mesh.edges()[1], minlength=len(self._mesh.edges()[0]))
+        return bool(np.any(edge_faces[self.getConnectedEdges()] == 1))
@@ -0,0 +1,403 @@
+"""
+Fake maya.cmds module.
+
+Functional stand-in of the Maya commands used by the tlc package, working
+on the in-memory scene of maya.fakescene. Only the flags used by tlc are
+supported.
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import fnmatch
+import numpy as np
+import maya.fakescene as fakescene
+
+
+def _scene():
+    """Current fake scene
+    """
+    return fakescene.currentScene()
+
+
+def _asList(items):
+    """Flatten the arguments of a command (strings or lists of strings)
+    """
+    result = []
+    for i in items:
+        if i is None:
+            continue
+        if isinstance(i, (list, tuple)):
+            result.extend(_asList(i))
+        else:
+            result.append(str(i))
+    return result
+
+
+def _typeMatches(node, types):
+    """Check whether a node is of one of the types given to a command (None matches any type)
+    """
+    if types is None:
+        return True
+    types = types if isinstance(types, (list, tuple)) else [ types ]
+    # Shapes are also "shape" and every DAG node is "dagNode"
+    return node.type in types or ("shape" in types and node.isShape()) or ("dagNode" in types and node.isDag())
+
+
+def _nodeName(node, fullPath):
+    """Name of a node as returned by the commands (full DAG path or shortest unique name)
+    """
+    return node.fullPath() if fullPath else _scene().shortestName(node)
+
+
+def ls(*args, selection=False, sl=False, type=None, assemblies=False, long=False, l=False, dag=False, shapes=False, transforms=False,
+       showType=False, st=False, **kwargs):
+    """List nodes: selection, assemblies, names or wildcard patterns, filtered by type (dag, shapes, transforms, type)
+    """
+    scene = _scene()
+    long = long or l
+    if selection or sl:
+        items = list(scene.selection)
+        if type is None:
+            return items
+        return [ i for i in items if _typeMatches(scene.find(i), type) ]
+    if assemblies:
+        nodes = scene.assemblies()
+    elif args:
+        nodes = []
+        for pattern in _asList(args):
+            if any(c in pattern for c in "*?["):
+                nodes.extend(n for n in scene.nodes if fnmatch.fnmatchcase(n.name, pattern))
+            else:
+                n = scene.find(pattern, required=False)
+                if n:
+                    nodes.append(n)
+    else:
+        nodes = list(scene.nodes)
+    if dag:
+        nodes = [ n for n in nodes if n.isDag() ]
+    if shapes:
+        nodes = [ n for n in nodes if n.isShape() ]
+    if transforms:
+        nodes = [ n for n in nodes if n.type == "transform" ]
+    nodes = [ n for n in nodes if _typeMatches(n, type) ]
+    if showType or st:
+        return [ x for n in nodes for x in (_nodeName(n, long), n.type) ]
+    return [ _nodeName(n, long) for n in nodes ]
+
+
+def listRelatives(*args, allDescendents=False, ad=False, children=False, c=False, shapes=False, s=False, parent=False, p=False,
+                  type=None, fullPath=False, f=False, **kwargs):
+    """List the parent, children or descendants of nodes (optionally shapes only or of a type)
+    """
+    scene = _scene()
+    result = []
+    for name in _asList(args):
+        node = scene.find(name)
+        if parent or p:
+            relatives = [ node.parent ] if node.parent else []
+        elif allDescendents or ad:
+            relatives = node.descendants()
+        else:
+            relatives = node.children
+        if shapes or s:
+            relatives = [ n for n in relatives if n.isShape() ]
+        result.extend(_nodeName(n, fullPath or f) for n in relatives if _typeMatches(n, type))
+    return result or None
+
+
+def listConnections(*args, plugs=False, p=False, type=None, t=None, source=True, s=None, destination=True, d=None, connections=False, c=False,
+                    shapes=False, sh=False, **kwargs):
+    """List the nodes or plugs connected to nodes or plugs (source/destination, type, connections and plugs flags)
+    """
+    scene = _scene()
+    plugs = plugs or p
+    type = type or t
+    source = source if s is None else s
+    destination = destination if d is None else d
+    by_node = dict()
+    for src, dst in scene.connections:
+        src_node = src.partition(".")[0]
+        dst_node = dst.partition(".")[0]
+        by_node.setdefault(src_node, []).append((src, dst))
+        if dst_node != src_node:
+            by_node.setdefault(dst_node, []).append((src, dst))
+    result = []
+    for item in _asList(args):
+        node_name, _, attr = item.partition(".")
+        node = scene.find(node_name)
+        path = node.fullPath()
+        for src, dst in by_node.get(path, []):
+            for mine, other, wanted in ((dst, src, source), (src, dst, destination)):
+                if not wanted:
+                    continue
+                mine_node, _, mine_attr = mine.partition(".")
+                if mine_node != path or (attr and mine_attr != attr):
+                    continue
+                other_node_name, _, other_attr = other.partition(".")
+                other_node = scene.find(other_node_name)
+                if not _typeMatches(other_node, type):
+                    continue
+                if not (plugs or shapes or sh) and other_node.isShape() and other_node.parent:
+                    # Transforms are listed instead of shapes
+                    other_node = other_node.parent
+                other_name = scene.shortestName(other_node)
+                if connections or c:
+                    result.append(scene.shortestName(node) + "." + mine_attr)
+                result.append(other_name + "." + other_attr if plugs else other_name)
+    return result or None
+
+
+def connectAttr(source, destination, force=False, f=False, **kwargs):
+    """Connect two plugs
+    """
+    _scene().connectAttr(source, destination)
+
+
+def disconnectAttr(source, destination, **kwargs):
+    """Disconnect two plugs
+    """
+    scene = _scene()
+    src_node, src_attr = source.split(".", 1)
+    dst_node, dst_attr = destination.split(".", 1)
+    src = scene.find(src_node).fullPath() + "." + src_attr
+    dst = scene.find(dst_node).fullPath() + "." + dst_attr
+    scene.connections = [ cn for cn in scene.connections if cn != (src, dst) ]
+
+
+def getAttr(plug, **kwargs):
+    """Get an attribute value. DAG nodes also provide worldMatrix, matrix and translate. The time flag is ignored (the scene is not animated)
+    """
+    node_name, _, attr = plug.partition(".")
+    node = _scene().find(node_name)
+    if attr in node.attrs:
+        return node.attrs[attr]
+    if node.isDag():
+        if attr == "worldMatrix":
+            return node.worldMatrix().ravel().tolist()
+        if attr == "matrix":
+            return node.matrix.ravel().tolist()
+        if attr == "translate":
+            return [ tuple(node.matrix[3, :3].tolist()) ]
+    raise ValueError("No object matches name: " + plug)
+
+
+def setAttr(plug, *values, type=None, **kwargs):
+    """Set an attribute value (a single value or a list of values)
+    """
+    node_name, _, attr = plug.partition(".")
+    node = _scene().find(node_name)
+    node.attrs[attr] = values[0] if len(values) == 1 else list(values)
+
+
+def nodeType(name, **kwargs):
+    """Get the type of a node
+    """
+    node = _scene().find(name, required=False)
+    if node is None:
+        raise RuntimeError("No object matches name: " + name)
+    return node.type
+
+
+def objExists(name):
+    """Check whether a node exists
+    """
+    return _scene().find(name, required=False) is not None
+
+
+def createNode(nodeType, name=None, n=None, parent=None, p=None, **kwargs):
+    """Create a node (optionally with a name and a parent)
+    """
+    return _scene().createNode(nodeType, name or n, parent or p).name
+
+
+def rename(old, new, **kwargs):
+    """Rename a node
+    """
+    scene = _scene()
+    return scene.rename(scene.find(old), new)
+
+
+def delete(*args, **kwargs):
+    """Delete nodes (and their descendants)
+    """
+    scene = _scene()
+    for name in _asList(args):
+        node = scene.find(name, required=False)
+        if node and node in scene.nodes:
+            scene.delete(node)
+
+
+def select(*args, replace=False, r=False, add=False, tgl=False, deselect=False, d=False, clear=False, cl=False, **kwargs):
+    """Change the selection (replace, add, toggle, deselect or clear)
+    """
+    scene = _scene()
+    items = _asList(args)
+    for i in items:
+        scene.find(i)
+    if clear or cl:
+        scene.selection = []
+    elif deselect or d:
+        scene.selection = [ i for i in scene.selection if i not in items ]
+    elif add or tgl:
+        scene.selection += [ i for i in items if i not in scene.selection ]
+    else:
+        scene.selection = items
+
+
+def _meshNodes(names):
+    """Mesh shapes of the given nodes (or the shapes themselves)
+    """
+    scene = _scene()
+    meshes = []
+    for name in _asList(names):
+        node = scene.find(name)
+        candidates = [ node ] + node.descendants()
+        meshes.extend(n for n in candidates if n.type == "mesh" and n.mesh is not None and n not in meshes)
+    return meshes
+
+
+def polyEvaluate(*args, vertex=False, v=False, edge=False, e=False, face=False, f=False, triangle=False, t=False,
+                 area=False, a=False, worldArea=False, wa=False, shell=False, s=False, uvcoord=False, uv=False, **kwargs):
+    """Count vertices, edges, faces, triangles, UVs and shells, or compute the (world) area of meshes. A single flag returns its value, several flags return a dictionary
+    """
+    meshes = _meshNodes(args if args else _scene().selection)
+    flags = { "vertex": vertex or v, "edge": edge or e, "face": face or f, "triangle": triangle or t,
+              "area": area or a, "worldArea": worldArea or wa, "shell": shell or s, "uvcoord": uvcoord or uv }
+    values = dict.fromkeys(flags, 0)
+    for node in meshes:
+        mesh = node.mesh
+        values["vertex"] += len(mesh.points)
+        values["face"] += len(mesh.counts)
+        values["triangle"] += int(np.maximum(mesh.counts - 2, 0).sum())
+        values["uvcoord"] += len(mesh.uvSet()[0])
+        if flags["edge"] or flags["shell"]:
+            edge_vertices = mesh.edges()[0]
+            values["edge"] += len(edge_vertices)
+            labels = fakescene.connectedComponents(len(mesh.points), edge_vertices[:, 0], edge_vertices[:, 1])
+            used = np.zeros(len(mesh.points), dtype=bool)
+            used[mesh.indices] = True
+            values["shell"] += len(np.unique(labels[used]))
+        if flags["area"]:
+            values["area"] += float(mesh.faceAreas().sum())
+        if flags["worldArea"]:
+            values["worldArea"] += float(mesh.faceAreas(node.worldMatrix()).sum())
+    requested = [ k for k in flags if flags[k] ]
+    if len(requested) == 1:
+        return values[requested[0]]
+    return { k: values[k] for k in requested }
+
+
+def exactWorldBoundingBox(*args, **kwargs):
+    """World space bounding box of meshes
+    """
+    bboxes = []
+    for node in _meshNodes(args if args else _scene().selection):
+        points = fakescene.transformPoints(node.mesh.points, node.worldMatrix())
+        if len(points):
+            bboxes.append(np.concatenate((points.min(axis=0), points.max(axis=0))))
+    if not bboxes:
+        return [ 0., 0., 0., 0., 0., 0. ]
+    bboxes = np.array(bboxes)
+    return np.concatenate((bboxes[:, :3].min(axis=0), bboxes[:, 3:].max(axis=0))).tolist()
+
+
+def objectCenter(name, **kwargs):
+    """Center of the bounding box of a mesh (pivot position for other DAG nodes)
+    """
+    node = _scene().find(name)
+    if _meshNodes([ name ]):
+        bbox = exactWorldBoundingBox(name)
+        return [ (bbox[i] + bbox[i + 3]) * .5 for i in range(3) ]
+    # Nodes without geometry (e.g. cameras): pivot position
+    if node.isShape() and node.parent:
+        node = node.parent
+    return node.worldMatrix()[3, :3].tolist()
+
+
+def lookThru(*args, **kwargs):
+    """Set or query the camera the viewport looks through
+    """
+    scene = _scene()
+    if not args:
+        return scene.currentCamera
+    node = scene.find(args[0])
+    if node.type == "transform":
+        node = next(c for c in node.children if c.type == "camera")
+    scene.currentCamera = node.name
+
+
+def file(*args, query=False, q=False, sceneName=False, sn=False, open=False, o=False, i=False, new=False, force=False, f=False, **kwargs):
+    """Scene files. Fake scenes are loaded from JSON scene descriptions or OBJ files
+    """
+    if query or q:
+        if sceneName or sn:
+            return _scene().sceneName
+        return None
+    if new:
+        fakescene.newScene()
+        return ""
+    if args and (open or o or i):
+        path = args[0]
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".json":
+            fakescene.loadJSON(path, new=not i)
+        elif ext == ".obj":
+            if not i:
+                fakescene.newScene()
+            fakescene.loadOBJ(path)
+        else:
+            raise RuntimeError("Unsupported scene format (fake maya): " + path)
+        if not i:
+            _scene().sceneName = path
+        return path
+    return None
+
+
+def workspace(*args, query=False, q=False, active=False, act=False, rootDirectory=False, rd=False, **kwargs):
+    """Set or query the active project
+    """
+    if query or q:
+        return _scene().workspace
+    if args:
+        _scene().workspace = args[0]
+
+
+def currentTime(*args, query=False, q=False, **kwargs):
+    """Current frame (the fake scene is not animated, attributes are the same at every frame)
+    """
+    if query or q:
+        return _scene().currentTime
+    if args:
+        _scene().currentTime = float(args[0])
+    return _scene().currentTime
+
+
+def playbackOptions(query=False, q=False, minTime=None, min=None, maxTime=None, max=None, **kwargs):
+    """Set or query the start (minTime) and end (maxTime) frames of the playback range
+    """
+    scene = _scene()
+    if query or q:
+        if minTime or min:
+            return scene.playbackRange[0]
+        if maxTime or max:
+            return scene.playbackRange[1]
+        return None
+    start = minTime if minTime is not None else min
+    end = maxTime if maxTime is not None else max
+    scene.playbackRange = (scene.playbackRange[0] if start is None else float(start), scene.playbackRange[1] if end is None else float(end))
@@ -0,0 +1,784 @@
+"""
+In-memory scene for the fake maya modules.
+
+The fake maya.cmds and maya.api.OpenMaya modules work on this scene: a
+graph of nodes (a dict of Node objects, with attributes and connections
+between plugs) where mesh shapes keep their data in NumPy arrays (same
+layout as MFnMesh.getVertices()/getAssignedUVs()).
+
+Scenes may be built from code (createNode, createMesh, connectAttr), loaded
+from OBJ files or from JSON scene descriptions:
+
+    {
+        "sceneName": "/path/to/scene.mb",
+        "workspace": "/path/to/project",
+        "nodes": [
+            { "name": "pCube1", "type": "transform", "matrix": [ 16 values ] },
+            { "name": "pCubeShape1", "type": "mesh", "parent": "pCube1", "obj": "cube.obj" },
+            { "name": "pConeShape1", "type": "mesh", "parent": "pCone1", "obj": "props.obj", "object": "cone" },
+            { "name": "pPlaneShape1", "type": "mesh", "parent": "pPlane1", "mesh": {
+                "faceVertexCounts": [ ... ], "faceVertexIndices": [ ... ], "points": [ [x, y, z], ... ],
+                "uvSets": { "map1": { "u": [ ... ], "v": [ ... ], "uvCounts": [ ... ], "uvIds": [ ... ] } } } },
+            { "name": "file1", "type": "file", "attrs": { "fileTextureName": "/path/to/texture.png" } }
+        ],
+        "connections": [ [ "file1.outColor", "lambert1.color" ] ],
+        "selection": [ "pCube1" ]
+    }
+
+Nodes are listed parents first. OBJ paths are relative to the JSON file
+("object" selects an object in OBJ files containing several ones).
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import re
+import json
+import threading
+import numpy as np
+
+
+dagNodeTypes = { "transform", "mesh", "camera", "joint", "locator" }
+"""Node types that live in the DAG (have a parent and a full path)
+"""
+
+shapeNodeTypes = { "mesh", "camera", "locator" }
+"""DAG node types that are shapes
+"""
+
+nodeDefaults = {
+    "transform": { "visibility": True },
+    "mesh": { "visibility": True, "intermediateObject": False },
+    "camera": { "focalLength": 35., "horizontalFilmAperture": 1.417, "verticalFilmAperture": .945,
+                "nearClipPlane": .1, "farClipPlane": 10000., "orthographic": False, "orthographicWidth": 30.,
+                "filmFit": 1, "renderable": True },
+    "file": { "fileTextureName": "", "colorSpace": "sRGB", "outSizeX": 0, "outSizeY": 0,
+              "fileHasAlpha": False, "alphaIsLuminance": False, "uvTilingMode": 0 },
+    "aiNormalMap": { "invertX": False, "invertY": False, "invertZ": False, "tangentSpace": True, "colorToSigned": True },
+    "resolution": { "width": 1920, "height": 1080 },
+}
+"""Default attribute values per node type (other attributes must be set explicitly)
+"""
+
+componentPattern = re.compile(r"^(?P<node>[^.]+)\.(?P<type>f|e|vtx|map)\[(?P<first>\d+)(:(?P<last>\d+))?\]$")
+"""Component strings (e.g. pCube1.f[2:5])
+"""
+
+
+def faceOffsets(counts):
+    """Offset of the first face vertex of each face
+
+    Args:
+        counts (int[]): Number of vertices of each face
+
+    Returns:
+        int[]: Offsets
+    """
+    offsets = np.zeros(len(counts), dtype=np.int64)
+    if len(counts) > 1:
+        np.cumsum(counts[:-1], out=offsets[1:])
+    return offsets
+
+
+def connectedComponents(num, a, b):
+    """Label the connected components of a graph (union-find with pointer jumping)
+
+    Args:
+        num (int): Number of nodes
+        a (int[]): First node of each link
+        b (int[]): Second node of each link
+
+    Returns:
+        int[]: Label of each node (the smallest node index in its component)
+    """
+    parent = np.arange(num, dtype=np.int64)
+    while len(a):
+        pa = parent[a]
+        pb = parent[b]
+        if np.array_equal(pa, pb):
+            break
+        root = np.minimum(pa, pb)
+        np.minimum.at(parent, pa, root)
+        np.minimum.at(parent, pb, root)
+        while True:
+            grand_parent = parent[parent]
+            if np.array_equal(grand_parent, parent):
+                break
+            parent = grand_parent
+    return parent
+
+
+def polygonAreas(points, counts, indices):
+    """Area of each polygon (fan triangulation)
+
+    Args:
+        points (float[][2 or 3]): Vertex positions
+        counts (int[]): Number of vertices of each face
+        indices (int[]): Vertex indices of each face (concatenated)
+
+    Returns:
+        float[]: Area of each face
+    """
+    areas = np.zeros(len(counts))
+    if not len(indices):
+        return areas
+    offsets = faceOffsets(counts)
+    face = np.repeat(np.arange(len(counts)), counts)
+    local = np.arange(len(indices)) - offsets[face]
+    # Triangles (first vertex, k, k + 1) of each face
+    tri = np.flatnonzero((local >= 1) & (local < counts[face] - 1))
+    p0 = points[indices[offsets[face[tri]]]]
+    e1 = points[indices[tri]] - p0
+    e2 = points[indices[tri + 1]] - p0
+    if points.shape[1] == 2:
+        tri_areas = np.abs(e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]) * .5
+    else:
+        tri_areas = np.linalg.norm(np.cross(e1, e2), axis=1) * .5
+    return np.bincount(face[tri], weights=tri_areas, minlength=len(counts))
+
+
+class MeshArrays():
+    """Mesh shape data (flat arrays)
+    """
+
+    def __init__(self, faceVertexCounts, faceVertexIndices, points):
+        """Constructor
+
+        Args:
+            faceVertexCounts (int[]): Number of vertices for each face
+            faceVertexIndices (int[]): Vertex indices for each face (concatenated)
+            points (float[][3]): Vertex positions (object space)
+        """
+        self.counts = np.asarray(faceVertexCounts, dtype=np.int64)
+        """Number of vertices for each face
+        """
+        self.indices = np.asarray(faceVertexIndices, dtype=np.int64)
+        """Vertex indices for each face (concatenated)
+        """
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        """Vertex positions (object space)
+        """
+        self.uvSets = dict()
+        """Map of UV set name to (u, v, uvCounts, uvIds)
+        """
+        self.currentUVSet = "map1"
+        """Current UV set name
+        """
+        self.setUVs([], [], None, None, "map1")
+        self._lock = threading.Lock()
+        self._edges = None
+
+    def setUVs(self, u, v, uvCounts=None, uvIds=None, uvSet=None):
+        """Set the UVs of a UV set (created if needed)
+
+        Args:
+            u (float[]): U coordinates
+            v (float[]): V coordinates
+            uvCounts (int[], optional): Number of UVs assigned to each face. Defaults to none.
+            uvIds (int[], optional): UV indices for each face vertex of the faces with UVs. Defaults to none.
+            uvSet (str, optional): UV set name. Defaults to the current UV set.
+        """
+        uv_counts = np.zeros(len(self.counts), dtype=np.int64) if uvCounts is None else np.asarray(uvCounts, dtype=np.int64)
+        uv_ids = np.zeros(0, dtype=np.int64) if uvIds is None else np.asarray(uvIds, dtype=np.int64)
+        self.uvSets[uvSet or self.currentUVSet] = (np.asarray(u, dtype=np.float64), np.asarray(v, dtype=np.float64), uv_counts, uv_ids)
+
+    def uvSet(self, name=None):
+        """Get the arrays of a UV set
+
+        Args:
+            name (str, optional): UV set name. Defaults to the current UV set.
+
+        Returns:
+            (float[], float[], int[], int[]): u, v, uvCounts, uvIds
+        """
+        name = name or self.currentUVSet
+        if name not in self.uvSets:
+            raise RuntimeError("(kInvalidParameter): UV set not found: " + name)
+        return self.uvSets[name]
+
+    def edges(self):
+        """Edge table, built on first use. Edges are numbered in order of
+        first appearance when walking the faces (as in meshes created with
+        MFnMesh.create)
+
+        Returns:
+            (int[][2], int[], int[], int[]): Vertices of each edge, edge of each face vertex,
+            edges of each vertex (CSR offsets and values)
+        """
+        with self._lock:
+            if self._edges is None:
+                self._edges = self._buildEdges()
+            return self._edges
+
+    def _buildEdges(self):
+        """Build the edge arrays (unique vertex pairs) and the edge of each face vertex
+        """
+        num_vertices = len(self.points)
+        offsets = faceOffsets(self.counts)
+        face = np.repeat(np.arange(len(self.counts)), self.counts)
+        local = np.arange(len(self.indices)) - offsets[face]
+        following = offsets[face] + (local + 1) % np.maximum(self.counts[face], 1)
+        a = self.indices
+        b = self.indices[following]
+        keys = np.minimum(a, b) * num_vertices + np.maximum(a, b)
+        unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        # Renumber by first appearance
+        order = np.argsort(first, kind="stable")
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        fv_edges = rank[inverse.ravel()]
+        edge_vertices = np.stack((a[first[order]], b[first[order]]), axis=1)
+        # Edges of each vertex
+        ends = edge_vertices.ravel()
+        by_vertex = np.argsort(ends, kind="stable")
+        vertex_edges = by_vertex // 2
+        vertex_offsets = np.concatenate(([0], np.cumsum(np.bincount(ends, minlength=num_vertices))))
+        return edge_vertices, fv_edges, vertex_offsets, vertex_edges
+
+    def faceAreas(self, matrix=None):
+        """Area of each face
+
+        Args:
+            matrix (float[4][4], optional): Transformation (row vectors). Defaults to object space.
+
+        Returns:
+            float[]: Face areas
+        """
+        return polygonAreas(transformPoints(self.points, matrix), self.counts, self.indices)
+
+    def faceUVAreas(self, uvSet=None):
+        """Area of each face in UV space (0 for faces without UVs)
+
+        Args:
+            uvSet (str, optional): UV set name. Defaults to the current UV set.
+
+        Returns:
+            float[]: Face UV areas
+        """
+        u, v, uv_counts, uv_ids = self.uvSet(uvSet)
+        areas = np.zeros(len(self.counts))
+        with_uvs = uv_counts > 0
+        if len(uv_ids):
+            areas[with_uvs] = polygonAreas(np.stack((u, v), axis=1), uv_counts[with_uvs], uv_ids)
+        return areas
+
+
+def transformPoints(points, matrix=None):
+    """Transform points (row vectors)
+
+    Args:
+        points (float[][3]): Points
+        matrix (float[4][4], optional): Transformation. Defaults to identity.
+
+    Returns:
+        float[][3]: Transformed points
+    """
+    if matrix is None:
+        return points
+    return points @ matrix[:3, :3] + matrix[3, :3]
+
+
+def lookAtMatrix(eye, target, up=(0., 1., 0.)):
+    """Transformation of a camera (looking down its -Z axis) placed at a
+    point and looking at another one
+
+    Args:
+        eye (float[3]): Camera position
+        target (float[3]): Point looked at
+        up (float[3], optional): Up direction. Defaults to Y.
+
+    Returns:
+        float[4][4]: Matrix (row vectors)
+    """
+    eye = np.asarray(eye, dtype=np.float64)
+    z = eye - np.asarray(target, dtype=np.float64)
+    z /= np.linalg.norm(z)
+    x = np.cross(up, z)
+    x /= np.linalg.norm(x)
+    y = np.cross(z, x)
+    m = np.identity(4)
+    m[0, :3] = x
+    m[1, :3] = y
+    m[2, :3] = z
+    m[3, :3] = eye
+    return m
+
+
+class Node():
+    """Scene node
+    """
+
+    def __init__(self, name, nodeType, parent=None):
+        """Constructor
+
+        Args:
+            name (str): Node name
+            nodeType (str): Node type
+            parent (Node, optional): Parent (DAG nodes only). Defaults to the world.
+        """
+        self.name = name
+        """Node name (short)
+        """
+        self.type = nodeType
+        """Node type
+        """
+        self.parent = parent
+        """Parent node (None for nodes under the world and for non DAG nodes)
+        """
+        self.children = []
+        """Child nodes
+        """
+        self.attrs = dict(nodeDefaults.get(nodeType, {}))
+        """Attribute values
+        """
+        self.matrix = np.identity(4)
+        """Local transformation (transforms only, row vectors)
+        """
+        self.mesh = None
+        """Mesh data (mesh shapes only)
+        """
+
+    def isDag(self):
+        """Check whether the node is a DAG node
+        """
+        return self.type in dagNodeTypes
+
+    def isShape(self):
+        """Check whether the node is a shape
+        """
+        return self.type in shapeNodeTypes
+
+    def fullPath(self):
+        """Full DAG path (or node name for non DAG nodes)
+
+        Returns:
+            str: Full path name
+        """
+        if not self.isDag():
+            return self.name
+        return (self.parent.fullPath() if self.parent else "") + "|" + self.name
+
+    def worldMatrix(self):
+        """Transformation from object to world space
+
+        Returns:
+            float[4][4]: Matrix (row vectors)
+        """
+        m = self.matrix
+        node = self.parent
+        while node:
+            m = m @ node.matrix
+            node = node.parent
+        return m
+
+    def descendants(self):
+        """All the nodes below this one (depth first)
+
+        Returns:
+            Node[]: Descendants
+        """
+        nodes = []
+        for c in self.children:
+            nodes.append(c)
+            nodes.extend(c.descendants())
+        return nodes
+
+
+class Scene():
+    """Node graph
+    """
+
+    def __init__(self):
+        self.nodes = []
+        """All the nodes (creation order)
+        """
+        self.byName = dict()
+        """Map of short name to nodes with that name
+        """
+        self.connections = []
+        """Connections (source plug, destination plug)
+        """
+        self.selection = []
+        """Selected items (node names or component strings)
+        """
+        self.sceneName = ""
+        """Path of the scene file
+        """
+        self.workspace = ""
+        """Path of the active project
+        """
+        self.currentCamera = "perspShape"
+        """Camera the viewport looks through
+        """
+        self.currentTime = 1.
+        """Current frame
+        """
+        self.playbackRange = (1., 120.)
+        """Start and end frames of the playback range
+        """
+        persp = self.createNode("transform", "persp")
+        persp.matrix = lookAtMatrix((28., 21., 28.), (0., 0., 0.))
+        self.createNode("camera", "perspShape", "persp")
+        self.createNode("resolution", "defaultResolution")
+        self.createNode("renderGlobals", "defaultRenderGlobals")
+        self.connectAttr("defaultResolution.message", "defaultRenderGlobals.resolution")
+
+    def uniqueName(self, name):
+        """Get a name not used by any node (appending a number if needed)
+
+        Args:
+            name (str): Desired name
+
+        Returns:
+            str: Unique name
+        """
+        if name not in self.byName:
+            return name
+        base = name.rstrip("0123456789")
+        i = 1
+        while base + str(i) in self.byName:
+            i += 1
+        return base + str(i)
+
+    def createNode(self, nodeType, name=None, parent=None):
+        """Create a node
+
+        Args:
+            nodeType (str): Node type
+            name (str, optional): Node name. Defaults to the node type followed by a number.
+            parent (str, optional): Parent node (DAG nodes). Defaults to the world.
+
+        Returns:
+            Node: New node
+        """
+        parent_node = self.find(parent) if parent else None
+        if nodeType in shapeNodeTypes and parent_node is None:
+            # Shapes always live under a transform
+            parent_node = self.createNode("transform", (name or nodeType) + "Transform1")
+        if name is None:
+            name = self.uniqueName(nodeType + "1")
+        elif parent_node is None or any(c.name == name for c in parent_node.children):
+            # Names must be unique among siblings (DAG nodes) or in the scene (other nodes)
+            name = self.uniqueName(name)
+        node = Node(name, nodeType, parent_node)
+        if parent_node:
+            parent_node.children.append(node)
+        self.nodes.append(node)
+        self.byName.setdefault(name, []).append(node)
+        return node
+
+    def createMesh(self, name, faceVertexCounts, faceVertexIndices, points, u=None, v=None, uvCounts=None, uvIds=None, parent=None):
+        """Create a mesh (a transform and its mesh shape)
+
+        Args:
+            name (str): Transform name (the shape gets the same name with "Shape" suffix)
+            faceVertexCounts (int[]): Number of vertices for each face
+            faceVertexIndices (int[]): Vertex indices for each face (concatenated)
+            points (float[][3]): Vertex positions
+            u (float[], optional): U coordinates (map1). Defaults to no UVs.
+            v (float[], optional): V coordinates (map1). Defaults to no UVs.
+            uvCounts (int[], optional): Number of UVs assigned to each face. Defaults to no UVs.
+            uvIds (int[], optional): UV indices for each face vertex (concatenated). Defaults to no UVs.
+            parent (str, optional): Parent of the transform. Defaults to the world.
+
+        Returns:
+            Node: Mesh shape node
+        """
+        transform = self.createNode("transform", name, parent)
+        shape = self.createNode("mesh", self.uniqueName(transform.name + "Shape"), transform.fullPath())
+        shape.mesh = MeshArrays(faceVertexCounts, faceVertexIndices, points)
+        if u is not None:
+            shape.mesh.setUVs(u, v, uvCounts, uvIds)
+        return shape
+
+    def find(self, name, required=True):
+        """Find a node by name (short name, partial or full DAG path).
+        Component and attribute suffixes are ignored
+
+        Args:
+            name (str): Node name
+            required (bool, optional): Raise an error if not found. Defaults to True.
+
+        Returns:
+            Node: Node (None if not found and not required)
+        """
+        if isinstance(name, Node):
+            return name
+        name = name.split(".")[0]
+        short = name.split("|")[-1]
+        matches = self.byName.get(short, [])
+        if "|" in name:
+            if name.startswith("|"):
+                matches = [ n for n in matches if n.fullPath() == name ]
+            else:
+                matches = [ n for n in matches if n.fullPath().endswith("|" + name) ]
+        if len(matches) == 1:
+            return matches[0]
+        if required:
+            if matches:
+                raise ValueError("More than one object matches name: " + name)
+            raise ValueError("No object matches name: " + name)
+        return None
+
+    def shortestName(self, node):
+        """Shortest unique name of a node (as returned by cmds.ls)
+
+        Args:
+            node (Node): Node
+
+        Returns:
+            str: Node name
+        """
+        if len(self.byName[node.name]) == 1:
+            return node.name
+        return node.fullPath()
+
+    def rename(self, node, newName):
+        """Rename a node
+
+        Args:
+            node (Node): Node
+            newName (str): New name
+
+        Returns:
+            str: Actual new name (unique)
+        """
+        old_path = node.fullPath()
+        self.byName[node.name].remove(node)
+        if not self.byName[node.name]:
+            del self.byName[node.name]
+        node.name = self.uniqueName(newName)
+        self.byName.setdefault(node.name, []).append(node)
+        new_path = node.fullPath()
+        self.connections = [ (_renamePlug(s, old_path, new_path), _renamePlug(d, old_path, new_path)) for s, d in self.connections ]
+        return node.name
+
+    def delete(self, node):
+        """Delete a node (and its descendants)
+
+        Args:
+            node (Node): Node
+        """
+        for c in list(node.children):
+            self.delete(c)
+        if node.parent:
+            node.parent.children.remove(node)
+        path = node.fullPath()
+        self.connections = [ (s, d) for s, d in self.connections if s.split(".")[0] != path and d.split(".")[0] != path ]
+        self.selection = [ s for s in self.selection if self.find(s, required=False) is not node ]
+        self.nodes.remove(node)
+        self.byName[node.name].remove(node)
+        if not self.byName[node.name]:
+            del self.byName[node.name]
+
+    def connectAttr(self, source, destination):
+        """Connect two plugs
+
+        Args:
+            source (str): Source plug (node.attribute)
+            destination (str): Destination plug (node.attribute)
+        """
+        src_node, src_attr = source.split(".", 1)
+        dst_node, dst_attr = destination.split(".", 1)
+        src = self.find(src_node).fullPath() + "." + src_attr
+        dst = self.find(dst_node).fullPath() + "." + dst_attr
+        # Inputs have a single connection
+        self.connections = [ c for c in self.connections if c[1] != dst ]
+        self.connections.append((src, dst))
+
+    def assemblies(self):
+        """DAG nodes directly under the world
+
+        Returns:
+            Node[]: Root DAG nodes
+        """
+        return [ n for n in self.nodes if n.isDag() and n.parent is None ]
+
+
+def _renamePlug(plug, oldPath, newPath):
+    """Replace the node path of a plug (after renaming or reparenting the node)
+    """
+    node, _, attr = plug.partition(".")
+    if node == oldPath:
+        node = newPath
+    elif node.startswith(oldPath + "|"):
+        node = newPath + node[len(oldPath):]
+    return node + "." + attr if attr else node
+
+
+scene = Scene()
+"""Current scene
+"""
+
+
+def newScene():
+    """Replace the current scene with an empty one
+
+    Returns:
+        Scene: New scene
+    """
+    global scene
+    scene = Scene()
+    return scene
+
+
+def currentScene():
+    """Get the current scene
+
+    Returns:
+        Scene: Current scene
+    """
+    return scene
+
+
+def readOBJ(path):
+    """Read the objects of an OBJ file (positions, texture coordinates and faces)
+
+    Args:
+        path (str): OBJ file path
+
+    Returns:
+        (str, int[], int[], float[][3], float[][2], int[], int[])[]: Name, face vertex counts, face vertex indices,
+        points, UVs, UV counts and UV ids of each object (indices local to the object)
+    """
+    positions = []
+    tex_coords = []
+    objects = []
+    name = os.path.splitext(os.path.basename(path))[0]
+    counts = []
+    vertex_ids = []
+    uv_counts = []
+    uv_ids = []
+
+    def flush():
+        if counts:
+            objects.append((name, counts, vertex_ids, uv_counts, uv_ids))
+
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if not fields:
+                continue
+            key = fields[0]
+            if key == "v":
+                positions.append((float(fields[1]), float(fields[2]), float(fields[3])))
+            elif key == "vt":
+                tex_coords.append((float(fields[1]), float(fields[2]) if len(fields) > 2 else 0.))
+            elif key == "f":
+                refs = [ r.split("/") for r in fields[1:] ]
+                counts.append(len(refs))
+                for r in refs:
+                    vi = int(r[0])
+                    vertex_ids.append(vi - 1 if vi > 0 else len(positions) + vi)
+                if all(len(r) > 1 and r[1] for r in refs):
+                    uv_counts.append(len(refs))
+                    for r in refs:
+                        ti = int(r[1])
+                        uv_ids.append(ti - 1 if ti > 0 else len(tex_coords) + ti)
+                else:
+                    uv_counts.append(0)
+            elif key == "o":
+                flush()
+                name = fields[1] if len(fields) > 1 else name
+                counts, vertex_ids, uv_counts, uv_ids = [], [], [], []
+    flush()
+
+    positions = np.array(positions, dtype=np.float64).reshape(-1, 3)
+    tex_coords = np.array(tex_coords, dtype=np.float64).reshape(-1, 2)
+    result = []
+    for name, counts, vertex_ids, uv_counts, uv_ids in objects:
+        # OBJ indices are global to the file. Keep only the elements used by the object
+        used_vertices, local_ids = np.unique(np.array(vertex_ids, dtype=np.int64), return_inverse=True)
+        used_uvs, local_uv_ids = np.unique(np.array(uv_ids, dtype=np.int64), return_inverse=True)
+        result.append((name, np.array(counts, dtype=np.int64), local_ids.ravel(), positions[used_vertices],
+                       tex_coords[used_uvs], np.array(uv_counts, dtype=np.int64), local_uv_ids.ravel()))
+    return result
+
+
+def loadOBJ(path, name=None, parent=None):
+    """Load the objects of an OBJ file as meshes in the current scene
+
+    Args:
+        path (str): OBJ file path
+        name (str, optional): Transform name (files with a single object). Defaults to the object name in the file.
+        parent (str, optional): Parent of the new transforms. Defaults to the world.
+
+    Returns:
+        str[]: Full path names of the mesh shapes
+    """
+    shapes = []
+    objects = readOBJ(path)
+    for obj_name, counts, indices, points, uvs, uv_counts, uv_ids in objects:
+        if name and len(objects) == 1:
+            obj_name = name
+        shape = scene.createMesh(obj_name, counts, indices, points, uvs[:, 0], uvs[:, 1], uv_counts, uv_ids, parent)
+        shapes.append(shape.fullPath())
+    return shapes
+
+
+def loadJSON(path, new=True):
+    """Load a JSON scene description (see module documentation)
+
+    Args:
+        path (str): JSON file path
+        new (bool, optional): Start a new scene (otherwise the nodes are added to the current one). Defaults to True.
+
+    Returns:
+        Scene: Current scene
+    """
+    with open(path) as f:
+        desc = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(path))
+    if new:
+        newScene()
+    scene.sceneName = desc.get("sceneName", scene.sceneName)
+    scene.workspace = desc.get("workspace", scene.workspace)
+
+    for nd in desc.get("nodes", []):
+        node_type = nd.get("type", "transform")
+        if node_type == "mesh" and "obj" in nd:
+            objects = readOBJ(os.path.join(base_dir, nd["obj"]))
+            if "object" in nd:
+                objects = [ o for o in objects if o[0] == nd["object"] ]
+            if len(objects) != 1:
+                raise ValueError("OBJ file of a mesh node must contain a single object (or select one): " + nd["obj"])
+            _, counts, indices, points, uvs, uv_counts, uv_ids = objects[0]
+            node = scene.createNode("mesh", nd.get("name"), nd.get("parent"))
+            node.mesh = MeshArrays(counts, indices, points)
+            node.mesh.setUVs(uvs[:, 0], uvs[:, 1], uv_counts, uv_ids)
+        elif node_type == "mesh":
+            m = nd.get("mesh", {})
+            node = scene.createNode("mesh", nd.get("name"), nd.get("parent"))
+            node.mesh = MeshArrays(m.get("faceVertexCounts", []), m.get("faceVertexIndices", []), m.get("points", []))
+            for uv_set, uvs in m.get("uvSets", {}).items():
+                node.mesh.setUVs(uvs.get("u", []), uvs.get("v", []), uvs.get("uvCounts"), uvs.get("uvIds"), uv_set)
+            if "currentUVSet" in m:
+                node.mesh.currentUVSet = m["currentUVSet"]
+        else:
+            existing = scene.find(nd["name"], required=False) if "name" in nd and node_type not in dagNodeTypes else None
+            node = existing or scene.createNode(node_type, nd.get("name"), nd.get("parent"))
+        if "matrix" in nd:
+            node.matrix = np.array(nd["matrix"], dtype=np.float64).reshape(4, 4)
+        elif "translate" in nd:
+            node.matrix[3, :3] = nd["translate"]
+        node.attrs.update(nd.get("attrs", {}))
+
+    for source, destination in desc.get("connections", []):
+        scene.connectAttr(source, destination)
+    scene.selection = list(desc.get("selection", []))
+    return scene
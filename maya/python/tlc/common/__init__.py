@@ -6,3 +6,4 @@ from . import qtutils
 from . import conditionchecker
 from . import naming
 from . import pipeline
+from . import tracing
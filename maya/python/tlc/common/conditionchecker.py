@@ -23,6 +23,7 @@ this program. If not, see <https://www.gnu.org/licenses/>.
 """
 
 from enum import Enum
+import numpy as np
 import maya.cmds as cmds
 
 
@@ -58,6 +59,99 @@ class ConditionErrorCriteria(Enum):
     """A warning will be flagged when counter is not one
     """
 
+def buildComponentRanges(indices):
+    """Compact a list of component indices into Maya index ranges
+
+    Args:
+        indices (int[]): Component indices (in any order, duplicates allowed)
+
+    Returns:
+        str[]: Index ranges ("10:250" or "12" for single elements)
+    """
+    ids = np.unique(np.asarray(indices, dtype=np.int64))
+    if not len(ids):
+        return []
+    # Split where consecutive indices are not contiguous
+    breaks = np.flatnonzero(np.diff(ids) != 1)
+    starts = ids[np.concatenate(([0], breaks + 1))].tolist()
+    ends = ids[np.concatenate((breaks, [len(ids) - 1]))].tolist()
+    return [ str(a) if a == b else str(a) + ":" + str(b) for a, b in zip(starts, ends) ]
+
+
+class ComponentStore():
+    """Compact storage of mesh components
+
+    Component indices are kept as integer buffers grouped by DAG path and
+    component type ("f", "e", "vtx", ...). Component names are only built
+    (as compact Maya ranges, e.g. "|grp|mesh.f[10:250]") when requested
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+        self.components = dict()
+        """Dictionary/map of index buffers (using DAG path as key and a dictionary by component type as value)
+        """
+
+    def reset(self):
+        """Remove all components
+        """
+        self.components = dict()
+
+    def add(self, path, compType, indices):
+        """Add components
+
+        Args:
+            path (str): DAG path (full path name) of the mesh
+            compType (str): Component type ("f", "e", "vtx", ...)
+            indices (int[]): Component indices (array('i'), NumPy array or any integer sequence)
+        """
+        if not len(indices):
+            return
+        buffers = self.components.setdefault(path, dict()).setdefault(compType, [])
+        buffers.append(np.asarray(indices, dtype=np.int32))
+
+    def getIndices(self, path, compType):
+        """Get the indices for a mesh and component type
+
+        Args:
+            path (str): DAG path (full path name) of the mesh
+            compType (str): Component type ("f", "e", "vtx", ...)
+
+        Returns:
+            int[]: Sorted component indices (without duplicates)
+        """
+        buffers = self.components.get(path, dict()).get(compType)
+        if not buffers:
+            return np.zeros(0, dtype=np.int32)
+        return np.unique(np.concatenate(buffers))
+
+    def count(self):
+        """Number of different components stored
+
+        Returns:
+            int: Number of components
+        """
+        num = 0
+        for path in self.components:
+            for comp_type in self.components[path]:
+                num += len(self.getIndices(path, comp_type))
+        return num
+
+    def toStrings(self):
+        """Build component names as compact Maya ranges
+
+        Returns:
+            str[]: Component names (e.g. "|grp|mesh.f[10:250]")
+        """
+        names = []
+        for path in self.components:
+            for comp_type in self.components[path]:
+                for r in buildComponentRanges(np.concatenate(self.components[path][comp_type])):
+                    names.append(path + "." + comp_type + "[" + r + "]")
+        return names
+
+
 class ConditionChecker():
     """Class ConditionChecker
     """
@@ -94,7 +188,10 @@ class ConditionChecker():
         """Error level
         """
         self.elms = []
-        """List of elements matching the condition
+        """List of elements matching the condition (node or component names)
+        """
+        self.components = ComponentStore()
+        """Mesh components matching the condition (stored as indices)
         """
 
     def reset(self):
@@ -103,11 +200,31 @@ class ConditionChecker():
         self.count = 0
         self.errorLevel = ConditionErrorLevel.NONE
         self.elms = []
+        self.components.reset()
+
+    def addComponents(self, path, compType, indices):
+        """Add mesh components matching the condition
+
+        Args:
+            path (str): DAG path (full path name) of the mesh
+            compType (str): Component type ("f", "e", "vtx", ...)
+            indices (int[]): Component indices
+        """
+        self.components.add(path, compType, indices)
+
+    def getElements(self):
+        """Get the names of all the elements matching the condition. Mesh
+        components are returned as compact ranges (e.g. "|grp|mesh.f[10:250]")
+
+        Returns:
+            str[]: List of element names
+        """
+        return self.elms + self.components.toStrings()
 
     def select(self):
         """Select components that matched the condition
         """
-        cmds.select(self.elms)
+        cmds.select(self.getElements())
     
     def setErrorLevel(self, crit):
         """Set error level following the criteria supplied
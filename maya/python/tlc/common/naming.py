@@ -35,7 +35,8 @@ DCCProjTopDirs={
     "ASSETS":"assets",
     "SCENES":"scenes",
     "SOURCEIMAGES":"sourceimages",
-    "IMAGES":"images"
+    "IMAGES":"images",
+    "CACHE":"cache"
 }
 """Top directories inside DCC project
 """
@@ -0,0 +1,241 @@
+"""
+Logging and tracing utilities.
+
+Diagnostic output of the tools goes through the standard logging module,
+under the "tlc" logger. Only warnings and errors are printed to the console
+(Script Editor) by default, so scans are not bound by the output of the
+debug events and timings. Those can be sent to the console and/or to a
+JSON-lines file (one JSON object per record, including the data and the
+timings of the checks) for later analysis.
+
+Setting the TLC_TRACE environment variable to a file path enables the
+JSON-lines output when the module is imported.
+
+Usage:
+
+    import tlc.common.tracing as tracing
+    tracing.enableJSONLines("C:/tmp/tlc_trace.jsonl")
+    ...
+    tracing.disable()
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import contextlib
+
+
+rootLoggerName = "tlc"
+
+_root = logging.getLogger(rootLoggerName)
+# Records are not propagated to Maya's handlers
+_root.propagate = False
+_root.setLevel(logging.WARNING)
+
+_handlers = []
+
+
+def getLogger(name):
+    """Get the logger of a module
+
+    Args:
+        name (str): Module name (__name__). Loggers outside the "tlc" hierarchy are moved under it
+
+    Returns:
+        logging.Logger: Logger
+    """
+    if name != rootLoggerName and not name.startswith(rootLoggerName + "."):
+        name = rootLoggerName + "." + name
+    return logging.getLogger(name)
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """Format log records as single line JSON objects
+
+    The record fields are the time (seconds since epoch), level, logger,
+    message and the data passed to event/timer (if any).
+    """
+
+    def format(self, record):
+        entry = {
+            "time": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        data = getattr(record, "data", None)
+        if data:
+            entry.update(data)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Human readable format, appending the data of the record
+    """
+
+    def format(self, record):
+        text = "[" + record.name + "] "
+        if record.levelno >= logging.WARNING:
+            text += record.levelname.capitalize() + ": "
+        text += record.getMessage()
+        data = getattr(record, "data", None)
+        if data:
+            text += " " + " ".join(k + "=" + str(v) for k, v in data.items())
+        return text
+
+
+# Warnings and errors are printed by default
+_defaultHandler = logging.StreamHandler(sys.stdout)
+_defaultHandler.set_name(rootLoggerName + ".default")
+_defaultHandler.setFormatter(ConsoleFormatter())
+_defaultHandler.setLevel(logging.WARNING)
+for h in list(_root.handlers):
+    # Reloaded module
+    if h.get_name() == _defaultHandler.get_name() or isinstance(h, logging.NullHandler):
+        _root.removeHandler(h)
+_root.addHandler(_defaultHandler)
+
+
+def _updateHandlers():
+    # The default console handler is replaced by the one added by enableConsole (so warnings are not printed twice)
+    console = any(isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler) for h in _handlers)
+    if console:
+        _root.removeHandler(_defaultHandler)
+    elif _defaultHandler not in _root.handlers:
+        _root.addHandler(_defaultHandler)
+    _root.setLevel(min([ h.level for h in _handlers ] + [ logging.WARNING ]))
+
+
+def _addHandler(handler, level):
+    handler.setLevel(level)
+    _root.addHandler(handler)
+    _handlers.append(handler)
+    _updateHandlers()
+    return handler
+
+
+def enableConsole(level=logging.DEBUG):
+    """Send the diagnostic output to the console (Script Editor)
+
+    Args:
+        level (int, optional): Minimum level of the records. Defaults to logging.DEBUG.
+
+    Returns:
+        logging.Handler: Added handler (can be removed with disable)
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(ConsoleFormatter())
+    return _addHandler(handler, level)
+
+
+def enableJSONLines(path, level=logging.DEBUG):
+    """Write the diagnostic output to a JSON-lines file (records are appended)
+
+    Args:
+        path (str): Output file path
+        level (int, optional): Minimum level of the records. Defaults to logging.DEBUG.
+
+    Returns:
+        logging.Handler: Added handler (can be removed with disable)
+    """
+    handler = logging.FileHandler(path, mode="a", encoding="utf-8")
+    handler.setFormatter(JSONLinesFormatter())
+    return _addHandler(handler, level)
+
+
+def disable(handler=None):
+    """Remove a handler added by enableConsole/enableJSONLines (all of them by default)
+
+    Args:
+        handler (logging.Handler, optional): Handler to remove. Defaults to None (all).
+    """
+    for h in ([ handler ] if handler else list(_handlers)):
+        if h not in _handlers:
+            continue
+        _root.removeHandler(h)
+        _handlers.remove(h)
+        h.close()
+    _updateHandlers()
+
+
+def event(logger, message, level=logging.DEBUG, **data):
+    """Log a structured record (message plus data fields)
+
+    Args:
+        logger (logging.Logger): Logger
+        message (str): Event name/message
+        level (int, optional): Record level. Defaults to logging.DEBUG.
+        data: Data fields of the record
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, message, extra={ "data": data })
+
+
+@contextlib.contextmanager
+def timer(logger, name, level=logging.DEBUG, **data):
+    """Context manager logging the time spent in a block of code (as "time_ms")
+
+    Nothing is measured when the logger is not enabled for the level.
+
+    Args:
+        logger (logging.Logger): Logger
+        name (str): Name of the timed block (e.g. check name)
+        level (int, optional): Record level. Defaults to logging.DEBUG.
+        data: Additional data fields of the record
+    """
+    if not logger.isEnabledFor(level):
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        data["time_ms"] = round((time.perf_counter() - start) * 1000., 3)
+        logger.log(level, name, extra={ "data": data })
+
+
+def timed(logger, name, func, level=logging.DEBUG, **data):
+    """Wrap a function to log the time spent in each call (see timer)
+
+    Args:
+        logger (logging.Logger): Logger
+        name (str): Name of the timed function (e.g. check name)
+        func (function): Function to wrap
+        level (int, optional): Record level. Defaults to logging.DEBUG.
+        data: Additional data fields of the records
+
+    Returns:
+        function: The wrapped function (or func itself when the logger is not enabled)
+    """
+    if not logger.isEnabledFor(level):
+        return func
+
+    def wrapper(*args, **kwargs):
+        with timer(logger, name, level, **data):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+if os.environ.get("TLC_TRACE"):
+    enableJSONLines(os.environ["TLC_TRACE"])
@@ -1,4 +1,7 @@
 """Modeling Tools
 """
+from . import meshanalysis
+from . import uvoverlap
+from . import meshtopology
 from . import meshcheck
 from . import meshcheck_ui
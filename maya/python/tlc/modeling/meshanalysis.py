@@ -0,0 +1,834 @@
+"""
+Vectorized mesh analysis.
+
+This module contains the array-based (NumPy) implementation of the mesh
+checks. It works on plain arrays extracted once per mesh, so it does not
+depend on Maya and can be used (and tested) outside of it.
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import numpy as np
+
+
+minUVArea = 1e-8
+"""Faces with an area in UV space below this value are considered zero area
+"""
+
+zeroAreaThreshold = 0.
+"""Faces with an area (object space) below or equal to this value are
+considered zero area and skipped from texel density computation
+"""
+
+defaultDegenerateTolerance = 1e-6
+"""Distance (object space) below which vertices are considered in the same
+position and faces are considered zero area (width below this value)
+"""
+
+defaultSliverAspectRatio = 100.
+"""Faces with an aspect ratio (longest edge divided by width, the height of
+the face over its longest edge) above this value are considered slivers
+"""
+
+
+class MeshData():
+    """Mesh data as flat arrays
+
+    This is the information pulled from a mesh (MFnMesh) in a single pass,
+    following the same layout as MFnMesh.getVertices()/getAssignedUVs().
+    Only the arrays needed by the checks may be pulled, the rest are left
+    empty
+    """
+
+    def __init__(self, faceVertexCounts, faceVertexIndices, points, worldPoints=None, u=None, v=None, uvCounts=None, uvIds=None, numVertices=None):
+        """Constructor
+
+        Args:
+            faceVertexCounts (int[]): Number of vertices for each face
+            faceVertexIndices (int[]): Vertex indices for each face (concatenated)
+            points (float[][3]): Vertex positions (object space)
+            worldPoints (float[][3], optional): Vertex positions (world space). Defaults to points.
+            u (float[], optional): U coordinates of the UV set. Defaults to no UVs.
+            v (float[], optional): V coordinates of the UV set. Defaults to no UVs.
+            uvCounts (int[], optional): Number of UVs assigned to each face (0 or number of vertices). Defaults to no UVs.
+            uvIds (int[], optional): UV indices for each face vertex (concatenated, only faces with UVs). Defaults to no UVs.
+            numVertices (int, optional): Number of vertices in the mesh. Defaults to the number of points.
+        """
+        self.faceVertexCounts = np.asarray(faceVertexCounts, dtype=np.int64)
+        """Number of vertices for each face
+        """
+        self.faceVertexIndices = np.asarray(faceVertexIndices, dtype=np.int64)
+        """Vertex indices for each face (concatenated)
+        """
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        """Vertex positions in object space (N x 3)
+        """
+        if worldPoints is None:
+            self.worldPoints = self.points
+        else:
+            self.worldPoints = np.asarray(worldPoints, dtype=np.float64).reshape(-1, 3)
+        """Vertex positions in world space (N x 3)
+        """
+        self.u = np.asarray(u if u is not None else [], dtype=np.float64)
+        """U coordinates
+        """
+        self.v = np.asarray(v if v is not None else [], dtype=np.float64)
+        """V coordinates
+        """
+        if uvCounts is None:
+            self.uvCounts = np.zeros(len(self.faceVertexCounts), dtype=np.int64)
+        else:
+            self.uvCounts = np.asarray(uvCounts, dtype=np.int64)
+        """Number of UVs assigned to each face
+        """
+        self.uvIds = np.asarray(uvIds if uvIds is not None else [], dtype=np.int64)
+        """UV indices for each face vertex of the faces with UVs
+        """
+        self.numVertices = numVertices if numVertices is not None else len(self.points)
+        """Number of vertices in the mesh (even if points were not pulled)
+        """
+
+    def numFaces(self):
+        """Number of faces
+
+        Returns:
+            int: Number of faces in the mesh
+        """
+        return len(self.faceVertexCounts)
+
+    def faceOffsets(self):
+        """Offset of the first face vertex of each face
+
+        Returns:
+            int[]: Offsets into faceVertexIndices
+        """
+        return faceOffsets(self.faceVertexCounts)
+
+    def fingerprint(self, *extra):
+        """Compute a fingerprint of the mesh contents (topology, points in
+        object and world space and UVs). Meshes with the same fingerprint
+        give the same analysis results
+
+        Args:
+            *extra: Other values affecting the analysis (hashed by their string representation)
+
+        Returns:
+            str: Fingerprint (hexadecimal digest)
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for a in (self.faceVertexCounts, self.faceVertexIndices, self.points, self.worldPoints, self.u, self.v, self.uvCounts, self.uvIds):
+            h.update(np.ascontiguousarray(a).data)
+            # Length is also hashed so different splits of the same bytes do not collide
+            h.update(str(a.shape).encode())
+        for e in extra:
+            h.update(str(e).encode())
+        return h.hexdigest()
+
+    def topologyFingerprint(self):
+        """Compute a fingerprint of the topology of the mesh only (face vertex
+        counts and indices), for data that does not depend on the positions
+
+        Returns:
+            str: Fingerprint (hexadecimal digest)
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for a in (self.faceVertexCounts, self.faceVertexIndices):
+            h.update(np.ascontiguousarray(a).data)
+            h.update(str(a.shape).encode())
+        return h.hexdigest()
+
+    def worldBoundingBox(self):
+        """World space bounding box of the mesh points
+
+        Returns:
+            float[6]: xmin, ymin, zmin, xmax, ymax, zmax (None if the mesh has no points)
+        """
+        if not len(self.worldPoints):
+            return None
+        return np.concatenate((self.worldPoints.min(axis=0), self.worldPoints.max(axis=0)))
+
+
+class RunningStats():
+    """Mergeable statistics (count, mean, variance, min and max) of a
+    sequence of values
+
+    Partial statistics computed separately (e.g. one per mesh) can be merged
+    in any order, without keeping the values in memory
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+        self.count = 0
+        """Number of values
+        """
+        self.mean = 0.
+        """Mean of the values
+        """
+        self.m2 = 0.
+        """Sum of squared differences from the mean
+        """
+        self.min = float("inf")
+        """Minimum value
+        """
+        self.max = -float("inf")
+        """Maximum value
+        """
+
+    def addValues(self, values):
+        """Add an array of values
+
+        Args:
+            values (float[]): Values to add
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        other = RunningStats()
+        other.count = len(values)
+        other.mean = float(np.mean(values))
+        other.m2 = float(np.sum((values - other.mean)**2))
+        other.min = float(np.min(values))
+        other.max = float(np.max(values))
+        self.merge(other)
+
+    def merge(self, other):
+        """Merge the statistics of another set of values (parallel algorithm by Chan et al.)
+
+        Args:
+            other (RunningStats): Statistics to merge into this object
+
+        Returns:
+            RunningStats: This object (merged)
+        """
+        if not other.count:
+            return self
+        if not self.count:
+            self.count = other.count
+            self.mean = other.mean
+            self.m2 = other.m2
+            self.min = other.min
+            self.max = other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def variance(self):
+        """Population variance of the values
+
+        Returns:
+            float: Variance (0 if there are no values)
+        """
+        if not self.count:
+            return 0.
+        return self.m2 / self.count
+
+    def stdDev(self):
+        """Standard deviation of the values
+
+        Returns:
+            float: Standard deviation (0 if there are no values)
+        """
+        return self.variance()**0.5
+
+
+class LogHistogram():
+    """Mergeable weighted histogram with logarithmic bins
+
+    Bins have the same width in log scale (a fixed number of bins per
+    decade) between minValue and maxValue. Values out of that range are
+    accumulated in the first/last bin. Memory usage is constant, no matter
+    the number of values added, and percentiles are estimated from the bins
+    (relative error bounded by the width of a bin)
+    """
+
+    minValue = 1e-12
+    """Lower limit of the histogram range (normalized texel densities of small faces go well below 1e-6)
+    """
+    maxValue = 1e6
+    """Upper limit of the histogram range
+    """
+    binsPerDecade = 32
+    """Number of bins for every power of 10
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+        self.logMin = np.log10(self.minValue)
+        self.numBins = int(round((np.log10(self.maxValue) - self.logMin) * self.binsPerDecade))
+        self.weights = np.zeros(self.numBins, dtype=np.float64)
+        """Accumulated weight in each bin
+        """
+        self.min = float("inf")
+        """Minimum value added
+        """
+        self.max = -float("inf")
+        """Maximum value added
+        """
+
+    def totalWeight(self):
+        """Sum of the weights of all the values
+
+        Returns:
+            float: Total weight
+        """
+        return float(np.sum(self.weights))
+
+    def binEdges(self):
+        """Limits of the bins
+
+        Returns:
+            float[]: numBins+1 bin edges
+        """
+        return 10.**(self.logMin + np.arange(self.numBins + 1) / self.binsPerDecade)
+
+    def addValues(self, values, weights=None):
+        """Add an array of values
+
+        Args:
+            values (float[]): Values to add (non positive values are accumulated in the first bin)
+            weights (float[], optional): Weight of each value. Defaults to 1 for all the values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        if weights is None:
+            weights = np.ones(len(values))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bins = np.floor((np.log10(values) - self.logMin) * self.binsPerDecade)
+        bins = np.clip(np.nan_to_num(bins, nan=0., neginf=0.), 0, self.numBins - 1).astype(np.int64)
+        self.weights += np.bincount(bins, weights=weights, minlength=self.numBins)
+        self.min = min(self.min, float(np.min(values)))
+        self.max = max(self.max, float(np.max(values)))
+
+    def merge(self, other):
+        """Merge the histogram of another set of values
+
+        Args:
+            other (LogHistogram): Histogram to merge into this object
+
+        Returns:
+            LogHistogram: This object (merged)
+        """
+        self.weights += other.weights
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentile(self, p):
+        """Estimate a (weighted) percentile of the values. Values are
+        interpolated inside the bin in log scale
+
+        Args:
+            p (float): Percentile (0-100)
+
+        Returns:
+            float: Estimated value (0 if there are no values)
+        """
+        total = self.totalWeight()
+        if total <= 0.:
+            return 0.
+        cumulative = np.cumsum(self.weights)
+        target = total * min(max(p, 0.), 100.) / 100.
+        b = min(int(np.searchsorted(cumulative, target, side="left")), self.numBins - 1)
+        before = cumulative[b - 1] if b > 0 else 0.
+        fraction = (target - before) / self.weights[b] if self.weights[b] > 0. else 0.
+        value = 10.**(self.logMin + (b + fraction) / self.binsPerDecade)
+        # The estimation never goes out of the range of the values
+        return float(min(max(value, self.min), self.max))
+
+
+class MeshAnalysis():
+    """Partial analysis results
+
+    Results of analyzing one mesh (or part of the checks of one mesh). 
+    Partial results are combined with merge(), which is associative, so
+    meshes may be analyzed independently (even concurrently) and merged
+    afterwards
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+        self.counts = dict()
+        """Dictionary/map of counters (using condition name as key)
+        """
+        self.components = dict()
+        """Dictionary/map of components meeting each condition (using condition name as key). Values are lists of (path, component type, indices) tuples
+        """
+        self.elms = dict()
+        """Dictionary/map of element names meeting each condition (using condition name as key)
+        """
+        self.uvSets = 0
+        """Maximum number of UV sets in any mesh
+        """
+        self.uvCoverage = 0.
+        """Accumulated UV area of the faces with valid UVs
+        """
+        self.ntdStats = RunningStats()
+        """Normalized texel density statistics of the faces with valid UVs
+        """
+        self.ntdHistogram = LogHistogram()
+        """Normalized texel density histogram of the faces with valid UVs (weighted by world space area)
+        """
+        self.bbox = None
+        """World space bounding box (xmin, ymin, zmin, xmax, ymax, zmax) or None if empty
+        """
+        self.uvOverlaps = dict()
+        """Faces overlapping in UV space. Dictionary/map using UV tile (tu, tv) as key and a map of DAG path to face indices as value
+        """
+
+    def addCount(self, condName, count):
+        """Increment the counter for a condition
+
+        Args:
+            condName (str): Condition name
+            count (int): Value to add to the counter
+        """
+        self.counts[condName] = self.counts.get(condName, 0) + count
+
+    def addComponents(self, condName, path, compType, indices):
+        """Add mesh components meeting a condition (also incrementing its counter)
+
+        Args:
+            condName (str): Condition name
+            path (str): DAG path (full path name) of the mesh
+            compType (str): Component type ("f", "e", "vtx", ...)
+            indices (int[]): Component indices
+        """
+        self.addCount(condName, len(indices))
+        if len(indices):
+            self.components.setdefault(condName, []).append((path, compType, indices))
+
+    def addElements(self, condName, elms):
+        """Add elements meeting a condition (also incrementing its counter)
+
+        Args:
+            condName (str): Condition name
+            elms (str[]): Element (node or component) names
+        """
+        self.addCount(condName, len(elms))
+        if elms:
+            self.elms.setdefault(condName, []).extend(elms)
+
+    def merge(self, other):
+        """Merge other partial results into this object
+
+        Args:
+            other (MeshAnalysis): Partial results to merge
+
+        Returns:
+            MeshAnalysis: This object (merged)
+        """
+        for cond_name, count in other.counts.items():
+            self.addCount(cond_name, count)
+        for cond_name, comps in other.components.items():
+            self.components.setdefault(cond_name, []).extend(comps)
+        for cond_name, elms in other.elms.items():
+            self.elms.setdefault(cond_name, []).extend(elms)
+        self.uvSets = max(self.uvSets, other.uvSets)
+        self.uvCoverage += other.uvCoverage
+        self.ntdStats.merge(other.ntdStats)
+        self.ntdHistogram.merge(other.ntdHistogram)
+        self.bbox = mergeBoundingBoxes([ b for b in (self.bbox, other.bbox) if b is not None ])
+        for tile, faces in other.uvOverlaps.items():
+            self.uvOverlaps.setdefault(tile, dict()).update(faces)
+        return self
+
+
+def mergeBoundingBoxes(bboxes):
+    """Compute the bounding box enclosing a list of bounding boxes
+
+    Args:
+        bboxes (float[][6]): Bounding boxes (xmin, ymin, zmin, xmax, ymax, zmax)
+
+    Returns:
+        float[6]: Enclosing bounding box (None if the list is empty)
+    """
+    if not len(bboxes):
+        return None
+    bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 6)
+    return np.concatenate((bboxes[:, :3].min(axis=0), bboxes[:, 3:].max(axis=0)))
+
+
+def analyzeBoundingBox(mesh):
+    """Compute the world space bounding box of a mesh
+
+    Args:
+        mesh (MeshData): Mesh data
+
+    Returns:
+        MeshAnalysis: Analysis results (only bounding box)
+    """
+    res = MeshAnalysis()
+    res.bbox = mesh.worldBoundingBox()
+    return res
+
+
+def faceOffsets(counts):
+    """Compute the offset of the first element of each face in a concatenated
+    per-face array
+
+    Args:
+        counts (int[]): Number of elements per face
+
+    Returns:
+        int[]: Offsets of the first element of each face
+    """
+    offsets = np.zeros(len(counts), dtype=np.int64)
+    if len(counts) > 1:
+        np.cumsum(counts[:-1], out=offsets[1:])
+    return offsets
+
+
+def faceMask(numFaces, faces=None):
+    """Build a boolean mask of the faces to analyze
+
+    Args:
+        numFaces (int): Number of faces in the mesh
+        faces (int[], optional): Face indices. Defaults to all faces.
+
+    Returns:
+        bool[]: True for the faces in the list
+    """
+    if faces is None:
+        return np.ones(numFaces, dtype=bool)
+    mask = np.zeros(numFaces, dtype=bool)
+    mask[np.asarray(faces, dtype=np.int64)] = True
+    return mask
+
+
+def fanTriangles(counts):
+    """Triangulate faces as fans (v0, vi, vi+1), returning indices into
+    the concatenated face-vertex arrays
+
+    Args:
+        counts (int[]): Number of vertices per face
+
+    Returns:
+        (int[], int[], int[], int[]): Face index of each triangle and the
+            face-vertex offsets of its three corners
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    tris_per_face = np.maximum(counts - 2, 0)
+    tri_face = np.repeat(np.arange(len(counts)), tris_per_face)
+    tri_offsets = faceOffsets(tris_per_face)
+    local = np.arange(len(tri_face)) - tri_offsets[tri_face] + 1
+    first = faceOffsets(counts)[tri_face]
+    return tri_face, first, first + local, first + local + 1
+
+
+def polygonAreas(points, counts, indices):
+    """Area of each polygon (sum of the areas of its fan triangles)
+
+    Args:
+        points (float[][3]): Vertex positions
+        counts (int[]): Number of vertices per face
+        indices (int[]): Vertex indices per face (concatenated)
+
+    Returns:
+        float[]: Area of each face
+    """
+    tri_face, a, b, c = fanTriangles(counts)
+    p0 = points[indices[a]]
+    cross = np.cross(points[indices[b]] - p0, points[indices[c]] - p0)
+    tri_areas = 0.5 * np.sqrt(np.einsum("ij,ij->i", cross, cross))
+    return np.bincount(tri_face, weights=tri_areas, minlength=len(counts))
+
+
+def polygonSignedAreas2D(x, y, counts):
+    """Signed area of each 2D polygon (positive when counter-clockwise)
+
+    Args:
+        x (float[]): X (U) coordinate of each face vertex (concatenated)
+        y (float[]): Y (V) coordinate of each face vertex (concatenated)
+        counts (int[]): Number of vertices per face
+
+    Returns:
+        float[]: Signed area of each face
+    """
+    tri_face, a, b, c = fanTriangles(counts)
+    cross = (x[b] - x[a]) * (y[c] - y[a]) - (x[c] - x[a]) * (y[b] - y[a])
+    return 0.5 * np.bincount(tri_face, weights=cross, minlength=len(counts))
+
+
+def coincidentPairs(points, counts, indices, tolerance):
+    """Find the pairs of vertices of the same face closer than a tolerance
+
+    Args:
+        points (float[][3]): Vertex positions
+        counts (int[]): Number of vertices per face
+        indices (int[]): Vertex indices per face (concatenated)
+        tolerance (float): Distance below which vertices are in the same position
+
+    Returns:
+        (int[], int[]): Face vertices (indices into the concatenated array) of each pair
+    """
+    offsets = faceOffsets(counts)
+    tol2 = tolerance * tolerance
+    first = []
+    second = []
+    # Faces with the same number of vertices are compared at once, one pair of corners at a time
+    for n in np.unique(counts):
+        if n < 2:
+            continue
+        face_offsets = offsets[counts == n]
+        for i, j in zip(*np.triu_indices(n, 1)):
+            a = face_offsets + i
+            b = face_offsets + j
+            delta = points[indices[a]] - points[indices[b]]
+            close = np.einsum("ij,ij->i", delta, delta) <= tol2
+            first.append(a[close])
+            second.append(b[close])
+    if not first:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(first), np.concatenate(second)
+
+
+def distinctPositions(points, counts, indices, tolerance=defaultDegenerateTolerance):
+    """Count the number of distinct vertex positions of each face
+
+    Vertices closer than the tolerance are merged (transitively) from the
+    distances between the vertices of each face, so the result does not
+    depend on where the vertices are in space
+
+    Args:
+        points (float[][3]): Vertex positions
+        counts (int[]): Number of vertices per face
+        indices (int[]): Vertex indices per face (concatenated)
+        tolerance (float, optional): Distance below which vertices are in the same position. Defaults to defaultDegenerateTolerance.
+
+    Returns:
+        int[]: Number of distinct positions of each face
+    """
+    points = np.asarray(points, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.int64)
+    a, b = coincidentPairs(points, counts, indices, max(tolerance, 0.))
+    # Union-find of the face vertices: each one is labeled with the first face vertex of its group
+    labels = np.arange(len(indices))
+    while len(a):
+        low = np.minimum(labels[a], labels[b])
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, a, low)
+        np.minimum.at(new_labels, b, low)
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+    fv_face = np.repeat(np.arange(len(counts)), counts)
+    roots = labels == np.arange(len(indices))
+    return np.bincount(fv_face[roots], minlength=len(counts))
+
+
+def longestEdges(points, counts, indices):
+    """Length of the longest edge of each face
+
+    Args:
+        points (float[][3]): Vertex positions
+        counts (int[]): Number of vertices per face
+        indices (int[]): Vertex indices per face (concatenated)
+
+    Returns:
+        float[]: Longest edge length of each face (0 for faces without vertices)
+    """
+    longest = np.zeros(len(counts))
+    valid = np.flatnonzero(counts > 0)
+    if not len(valid):
+        return longest
+    offsets = faceOffsets(counts)
+    next_fv = np.arange(1, len(indices) + 1)
+    next_fv[offsets[valid] + counts[valid] - 1] = offsets[valid]
+    edges = points[indices[next_fv]] - points[indices]
+    lengths = np.sqrt(np.einsum("ij,ij->i", edges, edges))
+    longest[valid] = np.maximum.reduceat(lengths, offsets[valid])
+    return longest
+
+
+def analyzeFaceGeometry(mesh, path="", faces=None, tolerance=defaultDegenerateTolerance, sliverAspectRatio=defaultSliverAspectRatio):
+    """Analyze the geometry of the faces of a mesh: polygon type and
+    degenerated faces (quads collapsed to tris, lines or points, zero area
+    faces, collapsed n-gons and slivers)
+
+    Args:
+        mesh (MeshData): Mesh data
+        path (str, optional): DAG path (full path name) of the mesh. Defaults to "".
+        faces (int[], optional): Face indices to analyze. Defaults to all faces.
+        tolerance (float, optional): Distance below which vertices are in the same position and faces have zero width. Defaults to defaultDegenerateTolerance.
+        sliverAspectRatio (float, optional): Aspect ratio (longest edge / width) above which faces are slivers. Defaults to defaultSliverAspectRatio.
+
+    Returns:
+        MeshAnalysis: Analysis results (offending face indices per condition)
+    """
+    res = MeshAnalysis()
+    found = dict()
+    counts = mesh.faceVertexCounts
+    face_mask = faceMask(len(counts), faces)
+
+    def select(mask):
+        return np.flatnonzero(mask & face_mask)
+
+    # Polygon type
+    found["tris"] = select(counts == 3)
+    found["quads"] = select(counts == 4)
+    found["ngons"] = select((counts != 3) & (counts != 4))
+
+    # Vertices in the same position (closer than tolerance)
+    distinct = distinctPositions(mesh.points, counts, mesh.faceVertexIndices, tolerance)
+    quads = counts == 4
+    found["quadsToPoints"] = select(quads & (distinct == 1))
+    found["quadsToLines"] = select(quads & (distinct == 2))
+    found["quadsToTris"] = select(quads & (distinct == 3))
+
+    # Face width (height over the longest edge: 2*area/longest for triangles,
+    # area/longest for quads and n-gons, exact for parallelograms) and aspect ratio
+    areas = polygonAreas(mesh.points, counts, mesh.faceVertexIndices)
+    longest = longestEdges(mesh.points, counts, mesh.faceVertexIndices)
+    heights = np.where(counts == 3, 2. * areas, areas)
+    width = np.divide(heights, longest, out=np.zeros_like(areas), where=longest > 0.)
+    zero_area = (distinct <= 2) | (width <= tolerance)
+    found["zeroAreaQuads"] = select(quads & zero_area)
+    found["zeroAreaTris"] = select((counts == 3) & zero_area)
+    found["collapsedNgons"] = select((counts > 4) & (zero_area | (distinct < counts)))
+    found["sliverFaces"] = select(~zero_area & (longest > sliverAspectRatio * width))
+
+    for cond_name, face_ids in found.items():
+        res.addComponents(cond_name, path, "f", face_ids)
+
+    return res
+
+
+def normalizedTexelDensities(mesh):
+    """Normalized texel density (UV area / world space area) of each face
+    with UVs. Faces with zero world space area are skipped
+
+    Args:
+        mesh (MeshData): Mesh data (faces, world points and UVs)
+
+    Returns:
+        (float[], float[]): Normalized texel density and world space area of each face
+    """
+    uv_faces = np.flatnonzero(mesh.uvCounts > 0)
+    if not len(uv_faces):
+        return np.zeros(0), np.zeros(0)
+    uv_area = np.abs(polygonSignedAreas2D(mesh.u[mesh.uvIds], mesh.v[mesh.uvIds], mesh.uvCounts[uv_faces]))
+    world_areas = polygonAreas(mesh.worldPoints, mesh.faceVertexCounts, mesh.faceVertexIndices)[uv_faces]
+    valid = world_areas > zeroAreaThreshold
+    return uv_area[valid] / world_areas[valid], world_areas[valid]
+
+
+def analyzeFaceUVs(mesh, path="", faces=None):
+    """Analyze the UVs of the faces of a mesh: missing, NaN, flipped, zero
+    area, crossing tile borders, coverage and normalized texel density
+
+    Args:
+        mesh (MeshData): Mesh data
+        path (str, optional): DAG path (full path name) of the mesh. Defaults to "".
+        faces (int[], optional): Face indices to analyze. Defaults to all faces.
+
+    Returns:
+        MeshAnalysis: Analysis results (offending face indices per condition)
+    """
+    res = MeshAnalysis()
+    found = dict()
+    counts = mesh.faceVertexCounts
+    face_mask = faceMask(len(counts), faces)
+
+    def select(mask):
+        return np.flatnonzero(mask & face_mask)
+
+    # UVs
+    has_uvs = mesh.uvCounts > 0
+    found["uvMissing"] = select(~has_uvs)
+
+    uv_faces = np.flatnonzero(has_uvs)
+    uv_counts = mesh.uvCounts[uv_faces]
+    fv_u = mesh.u[mesh.uvIds]
+    fv_v = mesh.v[mesh.uvIds]
+
+    # NaN values are reported once per face vertex
+    nan_fv = np.isnan(fv_u) | np.isnan(fv_v)
+    nan_per_face = np.add.reduceat(nan_fv.astype(np.int64), faceOffsets(uv_counts)) if len(uv_faces) else np.zeros(0, dtype=np.int64)
+    nan_per_face = nan_per_face * face_mask[uv_faces]
+    found["uvNaN"] = np.repeat(uv_faces, nan_per_face)
+
+    # Faces crossing tile borders (tiles are computed truncating coordinates, ignoring NaN values)
+    if len(uv_faces):
+        uv_offsets = faceOffsets(uv_counts)
+        with np.errstate(invalid="ignore"):
+            tile_u = np.trunc(fv_u)
+            tile_v = np.trunc(fv_v)
+        crossing = np.zeros(len(uv_faces), dtype=bool)
+        for tile in (tile_u, tile_v):
+            tmin = np.minimum.reduceat(np.where(nan_fv, np.inf, tile), uv_offsets)
+            tmax = np.maximum.reduceat(np.where(nan_fv, -np.inf, tile), uv_offsets)
+            crossing |= np.isfinite(tmin) & (tmin != tmax)
+        found["uvCrossingBorders"] = uv_faces[crossing & face_mask[uv_faces]]
+
+        uv_signed_area = polygonSignedAreas2D(fv_u, fv_v, uv_counts)
+    else:
+        found["uvCrossingBorders"] = uv_faces
+        uv_signed_area = np.zeros(0)
+
+    uv_area = np.abs(uv_signed_area)
+    uv_mask = face_mask[uv_faces]
+    found["uvFlipped"] = uv_faces[uv_mask & (uv_signed_area < 0.)]
+    zero_uv_area = uv_area < minUVArea
+    found["uvZeroArea"] = uv_faces[uv_mask & zero_uv_area]
+
+    # Coverage and normalized texel density of the faces with valid UVs
+    # (zero area faces are skipped to avoid divisions by zero, and NaN UVs
+    # would spoil the accumulated values)
+    areas = polygonAreas(mesh.points, counts, mesh.faceVertexIndices)[uv_faces]
+    valid = uv_mask & ~zero_uv_area & np.isfinite(uv_area) & (areas > zeroAreaThreshold)
+    res.uvCoverage = float(np.sum(uv_area[valid]))
+    world_areas = polygonAreas(mesh.worldPoints, counts, mesh.faceVertexIndices)[uv_faces[valid]]
+    ts_areas = uv_area[valid]
+    ntd = np.divide(ts_areas, world_areas, out=np.zeros_like(ts_areas), where=world_areas != 0)
+    res.ntdStats.addValues(ntd)
+    res.ntdHistogram.addValues(ntd, world_areas)
+
+    for cond_name, face_ids in found.items():
+        res.addComponents(cond_name, path, "f", face_ids)
+
+    return res
+
+
+def analyzeFaces(mesh, path="", faces=None, tolerance=defaultDegenerateTolerance, sliverAspectRatio=defaultSliverAspectRatio):
+    """Analyze the faces of a mesh: geometry (see analyzeFaceGeometry) and
+    UVs (see analyzeFaceUVs)
+
+    Args:
+        mesh (MeshData): Mesh data
+        path (str, optional): DAG path (full path name) of the mesh. Defaults to "".
+        faces (int[], optional): Face indices to analyze. Defaults to all faces.
+        tolerance (float, optional): Distance below which vertices are in the same position and faces have zero width. Defaults to defaultDegenerateTolerance.
+        sliverAspectRatio (float, optional): Aspect ratio (longest edge / width) above which faces are slivers. Defaults to defaultSliverAspectRatio.
+
+    Returns:
+        MeshAnalysis: Analysis results (offending face indices per condition)
+    """
+    res = analyzeFaceGeometry(mesh, path, faces, tolerance, sliverAspectRatio)
+    return res.merge(analyzeFaceUVs(mesh, path, faces))
@@ -24,10 +24,32 @@ this program. If not, see <https://www.gnu.org/licenses/>.
 import maya.api.OpenMaya as om  # Maya Python API 2.0
 import maya.cmds as cmds
 import sys
+import os
+import functools
+import threading
+import concurrent.futures
+import numpy as np
+import tlc.modeling.meshanalysis as meshanalysis
+import tlc.modeling.uvoverlap as uvoverlap
+import tlc.modeling.meshtopology as meshtopology
+import tlc.common.tracing as tracing
 from tlc.common.conditionchecker import ConditionChecker
 from tlc.common.conditionchecker import ConditionErrorLevel
 from tlc.common.conditionchecker import ConditionErrorCriteria
 
+
+log = tracing.getLogger(__name__)
+
+edgeTableFraction = .25
+"""Fraction of the edges of a mesh reported by the topology check above which
+all the edges are read at once to find their ids (see getEdgeTable). The table
+is kept for later analyses of the same topology
+"""
+
+ntdPercentiles = [ 1, 50, 99 ]
+"""Percentiles of the normalized texel density distribution reported
+"""
+
 def getTileID(u, v):
     """Build tile ID string for a texture coordinates pair (u,v)
 
@@ -55,6 +77,232 @@ def checkUVTile(u, v, the_set):
     the_set.add(tile_id)
 
 
+meshBuffers = [ "faces", "points", "worldPoints", "uvs", "edges" ]
+"""Mesh arrays that checks may need:
+faces (face vertex counts and indices), points (object space),
+worldPoints (world space), uvs (current or requested UV set) and edges (edge-face incidence, see MeshTopology)
+"""
+
+bufferDependencies = { "worldPoints": [ "points" ], "edges": [ "faces" ] }
+"""Buffers needed to build other buffers
+"""
+
+
+def resolveBuffers(buffers):
+    """Add the buffers needed to build the requested ones
+
+    Args:
+        buffers (str[]): Requested buffers
+
+    Returns:
+        set: Buffers to pull
+    """
+    resolved = set()
+    pending = list(buffers)
+    while pending:
+        b = pending.pop()
+        if b not in resolved:
+            resolved.add(b)
+            pending.extend(bufferDependencies.get(b, []))
+    return resolved
+
+
+def getMeshData(dag, buffers=meshBuffers, uvSet=""):
+    """Pull the arrays of a mesh (topology, points and UVs) in a single pass.
+    Only the requested buffers are pulled
+
+    Args:
+        dag (MDagPath): DAG path to the mesh shape
+        buffers (str[], optional): Buffers to pull (see meshBuffers). Defaults to all.
+        uvSet (str, optional): UV set. Defaults to "" (current UV set).
+
+    Returns:
+        MeshData: Mesh data arrays
+    """
+    buffers = resolveBuffers(buffers)
+    mesh = om.MFnMesh(dag)
+    counts = indices = points = world_points = None
+    u = v = uv_counts = uv_ids = None
+    if "faces" in buffers:
+        counts, indices = mesh.getVertices()
+    if "points" in buffers:
+        points = np.array(mesh.getPoints(om.MSpace.kObject), dtype=np.float64)[:, :3]
+    if "worldPoints" in buffers:
+        # Transform points to world space here instead of querying them again
+        matrix = np.array(list(dag.inclusiveMatrix()), dtype=np.float64).reshape(4, 4)
+        world_points = points @ matrix[:3, :3] + matrix[3, :3]
+    if "uvs" in buffers:
+        u, v = mesh.getUVs(uvSet)
+        uv_counts, uv_ids = mesh.getAssignedUVs(uvSet)
+    return meshanalysis.MeshData(counts if counts is not None else [], indices if indices is not None else [],
+                                 points if points is not None else [], world_points, u, v, uv_counts, uv_ids, mesh.numVertices)
+
+
+def getSelectedFaces(component):
+    """Get the face indices in a component object
+
+    Args:
+        component (MObject): Component object (as returned by MSelectionList.getComponent)
+
+    Returns:
+        int[]: Face indices, or None if the component is empty (whole mesh)
+    """
+    if component.isNull() or component.apiType() != om.MFn.kMeshPolygonComponent:
+        return None
+    return list(om.MFnSingleIndexedComponent(component).getElements())
+
+
+def getEdgeTable(dag):
+    """Read the vertices of all the edges of a mesh (single MItMeshEdge pass),
+    sorted by vertex pair for lookups (see getEdgeIds)
+
+    Args:
+        dag (MDagPath): DAG path to the mesh shape
+
+    Returns:
+        (int[], int[], int): Sorted vertex pair keys, edge id of each key and number of vertices
+    """
+    it_edges = om.MItMeshEdge(dag)
+    num_vertices = om.MFnMesh(dag).numVertices
+    mesh_edges = np.zeros((it_edges.count(), 2), dtype=np.int64)
+    while not it_edges.isDone():
+        mesh_edges[it_edges.index()] = (it_edges.vertexId(0), it_edges.vertexId(1))
+        it_edges.next()
+    keys = mesh_edges.min(axis=1) * num_vertices + mesh_edges.max(axis=1)
+    order = np.argsort(keys, kind="stable")
+    return keys[order], order, num_vertices
+
+
+def getEdgeIds(dag, edgeVertices, edgeTable=None):
+    """Find the ids of the edges connecting pairs of vertices
+
+    Without an edge table, only the edges connected to the first vertex of
+    each pair are queried (fast when few edges are reported)
+
+    Args:
+        dag (MDagPath): DAG path to the mesh shape
+        edgeVertices (int[][2]): Vertices of each edge
+        edgeTable (tuple, optional): Edges of the mesh (see getEdgeTable). Defaults to None.
+
+    Returns:
+        int[]: Edge ids
+    """
+    edge_vertices = np.asarray(edgeVertices, dtype=np.int64).reshape(-1, 2)
+    if edgeTable is not None:
+        sorted_keys, order, num_vertices = edgeTable
+        if not len(edge_vertices) or not len(sorted_keys):
+            return np.zeros(len(edge_vertices), dtype=np.int64)
+        wanted = edge_vertices.min(axis=1) * num_vertices + edge_vertices.max(axis=1)
+        pos = np.minimum(np.searchsorted(sorted_keys, wanted), len(sorted_keys) - 1)
+        # Pairs not found (should not happen) are reported as edge 0
+        return np.where(sorted_keys[pos] == wanted, order[pos], 0)
+    mesh = om.MFnMesh(dag)
+    it_verts = om.MItMeshVertex(dag)
+    edge_ids = np.zeros(len(edge_vertices), dtype=np.int64)
+    for i, (v0, v1) in enumerate(edge_vertices.tolist()):
+        it_verts.setIndex(v0)
+        for e in it_verts.getConnectedEdges():
+            if v1 in mesh.getEdgeVertices(e):
+                edge_ids[i] = e
+                break
+    return edge_ids
+
+
+class MeshContext():
+    """Mesh being analyzed and the arrays shared by the checks
+    """
+
+    def __init__(self, dag, selectedFaces, meshData, topology=None):
+        """Constructor
+
+        Args:
+            dag (MDagPath): DAG path to the mesh shape
+            selectedFaces (int[]): Selected faces (None for the whole mesh)
+            meshData (MeshData): Mesh arrays pulled for the enabled checks
+            topology (MeshTopology, optional): Edge-face incidence (only if any check needs edges). Defaults to None.
+        """
+        self.dag = dag
+        """DAG path to the mesh shape
+        """
+        self.path = dag.fullPathName()
+        """DAG path (full path name) of the mesh
+        """
+        self.selectedFaces = selectedFaces
+        """Selected faces (None for the whole mesh)
+        """
+        self.meshData = meshData
+        """Mesh arrays (MeshData)
+        """
+        self.topology = topology
+        """Edge-face incidence (MeshTopology). Built on the first request (see getTopology)
+        """
+        self.__topologyLock = threading.Lock()
+
+    def getTopology(self):
+        """Get the edge-face incidence, building it on the first request (the
+        checks needing it may run at the same time in the worker threads)
+
+        Returns:
+            MeshTopology: Edge-face incidence
+        """
+        with self.__topologyLock:
+            if self.topology is None:
+                with tracing.timer(log, "buildTopology", mesh=self.path):
+                    self.topology = meshtopology.MeshTopology(self.meshData)
+            return self.topology
+
+
+class MeshCheck():
+    """Check registered in the mesh checker
+
+    A check declares the conditions it reports and the mesh buffers it
+    needs, so the checker only pulls the arrays needed by the enabled checks
+    """
+
+    def __init__(self, name, category, conditions, func, buffers=(), perMesh=True, threaded=True, finish=None):
+        """Constructor
+
+        Args:
+            name (str): Check name (ID)
+            category (str): "geo" (geometry) or "uv"
+            conditions (tuple[]): Conditions reported: (name, displayName, toolTip, selectable, errorCriteria). errorCriteria may be None
+            func (function): Check function. Called as func(checker, context) for per-mesh checks (MeshContext) or func(checker, contexts) for checks of all the meshes at once. Returns a MeshAnalysis
+            buffers (str[], optional): Mesh buffers needed (see meshBuffers). Defaults to none.
+            perMesh (bool, optional): The check runs once per mesh (otherwise once for all the meshes). Defaults to True.
+            threaded (bool, optional): The check can run in a worker thread (it does not call Maya). Defaults to True.
+            finish (function, optional): Function completing the results of a per-mesh check in the main thread (e.g. translating components to Maya ids). Called as finish(checker, context, result). Defaults to None.
+        """
+        self.name = name
+        self.category = category
+        self.conditions = conditions
+        self.func = func
+        self.buffers = buffers
+        self.perMesh = perMesh
+        self.threaded = threaded
+        self.finish = finish
+
+    def createConditions(self):
+        """Create the condition checkers of this check
+
+        Returns:
+            ConditionChecker[]: Condition checkers
+        """
+        return [ ConditionChecker(name, display_name, tool_tip, selectable) for name, display_name, tool_tip, selectable, _ in self.conditions ]
+
+
+registeredChecks = dict()
+"""Registered checks (using check name as key). Checks are run in registration order
+"""
+
+def registerCheck(check):
+    """Register a check, so mesh checkers created afterwards include it
+
+    Args:
+        check (MeshCheck): Check to register
+    """
+    registeredChecks[check.name] = check
+
+
 class MeshChecker():
     """Class MeshChecker
 
@@ -81,55 +329,51 @@ class MeshChecker():
         """Dictionary/map of UV condition checkers (using name as key)
         """
 
-        self.geoConditions["meshes"] = ConditionChecker("meshes", "Meshes", "Number of meshes in selected elements", False)
-        #self.addGeoCondition("history")
-
-        # Poly evaluate
-        self.geoConditions["shells"] = ConditionChecker("shells", "Shells", "Number of shells in selected elements", False)
-        self.geoConditions["vertices"] = ConditionChecker("vertices", "Vertices", "Number of vertices in selected elements", False)
-        self.geoConditions["edges"] = ConditionChecker("edges", "Edges", "Number of edges in selected elements", False)
-        self.geoConditions["faces"] = ConditionChecker("faces", "Faces", "Number of faces/polygons in selected elements", False)
-        self.geoConditions["area"] = ConditionChecker("area", "Area", "Surface area (object space)", False)
-        self.geoConditions["worldArea"] = ConditionChecker("worldArea", "WS Area", "Surface Area (world space)", False)
-
-        # Face checks
-        self.geoConditions["quads"] = ConditionChecker("quads", "Quads", "Number of quads in selected elements")
-        self.geoConditions["tris"] = ConditionChecker("tris", "Tris", "Number of triangles in selected elements")
-        self.geoConditions["ngons"] = ConditionChecker("ngons", "n-Gons", "Number of n-gons in selected elements")
-        # Degenerated faces (only quads)
-        self.geoConditions["quadsToTris"] = ConditionChecker("quadsToTris", "Quads to tris", "Number of quads degenerated to triangles (two vertices in the same position)")        # Two vertices in the same position
-        self.geoConditions["quadsToLines"] = ConditionChecker("quadsToLines", "Quads to lines", "Number of quads degenerated to lines (vertices in two different positions)")       # 2+2 or 3+1 vertices grouped
-        self.geoConditions["quadsToPoints"] = ConditionChecker("quadsToPoints", "Quads to points", "Number of quads degenerated to points (all vertices in the same position)")      # All four vertices in the same position
-        self.geoConditions["zeroAreaQuads"] = ConditionChecker("zeroAreaQuads", "Zero area quads", "Zero area quads")      # More than two vertices in the same position
-
-        # Edge checks
-        self.geoConditions["borderEdges"] = ConditionChecker("borderEdges", "Border edges", "Number of border edges in selected elements")        # Border edges (only one face uses this edge)
-        self.geoConditions["evilEdges"] = ConditionChecker("evilEdges", "Evil edges", "Number of edges sharing more than two faces. Non-manifold geometry")          # Edges connecting more than 2 faces
-
-        # Vertex checks
-        self.geoConditions["poles"] = ConditionChecker("poles", "Poles", "Number of poles in selected elements (vertices connecting a number of edges other than 4)")
-
-        # Position
-        self.geoConditions["minY"] = ConditionChecker("minY", "Min Y", "Min Y of meshes bounding box", False)
-        self.geoConditions["centerX"] = ConditionChecker("centerX", "Center X", "Center in X axis of meshes bounding box", False)
-        self.geoConditions["centerZ"] = ConditionChecker("centerZ", "Center Z", "Center in Z axis of meshes bounding box", False)
-
-        # UVs
-        self.uvConditions["uvSets"] = ConditionChecker("uvSets", "UV sets", "Number of UV sets in selected elements", False)           # Number of UV sets
-        self.uvConditions["uvShells"] = ConditionChecker("uvShells", "UV shells", "Number of UV shells in selected elements", False)         # Number of UV shells
-        self.uvConditions["uvMissing"] = ConditionChecker("uvMissing", "UV missing", "Number of face vertices missing UV coordinates")        # Faces with no UVs
-        self.uvConditions["uvNaN"] = ConditionChecker("uvNaN", "UV NaN", "Number of face vertices with invalid UV values (NaN)")        # Faces with invalid UVs (NaN)
-        self.uvConditions["uvFlipped"] = ConditionChecker("uvFlipped", "UV flipped", "Number of faces flipped in UV space")        # Faces flipped in UV
-        self.uvConditions["uvZeroArea"] = ConditionChecker("uvZeroArea", "UV zero area", "Number of faces occupying zero (or near zero) area in UV space")       # Faces with zero area in UV space
-        self.uvConditions["uvOverlapping"] = ConditionChecker("uvOverlapping", "UV overlaps", "Number of faces overlapped in UV space")    # Overlapping faces
-        self.uvConditions["uvCrossingBorders"] = ConditionChecker("uvCrossingBorders", "UV crossing borders", "Number of faces crossing borders of a tile") # Faces crossing tile (UDIM) borders
-        self.uvConditions["uvCoverage"] = ConditionChecker("uvCoverage", "UV coverage", "Normalized UV coverage of selected elements", False)       # UV coverage (normalized to the space of tiles/UDIMs used)
-        # Normalized Texeld Density (NTD)
-        self.uvConditions["avgNTD"] = ConditionChecker("avgNTD", "Avg. NTD", "Average normalized texel density", False)         # Average NTD
-        self.uvConditions["minNTD"] = ConditionChecker("minNTD", "Min. NTD", "Minimum normalized texel density", False)         # Minimum NTD
-        self.uvConditions["maxNTD"] = ConditionChecker("maxNTD", "Max. NTD", "Maximum normalized texel density", False)         # Maximum NTD
-        self.uvConditions["varianceNTD"] = ConditionChecker("varianceNTD", "Var. NTD", "Variance normalized texel density", False)    # Variance of NTD distribution
-        self.uvConditions["stdDevNTD"] = ConditionChecker("stdDevNTD", "Stdev. NTD", "Standard deviation normalized texel density", False)      # Standard deviation of NTD distribution
+        self.uvOverlaps = dict()
+        """Faces overlapping in UV space per tile. Dictionary/map using UV tile (tu, tv) as key and a map of DAG path to face indices as value
+        """
+
+        self.meshResults = dict()
+        """Analysis results of each mesh in last analysis. Dictionary/map using DAG path as key and MeshAnalysis as value
+        """
+
+        self.numThreads = os.cpu_count()
+        """Number of threads used to analyze the meshes concurrently
+        """
+
+        self.degenerateTolerance = meshanalysis.defaultDegenerateTolerance
+        """Distance (object space) below which vertices are considered in the same position and faces zero area
+        """
+
+        self.sliverAspectRatio = meshanalysis.defaultSliverAspectRatio
+        """Aspect ratio (longest edge / width) above which faces are considered slivers
+        """
+
+        self.cache = dict()
+        """Cache of partial analysis results per mesh. Dictionary/map using DAG path as key and (fingerprint, results) as value.
+        Meshes whose fingerprint (topology, points and UVs) did not change are not analyzed again
+        """
+
+        self.edgeTables = dict()
+        """Edges of the meshes read to translate the edge components (see getEdgeTable). Dictionary/map using DAG path as key and (topology fingerprint, edge table) as value
+        """
+
+        self.sceneCache = dict()
+        """Cached results of the checks of all the meshes at once (e.g. UV overlaps). Dictionary/map using check name as key and ((path, fingerprint) of all the meshes, results) as value
+        """
+
+        self.checks = list(registeredChecks.values())
+        """Checks run by this checker (registered checks when created)
+        """
+
+        self.enabledChecks = set(c.name for c in self.checks)
+        """Names of the enabled checks. Disabled checks are skipped (and the buffers they need are not pulled)
+        """
+
+        for check in self.checks:
+            conditions = self.geoConditions if check.category == "geo" else self.uvConditions
+            for cond in check.createConditions():
+                conditions[cond.name] = cond
 
         #self.reset()
         
@@ -144,13 +388,124 @@ class MeshChecker():
             self.uvConditions[cond].reset()
 
         self.selection = []
+        self.uvOverlaps = dict()
+        self.meshResults = dict()
 
         # Global world-space bounding box
         self.bbox = [ sys.float_info.max, sys.float_info.max, sys.float_info.max, -sys.float_info.max, -sys.float_info.max, -sys.float_info.max ]  # xmin, ymin, zmin, xmax, ymax, zmax
 
 
+    def clearCache(self):
+        """Discard cached results, so next analysis checks all the meshes again
+        """
+        self.cache = dict()
+        self.sceneCache = dict()
+        self.edgeTables = dict()
+
+
+    def enableCheck(self, name, enabled=True):
+        """Enable or disable a check
+
+        Args:
+            name (str): Check name
+            enabled (bool, optional): Enable (True) or disable (False). Defaults to True.
+        """
+        if enabled:
+            self.enabledChecks.add(name)
+        else:
+            self.enabledChecks.discard(name)
+
+
+    def enableCategory(self, category, enabled=True):
+        """Enable or disable all the checks of a category (e.g. disable "uv"
+        checks for a quick geometry-only analysis)
+
+        Args:
+            category (str): "geo" or "uv"
+            enabled (bool, optional): Enable (True) or disable (False). Defaults to True.
+        """
+        for check in self.checks:
+            if check.category == category:
+                self.enableCheck(check.name, enabled)
+
+
+    def isConditionEnabled(self, cond_name):
+        """Check whether a condition is reported by any enabled check
+
+        Args:
+            cond_name (str): Condition name
+
+        Returns:
+            bool: The condition is computed in the analysis
+        """
+        return any(c.name in self.enabledChecks and cond_name in [ cond[0] for cond in c.conditions ] for c in self.checks)
+
+
+    def getEnabledChecks(self):
+        """Get the enabled checks (in registration order)
+
+        Returns:
+            MeshCheck[]: Enabled checks
+        """
+        return [ c for c in self.checks if c.name in self.enabledChecks ]
+
+
+    def getRequiredBuffers(self):
+        """Get the mesh buffers needed by the enabled checks
+
+        Returns:
+            set: Buffer names (see meshBuffers)
+        """
+        buffers = set()
+        for check in self.getEnabledChecks():
+            buffers.update(check.buffers)
+        return resolveBuffers(buffers)
+
+
     # Helper functions for off-line usage
 
+    def getRecord(self):
+        """Get the analysis results for the whole selection as a flat record
+
+        Returns:
+            dict: Map of column name (condition name) to value
+        """
+        record = dict()
+        for cond in list(self.geoConditions.values()) + list(self.uvConditions.values()):
+            record[cond.name] = cond.count
+        return record
+
+    def getMeshRecords(self):
+        """Get the analysis results of each mesh as flat records. All the
+        records have the same columns
+
+        Returns:
+            dict[]: One record (map of column name to value) per mesh
+        """
+        records = []
+        for path, analysis in self.meshResults.items():
+            record = { "mesh": path }
+            for cond in list(self.geoConditions.values()) + list(self.uvConditions.values()):
+                if cond.selectable:
+                    record[cond.name] = analysis.counts.get(cond.name, 0)
+            bbox = analysis.bbox if analysis.bbox is not None else np.zeros(6)
+            record["minY"] = bbox[1]
+            record["centerX"] = (bbox[0] + bbox[3]) / 2.
+            record["centerZ"] = (bbox[2] + bbox[5]) / 2.
+            record["holes"] = analysis.counts.get("holes", 0)
+            record["uvSets"] = analysis.uvSets
+            record["uvShells"] = analysis.counts.get("uvShells", 0)
+            record["uvCoverage"] = analysis.uvCoverage
+            record["avgNTD"] = analysis.ntdStats.mean
+            record["minNTD"] = analysis.ntdStats.min if analysis.ntdStats.count else 0.
+            record["maxNTD"] = analysis.ntdStats.max if analysis.ntdStats.count else 0.
+            record["varianceNTD"] = analysis.ntdStats.variance()
+            record["stdDevNTD"] = analysis.ntdStats.stdDev()
+            for p in ntdPercentiles:
+                record["p" + str(p) + "NTD"] = analysis.ntdHistogram.percentile(p)
+            records.append(record)
+        return records
+
     def writeHeaderCSV(self, file):
         """Write the CSV header for meshcheck data
 
@@ -159,20 +514,7 @@ class MeshChecker():
         Args:
             file (file): CSV file object to write into. The file must have been opened
         """
-        header = ""
-        # Add conditions
-        for c in self.geoConditions:
-            if header == "":
-                header += ","
-            header += c.name
-        for c in self.uvConditions:
-            if header == "":
-                header += ","
-            header += c.name
-        #header += ","+str(len(self.uvTileSet)) # Tiles used (occupied)
-        # Add bounding box information
-        header += ",minY,centerX,centerZ"
-        file.write(header)
+        file.write(",".join(self.getRecord().keys()))
 
 
     def writeDataCSV(self, file):
@@ -181,24 +523,9 @@ class MeshChecker():
         NOTE: This function does not write end-of-line because some data may be concatenated later. End-of-line is responsibility of the caller
 
         Args:
-            file (_type_): _description_
-        """
-        data_line = ""
-        # Conditions
-        for c in self.geoConditions:
-            if data_line == "":
-                data_line += ","
-            data_line += c.count
-        for c in self.uvConditions:
-            if data_line == "":
-                data_line += ","
-            data_line += c.count
-        #file.write(","+str(len(self.uvTileSet))) # Tiles used
-        # Bounding box
-        data_line += ","+str(self.bbox[1])
-        data_line += ","+str((self.bbox[0] + self.bbox[3]) / 2.)
-        data_line += ","+str((self.bbox[2] + self.bbox[5]) / 2.)
-        file.write(data_line)
+            file (file): CSV file object to write into. The file must have been opened
+        """
+        file.write(",".join(str(v) for v in self.getRecord().values()))
 
     def analyze(self):
         """Analyze the selected objects
@@ -215,39 +542,10 @@ class MeshChecker():
         if not selected_shapes:
             # Nothing to analyze. We're done here
             return
-        self.geoConditions["meshes"].count = len(selected_shapes)
 
         # Select shapes from original selection
         cmds.select(selected_shapes, replace=True)
 
-        # Polygon statistics
-        poly_eval = cmds.polyEvaluate(vertex=True, edge=True, face=True, triangle=True, area=True, worldArea=True, shell=True)
-        self.geoConditions["shells"].count = poly_eval["shell"]
-        self.geoConditions["vertices"].count = poly_eval["vertex"]
-        self.geoConditions["edges"].count = poly_eval["edge"]
-        self.geoConditions["faces"].count = poly_eval["face"]
-        self.geoConditions["area"].count = poly_eval["area"]
-        self.geoConditions["worldArea"].count = poly_eval["worldArea"]
-
-        #print("POLY EVAL: ", poly_eval)
-
-        for s in selected_shapes:
-            #stats.history += historySize(s)
-
-            # Grow the collective BB by adding the BB of each element
-            bbox = cmds.exactWorldBoundingBox(s)
-            for bi in range(0,3):
-                if bbox[bi] < self.bbox[bi]:
-                    self.bbox[bi] = bbox[bi]
-            for bi in range(3,6):
-                if bbox[bi] > self.bbox[bi]:
-                    self.bbox[bi] = bbox[bi]
-
-        # BBox position
-        self.geoConditions["minY"].count = self.bbox[1]
-        self.geoConditions["centerX"].count = (self.bbox[0] + self.bbox[3]) / 2.
-        self.geoConditions["centerZ"].count = (self.bbox[2] + self.bbox[5]) / 2.
-
         # TO-DO: copy checkers implementation from mayaptools
         # Iterate over selected elements
         sel = om.MGlobal.getActiveSelectionList()   # MSelectionList
@@ -256,223 +554,399 @@ class MeshChecker():
             om.MGlobal.displayError("No selection.")
             return
 
-        # Clear the selection (the analyzers will add offending components to selection)
         cmds.select(clear=True)
 
-        print("Selected ", sel.length(), " elements")
-        for i in range(0, sel.length()):
-            # OpenMaya API 2.0
-            dag = sel.getDagPath(i)
-            selected_components = sel.getComponent(i)
-            dag.extendToShape()
+        tracing.event(log, "analyze", selected=sel.length())
+        checks = self.getEnabledChecks()
+        mesh_checks = [ c for c in checks if c.perMesh ]
+        scene_checks = [ c for c in checks if not c.perMesh ]
+        buffers = self.getRequiredBuffers()
+        # Everything affecting the results of a mesh is part of its fingerprint
+        settings = (sorted(c.name for c in mesh_checks), self.degenerateTolerance, self.sliverAspectRatio)
+
+        mesh_results = []
+        contexts = []
+        fingerprints = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.numThreads) as executor:
+            for i in range(0, sel.length()):
+                # OpenMaya API 2.0
+                dag = sel.getDagPath(i)
+                selected_components = sel.getComponent(i)
+                dag.extendToShape()
+
+                if dag.apiType() != om.MFn.kMesh:
+                    om.MGlobal.displayError("Selection must be a polygon mesh.")
+                    continue
+
+                # Pull the mesh arrays needed by the enabled checks once
+                with tracing.timer(log, "getMeshData", mesh=dag.fullPathName(), buffers=sorted(buffers)):
+                    mesh_data = getMeshData(dag, buffers)
+                selected_faces = getSelectedFaces(selected_components[1])
+                fingerprint = mesh_data.fingerprint(om.MFnMesh(dag).numUVSets, selected_faces, settings)
+                context = MeshContext(dag, selected_faces, mesh_data)
+                contexts.append(context)
+                fingerprints.append(fingerprint)
+
+                # Reuse the results of meshes that did not change since last analysis
+                if context.path in self.cache and self.cache[context.path][0] == fingerprint:
+                    tracing.event(log, "cached", mesh=context.path)
+                    mesh_results.append((context, fingerprint, [ (None, r) for r in self.cache[context.path][1] ]))
+                    continue
+
+                # The edge-face incidence (if needed) is built by the first check using it, in the thread pool
+                partial = []
+                for check in mesh_checks:
+                    func = tracing.timed(log, check.name, check.func, mesh=context.path)
+                    if check.threaded:
+                        # Array computations run in the thread pool
+                        partial.append((check, executor.submit(func, self, context)))
+                    else:
+                        # Maya API calls and commands are issued from the main thread
+                        partial.append((check, func(self, context)))
+                mesh_results.append((context, fingerprint, partial))
+
+            # Checks of all the meshes at once (threaded ones are only run again when any mesh changed)
+            scene_key = tuple(zip([ c.path for c in contexts ], fingerprints))
+            scene_results = []
+            for check in scene_checks:
+                cached = self.sceneCache.get(check.name)
+                func = tracing.timed(log, check.name, check.func, meshes=len(contexts))
+                if check.threaded and cached and cached[0] == scene_key:
+                    scene_results.append((check, cached[1]))
+                elif check.threaded:
+                    scene_results.append((check, executor.submit(func, self, contexts)))
+                else:
+                    scene_results.append((check, func(self, contexts)))
+
+            results = []
+            for context, fingerprint, partial in mesh_results:
+                path = context.path
+                partial = [ self.__finishCheck(check, context, res) for check, res in partial ]
+                self.cache[path] = (fingerprint, partial)
+                self.meshResults[path] = functools.reduce(lambda a, b: a.merge(b), partial, meshanalysis.MeshAnalysis())
+                results.extend(partial)
+
+            for check, res in scene_results:
+                if isinstance(res, concurrent.futures.Future):
+                    res = res.result()
+                if check.threaded:
+                    self.sceneCache[check.name] = (scene_key, res)
+                results.append(res)
+                # Components found checking all the meshes at once are also reported per mesh
+                for cond_name, comps in res.components.items():
+                    for path, comp_type, indices in comps:
+                        self.meshResults[path].addComponents(cond_name, path, comp_type, indices)
+
+        analysis = functools.reduce(lambda a, b: a.merge(b), results, meshanalysis.MeshAnalysis())
+        self.__applyAnalysis(analysis)
 
-            self.__analyzeFaces(dag, selected_components)
+        # Restore original selection
+        om.MGlobal.setActiveSelectionList(self.selection)
 
-            self.__analyzeVertices(dag, selected_components)
 
-            self.__analyzeEdges(dag, selected_components)
+    def __finishCheck(self, check, context, res):
+        """Wait for the result of a per-mesh check and complete it in the main thread (check is None for cached results)
+        """
+        if isinstance(res, concurrent.futures.Future):
+            res = res.result()
+        if check is not None and check.finish is not None:
+            with tracing.timer(log, check.name + ".finish", mesh=context.path):
+                check.finish(self, context, res)
+        return res
 
-        # Restore original selection
-        om.MGlobal.setActiveSelectionList(self.selection)
+    def __getCondition(self, cond_name):
+        if cond_name in self.geoConditions:
+            return self.geoConditions[cond_name]
+        return self.uvConditions[cond_name]
 
 
-    def __analyzeFaces(self, dag, selected_components):
+    def __applyAnalysis(self, analysis):
+        """Update the conditions with the (merged) analysis results
 
-        if dag.apiType() != om.MFn.kMesh:
-            om.MGlobal.displayError("Selection must be a polygon mesh.")
-            return
+        Args:
+            analysis (MeshAnalysis): Analysis results
+        """
+        for cond_name, count in analysis.counts.items():
+            self.__getCondition(cond_name).count += count
+        for cond_name, comps in analysis.components.items():
+            cond = self.__getCondition(cond_name)
+            for path, comp_type, indices in comps:
+                cond.addComponents(path, comp_type, indices)
+        for cond_name, elms in analysis.elms.items():
+            self.__getCondition(cond_name).elms.extend(elms)
+
+        if self.uvConditions["uvNaN"].count:
+            log.warning("Invalid UV values (NaN): %d", self.uvConditions["uvNaN"].count)
 
-        # MFnMesh interface
-        mesh = om.MFnMesh(dag)
+        # BBox position
+        if analysis.bbox is not None:
+            self.bbox = analysis.bbox.tolist()
+            self.geoConditions["minY"].count = self.bbox[1]
+            self.geoConditions["centerX"].count = (self.bbox[0] + self.bbox[3]) / 2.
+            self.geoConditions["centerZ"].count = (self.bbox[2] + self.bbox[5]) / 2.
 
         # Report as number of UV sets the maximum number in any mesh
-        self.uvConditions["uvSets"].count = max(self.uvConditions["uvSets"].count, mesh.numUVSets)
-
-        uv_shell_ids = mesh.getUvShellsIds()
-        # First field in the array is the number of UV shells
-        self.uvConditions["uvShells"].count += uv_shell_ids[0]
-
-        # Check UVs
-        faces = cmds.polyListComponentConversion(dag.getPath(), toFace=True)
-
-        # Overlapping UVs
-        overlapping_uvs = cmds.polyUVOverlap(faces, oc=True)
-        if overlapping_uvs:
-            self.uvConditions["uvOverlapping"].count += len(overlapping_uvs)
-            # Add overlapping faces to the bad_faces list
-            for f in overlapping_uvs:
-                self.uvConditions["uvOverlapping"].elms.append(f)
-        else:
-            self.uvConditions["uvOverlapping"].count = 0
+        self.uvConditions["uvSets"].count = analysis.uvSets
+        self.uvConditions["uvCoverage"].count = analysis.uvCoverage
+
+        # Texel density statistics
+        ntd_stats = analysis.ntdStats
+        if ntd_stats.count:
+            self.uvConditions["avgNTD"].count = ntd_stats.mean
+            self.uvConditions["minNTD"].count = ntd_stats.min
+            self.uvConditions["maxNTD"].count = ntd_stats.max
+            self.uvConditions["varianceNTD"].count = ntd_stats.variance()
+            self.uvConditions["stdDevNTD"].count = ntd_stats.stdDev()
+            for p in ntdPercentiles:
+                self.uvConditions["p" + str(p) + "NTD"].count = analysis.ntdHistogram.percentile(p)
+
+        self.uvOverlaps = analysis.uvOverlaps
 
-        if self.uvConditions["uvOverlapping"].count > 0:
-            self.uvConditions["uvOverlapping"].errorLevel = ConditionErrorLevel.ERROR
-        else:
-            self.uvConditions["uvOverlapping"].errorLevel = ConditionErrorLevel.OK
+        # Set error levels
+        for check in self.getEnabledChecks():
+            for cond_name, _, _, _, criteria in check.conditions:
+                if criteria is not None:
+                    self.__getCondition(cond_name).setErrorLevel(criteria)
+        if self.isConditionEnabled("uvCoverage"):
+            if self.uvConditions["uvCoverage"].count < .25:
+                self.uvConditions["uvCoverage"].errorLevel = ConditionErrorLevel.ERROR
+            elif self.uvConditions["uvCoverage"].count < .25:
+                self.uvConditions["uvCoverage"].errorLevel = ConditionErrorLevel.WARN
+            else:
+                self.uvConditions["uvCoverage"].errorLevel = ConditionErrorLevel.OK
 
-        # iterate over the selected faces
-        itFaces = om.MItMeshPolygon(dag, selected_components[1])
 
-        ntd_array = []
-        while not itFaces.isDone():
+def checkPolyStats(checker, contexts):
+    """Polygon statistics of all the meshes (polyEvaluate)
 
-            # UVs stuff (EXPERIMENTAL)
-            if not itFaces.hasUVs() :
-                self.uvConditions["uvMissing"].count += 1
-                self.uvConditions["uvMissing"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-            else:
-                if mesh.isPolygonUVReversed(itFaces.index()):
-                    self.uvConditions["uvFlipped"].count += 1
-                    self.uvConditions["uvFlipped"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-                if itFaces.zeroUVArea() :
-                    # This method is too conservative. Tiny faces are reported as zero area. We'll define our own criteria in min_uv_area
-                    min_uv_area = 1e-8
-                    if itFaces.getUVArea() < min_uv_area:
-                        self.uvConditions["uvZeroArea"].count += 1
-                        self.uvConditions["uvZeroArea"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-                elif itFaces.zeroArea():
-                    pass    # This avoids division by zero in the code below (else) because ws_area is zero in this case
-                else:
-                    self.uvConditions["uvCoverage"].count += itFaces.getUVArea()
-                    ws_area = itFaces.getArea(om.MSpace.kWorld)
-                    ts_area = itFaces.getUVArea()
-                    if ws_area != 0:
-                        ntd = ts_area / ws_area # Normalized texel density (texture size in world space)
-                    else:
-                        ntd = 0.
-                    ntd_array.append( ntd )
-
-                uvs = itFaces.getUVs()
-                if uvs:
-                    the_set = set()
-                    for i in range(len(uvs[0])):
-                        try:
-                            checkUVTile( uvs[0][i], uvs[1][i], the_set )
-                        except ValueError:
-                            self.uvConditions["uvNaN"].count += 1
-                            self.uvConditions["uvNaN"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-                            print("ERROR: Invalid UV values")
-
-                    if len(the_set) > 1:
-                        self.uvConditions["uvCrossingBorders"].count += 1
-                        self.uvConditions["uvCrossingBorders"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-
-            # Get points array for this face
-            point_array = itFaces.getPoints()   # MPointArray
-            vertices_in_face = len(point_array)
-            # Check vertices in the same position (quads only)
-            if len(point_array) == 4:
-                point_set = set()    # Empty set
-                for i in range(0, len(point_array)):
-                    # We accumulate vertex coordinates in a set to automatically remove duplicates
-                    point_coords = ( point_array[i].x, point_array[i].y, point_array[i].z )
-                    point_set.add( point_coords )
-
-                if len(point_set) < 4:
-                    if len(point_set) == 1:
-                        self.geoConditions["quadsToPoints"].count += 1
-                        self.geoConditions["quadsToPoints"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-                        self.geoConditions["zeroAreaQuads"].count += 1
-                        self.geoConditions["zeroAreaQuads"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-                    elif len(point_set) == 2:
-                        self.geoConditions["quadsToLines"].count += 1
-                        self.geoConditions["quadsToLines"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-                        self.geoConditions["zeroAreaQuads"].count += 1
-                        self.geoConditions["zeroAreaQuads"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-                    else:    # 3 different points
-                        self.geoConditions["quadsToTris"].count += 1
-                        self.geoConditions["quadsToTris"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-
-            edge_array = itFaces.getEdges() # MIntArray
-            edges_in_face = len(edge_array)
-
-            if edges_in_face == 3:
-                self.geoConditions["tris"].count += 1
-                self.geoConditions["tris"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-            elif edges_in_face == 4:
-                self.geoConditions["quads"].count += 1
-                self.geoConditions["quads"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
-            else:
-                self.geoConditions["ngons"].count += 1
-                self.geoConditions["ngons"].elms.append(dag.fullPathName()+".f["+str(itFaces.index())+"]")
+    Args:
+        checker (MeshChecker): Mesh checker
+        contexts (MeshContext[]): Meshes
 
-            itFaces.next()
+    Returns:
+        MeshAnalysis: Analysis results
+    """
+    res = meshanalysis.MeshAnalysis()
+    res.addCount("meshes", len(contexts))
+    if not contexts:
+        return res
+    poly_eval = cmds.polyEvaluate([ c.path for c in contexts ], vertex=True, edge=True, face=True, triangle=True, area=True, worldArea=True, shell=True)
+    res.addCount("shells", poly_eval["shell"])
+    res.addCount("vertices", poly_eval["vertex"])
+    res.addCount("edges", poly_eval["edge"])
+    res.addCount("faces", poly_eval["face"])
+    res.addCount("area", poly_eval["area"])
+    res.addCount("worldArea", poly_eval["worldArea"])
+    return res
+
+
+def checkFaceGeometry(checker, context):
+    """Polygon type and degenerated faces
 
-        # Set error levels
-        self.geoConditions["tris"].setErrorLevel(ConditionErrorCriteria.WARN_WHEN_NOT_ZERO)
-        self.geoConditions["ngons"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        self.geoConditions["quadsToPoints"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        self.geoConditions["quadsToLines"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        self.geoConditions["quadsToTris"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        self.geoConditions["zeroAreaQuads"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        self.uvConditions["uvOverlapping"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        self.uvConditions["uvMissing"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        self.uvConditions["uvNaN"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        self.uvConditions["uvFlipped"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        self.uvConditions["uvZeroArea"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        self.uvConditions["uvCrossingBorders"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
-        if self.uvConditions["uvCoverage"].count < .25:
-            self.uvConditions["uvCoverage"].errorLevel = ConditionErrorLevel.ERROR
-        elif self.uvConditions["uvCoverage"].count < .25:
-            self.uvConditions["uvCoverage"].errorLevel = ConditionErrorLevel.WARN
-        else:
-            self.uvConditions["uvCoverage"].errorLevel = ConditionErrorLevel.OK
+    Args:
+        checker (MeshChecker): Mesh checker
+        context (MeshContext): Mesh
 
-        # Compute texel density statistics
-        if ( len(ntd_array) ):
-            self.uvConditions["avgNTD"].count = sum(ntd_array) / len(ntd_array)
-            self.uvConditions["minNTD"].count = min(ntd_array)
-            self.uvConditions["maxNTD"].count = max(ntd_array)
-            self.uvConditions["varianceNTD"].count = sum((x-self.uvConditions["avgNTD"].count)**2 for x in ntd_array) / len(ntd_array)
-            self.uvConditions["stdDevNTD"].count = self.uvConditions["varianceNTD"].count**0.5
+    Returns:
+        MeshAnalysis: Analysis results
+    """
+    return meshanalysis.analyzeFaceGeometry(context.meshData, context.path, context.selectedFaces, checker.degenerateTolerance, checker.sliverAspectRatio)
 
 
-    def __analyzeVertices(self, dag, selected_components):
+def checkTopology(checker, context):
+    """Edges, holes, non-manifold vertices, lamina and duplicated faces and winding
 
-        cmds.select(cmds.polyListComponentConversion(toVertex=True))
+    Args:
+        checker (MeshChecker): Mesh checker
+        context (MeshContext): Mesh
 
-        if dag.apiType() != om.MFn.kMesh:
-            om.MGlobal.displayError("Selection must be a polygon mesh.")
-            return
+    Returns:
+        MeshAnalysis: Analysis results (edge components as indices of MeshTopology.edges, see finishTopology)
+    """
+    return meshtopology.analyzeTopology(context.meshData, context.path, context.selectedFaces, context.getTopology())
 
-        # iterate over the selected verts
-        itVerts = om.MItMeshVertex(dag, selected_components[1])
 
-        while not itVerts.isDone():
-            valence = itVerts.numConnectedEdges()
+def finishTopology(checker, context, res):
+    """Translate the edge components found by checkTopology to Maya edge ids (in the main thread)
 
-            if valence != 4:
-                self.geoConditions["poles"].count += 1
-                self.geoConditions["poles"].elms.append(dag.fullPathName()+".vtx["+str(itVerts.index())+"]")
+    Args:
+        checker (MeshChecker): Mesh checker
+        context (MeshContext): Mesh
+        res (MeshAnalysis): Analysis results of checkTopology (modified)
+    """
+    edge_comps = [ (comps, i) for comps in res.components.values() for i, comp in enumerate(comps) if comp[1] == "e" ]
+    if not edge_comps:
+        return
+    # All the edges at once, so the edges of the mesh are read only once
+    indices = [ np.asarray(comps[i][2], dtype=np.int64) for comps, i in edge_comps ]
+    edge_vertices = context.topology.edges[np.concatenate(indices)]
+    table = None
+    key = context.meshData.topologyFingerprint()
+    cached = checker.edgeTables.get(context.path)
+    if cached and cached[0] == key:
+        table = cached[1]
+    elif len(edge_vertices) > edgeTableFraction * len(context.topology.edges):
+        # Many edges reported: reading all the edges is cheaper than querying each one
+        table = getEdgeTable(context.dag)
+        checker.edgeTables[context.path] = (key, table)
+    edge_ids = getEdgeIds(context.dag, edge_vertices, table)
+    offsets = np.cumsum([ len(ind) for ind in indices ])[:-1]
+    for (comps, i), ids in zip(edge_comps, np.split(edge_ids, offsets)):
+        path, comp_type, _ = comps[i]
+        comps[i] = (path, comp_type, ids)
+
+
+def checkValences(checker, context):
+    """Poles (vertices with a valence other than 4)
 
-            itVerts.next()
+    Args:
+        checker (MeshChecker): Mesh checker
+        context (MeshContext): Mesh
 
-        # Set error levels
-        self.geoConditions["poles"].setErrorLevel(ConditionErrorCriteria.WARN_WHEN_NOT_ZERO)
+    Returns:
+        MeshAnalysis: Analysis results
+    """
+    return meshtopology.analyzeValences(context.meshData, context.path, context.selectedFaces, context.getTopology())
 
 
-    def __analyzeEdges(self, dag, selected_components):
+def checkBoundingBox(checker, context):
+    """World space bounding box (whole mesh, even if only some faces are selected)
 
-        if dag.apiType() != om.MFn.kMesh:
-            om.MGlobal.displayError("Selection must be a polygon mesh.")
-            return
+    Args:
+        checker (MeshChecker): Mesh checker
+        context (MeshContext): Mesh
 
-        # iterate over the selected edges
-        itEdges = om.MItMeshEdge(dag, selected_components[1])
+    Returns:
+        MeshAnalysis: Analysis results
+    """
+    return meshanalysis.analyzeBoundingBox(context.meshData)
 
-        while not itEdges.isDone():
-            
-            num_faces = itEdges.numConnectedFaces()
-        
-            if ( num_faces == 1 ):
-                self.geoConditions["borderEdges"].count += 1
-                self.geoConditions["borderEdges"].elms.append(dag.fullPathName()+".e["+str(itEdges.index())+"]")
-            elif ( num_faces > 2 ):
-                self.geoConditions["evilEdges"].count += 1
-                self.geoConditions["evilEdges"].elms.append(dag.fullPathName()+".e["+str(itEdges.index())+"]")
-        
-            itEdges.next()
 
-        # Set error levels
-        self.geoConditions["borderEdges"].setErrorLevel(ConditionErrorCriteria.WARN_WHEN_NOT_ZERO)
-        self.geoConditions["evilEdges"].setErrorLevel(ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO)
+def checkUVSets(checker, context):
+    """Number of UV sets and UV shells
+
+    Args:
+        checker (MeshChecker): Mesh checker
+        context (MeshContext): Mesh
+
+    Returns:
+        MeshAnalysis: Analysis results
+    """
+    res = meshanalysis.MeshAnalysis()
+
+    # MFnMesh interface
+    mesh = om.MFnMesh(context.dag)
+
+    res.uvSets = mesh.numUVSets
+
+    uv_shell_ids = mesh.getUvShellsIds()
+    # First field in the array is the number of UV shells
+    res.addCount("uvShells", uv_shell_ids[0])
+
+    return res
+
+
+def checkFaceUVs(checker, context):
+    """Missing, invalid, flipped, zero area and crossing UVs, coverage and texel density
+
+    Args:
+        checker (MeshChecker): Mesh checker
+        context (MeshContext): Mesh
+
+    Returns:
+        MeshAnalysis: Analysis results
+    """
+    return meshanalysis.analyzeFaceUVs(context.meshData, context.path, context.selectedFaces)
+
+
+def checkUVOverlaps(checker, contexts):
+    """Find overlapping faces in UV space, inside each mesh and across meshes
+
+    Args:
+        checker (MeshChecker): Mesh checker
+        contexts (MeshContext[]): Meshes
+
+    Returns:
+        MeshAnalysis: Analysis results
+    """
+    res = meshanalysis.MeshAnalysis()
+    paths = [ c.path for c in contexts ]
+    overlaps = uvoverlap.findOverlappingFaces([ c.meshData for c in contexts ])
+    for tile in overlaps:
+        res.uvOverlaps[tile] = { paths[mi]: faces for mi, faces in overlaps[tile].items() }
+    for mi, faces in enumerate(uvoverlap.overlappingFacesPerMesh(overlaps, len(contexts))):
+        res.addComponents("uvOverlapping", paths[mi], "f", faces)
+    return res
+
+
+# Default checks
+registerCheck(MeshCheck("polyStats", "geo", [
+    ("meshes", "Meshes", "Number of meshes in selected elements", False, None),
+    ("shells", "Shells", "Number of shells in selected elements", False, None),
+    ("vertices", "Vertices", "Number of vertices in selected elements", False, None),
+    ("edges", "Edges", "Number of edges in selected elements", False, None),
+    ("faces", "Faces", "Number of faces/polygons in selected elements", False, None),
+    ("area", "Area", "Surface area (object space)", False, None),
+    ("worldArea", "WS Area", "Surface Area (world space)", False, None),
+    ], checkPolyStats, perMesh=False, threaded=False))
+
+registerCheck(MeshCheck("faceGeometry", "geo", [
+    ("quads", "Quads", "Number of quads in selected elements", True, None),
+    ("tris", "Tris", "Number of triangles in selected elements", True, ConditionErrorCriteria.WARN_WHEN_NOT_ZERO),
+    ("ngons", "n-Gons", "Number of n-gons in selected elements", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("quadsToTris", "Quads to tris", "Number of quads degenerated to triangles (two vertices in the same position)", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("quadsToLines", "Quads to lines", "Number of quads degenerated to lines (vertices in two different positions)", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("quadsToPoints", "Quads to points", "Number of quads degenerated to points (all vertices in the same position)", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("zeroAreaQuads", "Zero area quads", "Zero area quads", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("zeroAreaTris", "Zero area tris", "Number of triangles with zero (or near zero) area", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("collapsedNgons", "Collapsed n-gons", "Number of n-gons with vertices in the same position or zero area", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("sliverFaces", "Sliver faces", "Number of faces too thin (aspect ratio above the sliver threshold)", True, ConditionErrorCriteria.WARN_WHEN_NOT_ZERO),
+    ], checkFaceGeometry, [ "faces", "points" ]))
+
+registerCheck(MeshCheck("topology", "geo", [
+    ("borderEdges", "Border edges", "Number of border edges in selected elements", True, ConditionErrorCriteria.WARN_WHEN_NOT_ZERO),
+    ("evilEdges", "Evil edges", "Number of edges sharing more than two faces. Non-manifold geometry", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("inconsistentWinding", "Inconsistent winding", "Number of edges shared by faces with opposite winding (flipped normals)", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("holes", "Holes", "Number of holes (loops of border edges) in selected elements", False, ConditionErrorCriteria.WARN_WHEN_NOT_ZERO),
+    ("nonManifoldVertices", "Non-manifold vertices", "Number of vertices shared by disconnected fans of faces. Non-manifold geometry", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("laminaFaces", "Lamina faces", "Number of faces sharing all their vertices with other face of opposite winding", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("duplicatedFaces", "Duplicated faces", "Number of faces sharing all their vertices with other face of the same winding", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ], checkTopology, [ "faces", "edges" ], finish=finishTopology))
+
+registerCheck(MeshCheck("valences", "geo", [
+    ("poles", "Poles", "Number of poles in selected elements (vertices connecting a number of edges other than 4)", True, ConditionErrorCriteria.WARN_WHEN_NOT_ZERO),
+    ("poles3", "Poles (3)", "Number of vertices connecting 3 edges", True, ConditionErrorCriteria.WARN_WHEN_NOT_ZERO),
+    ("poles5", "Poles (5)", "Number of vertices connecting 5 edges", True, ConditionErrorCriteria.WARN_WHEN_NOT_ZERO),
+    ("poles6", "Poles (6+)", "Number of vertices connecting 6 or more edges", True, ConditionErrorCriteria.WARN_WHEN_NOT_ZERO),
+    ], checkValences, [ "faces", "edges" ]))
+
+registerCheck(MeshCheck("boundingBox", "geo", [
+    ("minY", "Min Y", "Min Y of meshes bounding box", False, None),
+    ("centerX", "Center X", "Center in X axis of meshes bounding box", False, None),
+    ("centerZ", "Center Z", "Center in Z axis of meshes bounding box", False, None),
+    ], checkBoundingBox, [ "worldPoints" ]))
+
+registerCheck(MeshCheck("uvSets", "uv", [
+    ("uvSets", "UV sets", "Number of UV sets in selected elements", False, None),
+    ("uvShells", "UV shells", "Number of UV shells in selected elements", False, None),
+    ], checkUVSets, threaded=False))
+
+registerCheck(MeshCheck("faceUVs", "uv", [
+    ("uvMissing", "UV missing", "Number of face vertices missing UV coordinates", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("uvNaN", "UV NaN", "Number of face vertices with invalid UV values (NaN)", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("uvFlipped", "UV flipped", "Number of faces flipped in UV space", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("uvZeroArea", "UV zero area", "Number of faces occupying zero (or near zero) area in UV space", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("uvCrossingBorders", "UV crossing borders", "Number of faces crossing borders of a tile", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ("uvCoverage", "UV coverage", "Normalized UV coverage of selected elements", False, None),
+    # Normalized Texel Density (NTD)
+    ("avgNTD", "Avg. NTD", "Average normalized texel density", False, None),
+    ("minNTD", "Min. NTD", "Minimum normalized texel density", False, None),
+    ("maxNTD", "Max. NTD", "Maximum normalized texel density", False, None),
+    ("varianceNTD", "Var. NTD", "Variance normalized texel density", False, None),
+    ("stdDevNTD", "Stdev. NTD", "Standard deviation normalized texel density", False, None),
+    ] + [ ("p" + str(p) + "NTD", "P" + str(p) + " NTD", "Percentile " + str(p) + " of normalized texel density (weighted by surface area)", False, None) for p in ntdPercentiles ],
+    checkFaceUVs, [ "faces", "points", "worldPoints", "uvs" ]))
+
+registerCheck(MeshCheck("uvOverlaps", "uv", [
+    ("uvOverlapping", "UV overlaps", "Number of faces overlapped in UV space", True, ConditionErrorCriteria.ERROR_WHEN_NOT_ZERO),
+    ], checkUVOverlaps, [ "faces", "uvs" ], perMesh=False))
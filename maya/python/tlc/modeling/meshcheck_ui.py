@@ -145,11 +145,14 @@ class MeshCheckerUI(qtutils.CheckerWindow):
         self.ui.geoCheckerTableWidget.setRowCount(0)
         self.ui.uvCheckerTableWidget.setRowCount(0)
 
+        # Conditions of disabled checks are not shown
         for cond_name in mesh_checker.geoConditions:
-            self.addConditionChecker(self.ui.geoCheckerTableWidget, mesh_checker.geoConditions[cond_name])
+            if mesh_checker.isConditionEnabled(cond_name):
+                self.addConditionChecker(self.ui.geoCheckerTableWidget, mesh_checker.geoConditions[cond_name])
 
         for cond_name in mesh_checker.uvConditions:
-            self.addConditionChecker(self.ui.uvCheckerTableWidget, mesh_checker.uvConditions[cond_name])
+            if mesh_checker.isConditionEnabled(cond_name):
+                self.addConditionChecker(self.ui.uvCheckerTableWidget, mesh_checker.uvConditions[cond_name])
 
         self.meshChecker = mesh_checker
 
@@ -0,0 +1,288 @@
+"""
+Mesh topology validation.
+
+This module builds the edge-face incidence of a mesh from its face-vertex
+arrays (sorting the edge keys, so it runs in O(n log n)) and checks the
+topology in a single pass: border edges and holes, non-manifold edges and
+vertices, lamina and duplicated faces and inconsistent winding. It works on
+plain arrays (MeshData), so it does not depend on Maya.
+
+Edges are identified by their two vertices. Edge components reported by
+the analysis are indices into MeshTopology.edges, that must be translated
+to the edge numbering of the application before selecting them.
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from tlc.modeling.meshanalysis import MeshAnalysis
+from tlc.modeling.meshanalysis import faceOffsets
+from tlc.modeling.meshanalysis import faceMask
+
+
+def connectedComponents(num, a, b):
+    """Label the connected components of a graph (union-find with pointer jumping)
+
+    Args:
+        num (int): Number of nodes
+        a (int[]): First node of each link
+        b (int[]): Second node of each link
+
+    Returns:
+        int[]: Label of each node (the smallest node index in its component)
+    """
+    parent = np.arange(num, dtype=np.int64)
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    while True:
+        pa = parent[a]
+        pb = parent[b]
+        if np.array_equal(pa, pb):
+            return parent
+        # Hook the root of each component to the smallest root linked to it
+        root = np.minimum(pa, pb)
+        np.minimum.at(parent, pa, root)
+        np.minimum.at(parent, pb, root)
+        # Flatten the trees, so every node points to its root
+        while True:
+            grand_parent = parent[parent]
+            if np.array_equal(grand_parent, parent):
+                break
+            parent = grand_parent
+
+
+class MeshTopology():
+    """Edge-face incidence of a mesh
+
+    Each face vertex (corner) starts an edge going to the next corner of its
+    face. Edges are shared by the corners of different faces going through
+    the same pair of vertices
+    """
+
+    def __init__(self, mesh):
+        """Constructor. Build the edge table from the face-vertex arrays
+
+        Args:
+            mesh (MeshData): Mesh data
+        """
+        counts = mesh.faceVertexCounts
+        indices = mesh.faceVertexIndices
+        offsets = faceOffsets(counts)
+        num_fv = len(indices)
+        self.numVertices = max(mesh.numVertices, int(indices.max()) + 1 if num_fv else 0)
+        """Number of vertices
+        """
+        self.faceVertexFaces = np.repeat(np.arange(len(counts)), counts)
+        """Face of each face vertex
+        """
+        self.nextFaceVertex = np.arange(1, num_fv + 1, dtype=np.int64)
+        """Next face vertex (in the same face) of each face vertex
+        """
+        if num_fv:
+            self.nextFaceVertex[offsets[counts > 0] + counts[counts > 0] - 1] = offsets[counts > 0]
+
+        start = indices
+        end = indices[self.nextFaceVertex]
+        keys = np.minimum(start, end) * self.numVertices + np.maximum(start, end)
+        # Sort face vertices by edge key (a single sort builds the whole edge table)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        first = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])) if num_fv else np.zeros(0, dtype=bool)
+        edge_keys = sorted_keys[first]
+        self.faceVertexEdges = np.empty(num_fv, dtype=np.int64)
+        """Edge starting at each face vertex (index into edges)
+        """
+        self.faceVertexEdges[order] = np.cumsum(first) - 1
+        self.edgeFaceCount = np.diff(np.append(np.flatnonzero(first), num_fv))
+        """Number of faces using each edge
+        """
+        self.edges = np.stack((edge_keys // self.numVertices, edge_keys % self.numVertices), axis=1)
+        """Vertices of each edge (smallest vertex index first)
+        """
+        self.forward = start < end
+        """Each face vertex goes through its edge from its first to its second vertex
+        """
+        self.edgeFaceVertices = order
+        """Face vertices sorted by edge (use edgeOffsets to find the ones of an edge)
+        """
+        self.edgeOffsets = faceOffsets(self.edgeFaceCount)
+        """Offset into edgeFaceVertices of the first face vertex of each edge
+        """
+
+    def numEdges(self):
+        """Number of edges
+
+        Returns:
+            int: Number of edges used by the faces
+        """
+        return len(self.edges)
+
+    def manifoldEdgeCorners(self):
+        """Get the two face vertices of each edge shared by exactly two faces
+
+        Returns:
+            (int[], int[], int[]): Edge indices and the face vertices starting each one in both faces
+        """
+        manifold = np.flatnonzero(self.edgeFaceCount == 2)
+        first = self.edgeOffsets[manifold]
+        return manifold, self.edgeFaceVertices[first], self.edgeFaceVertices[first + 1]
+
+
+def canonicalFaces(mesh, faces):
+    """Canonical form of the faces of the same size, to find faces using the
+    same vertices. The vertex cycle of each face is rotated to start in its
+    smallest vertex and reversed, if needed, so the second vertex is smaller
+    than the last one
+
+    Args:
+        mesh (MeshData): Mesh data
+        faces (int[]): Indices of faces with the same number of vertices
+
+    Returns:
+        (int[][], bool[]): Canonical vertex cycle of each face and whether it was reversed
+    """
+    n = int(mesh.faceVertexCounts[faces[0]])
+    first = faceOffsets(mesh.faceVertexCounts)[faces]
+    cycle = mesh.faceVertexIndices[first[:, None] + np.arange(n)]
+    rows = np.arange(len(faces))[:, None]
+    rotated = cycle[rows, (np.argmin(cycle, axis=1)[:, None] + np.arange(n)) % n]
+    reversed_ = rotated[:, 1] > rotated[:, -1]
+    rotated[reversed_, 1:] = rotated[reversed_, 1:][:, ::-1]
+    return rotated, reversed_
+
+
+def analyzeTopology(mesh, path="", faces=None, topology=None):
+    """Check the topology of a mesh: border edges and holes (border loops),
+    non-manifold edges and vertices, lamina faces (faces using the same
+    vertices with opposite winding), duplicated faces (same vertices and
+    winding) and inconsistent winding (manifold edges traversed in the same
+    direction by both faces)
+
+    Args:
+        mesh (MeshData): Mesh data
+        path (str, optional): DAG path (full path name) of the mesh. Defaults to "".
+        faces (int[], optional): Face indices to analyze. Defaults to all faces.
+        topology (MeshTopology, optional): Edge-face incidence of the mesh. Defaults to building it.
+
+    Returns:
+        MeshAnalysis: Analysis results. Edge components are indices into topology.edges
+    """
+    res = MeshAnalysis()
+    topo = topology if topology is not None else MeshTopology(mesh)
+    counts = mesh.faceVertexCounts
+    indices = mesh.faceVertexIndices
+    face_mask = faceMask(len(counts), faces)
+
+    # Edges and vertices of the faces to analyze
+    fv_mask = face_mask[topo.faceVertexFaces]
+    edge_mask = np.bincount(topo.faceVertexEdges[fv_mask], minlength=topo.numEdges()) > 0
+    vertex_mask = np.bincount(indices[fv_mask], minlength=topo.numVertices) > 0
+
+    # Border and non-manifold edges
+    border = topo.edgeFaceCount == 1
+    res.addComponents("borderEdges", path, "e", np.flatnonzero(border & edge_mask))
+    res.addComponents("evilEdges", path, "e", np.flatnonzero((topo.edgeFaceCount > 2) & edge_mask))
+
+    # Holes: loops of border edges (connected through their vertices)
+    border_edges = topo.edges[border]
+    labels = connectedComponents(topo.numVertices, border_edges[:, 0], border_edges[:, 1])
+    res.addCount("holes", len(np.unique(labels[topo.edges[border & edge_mask][:, 0]])))
+
+    # Inconsistent winding: both faces go through the edge in the same direction
+    manifold, fv1, fv2 = topo.manifoldEdgeCorners()
+    inconsistent = topo.forward[fv1] == topo.forward[fv2]
+    res.addComponents("inconsistentWinding", path, "e", manifold[inconsistent & edge_mask[manifold]])
+
+    # Non-manifold vertices: the corners around the vertex form more than one
+    # fan (corners are linked through the edges shared by exactly two faces)
+    next1 = topo.nextFaceVertex[fv1]
+    next2 = topo.nextFaceVertex[fv2]
+    same_start = indices[fv1] == indices[fv2]
+    corner_a = np.concatenate((fv1, next1))
+    corner_b = np.concatenate((np.where(same_start, fv2, next2), np.where(same_start, next2, fv2)))
+    fans = connectedComponents(len(indices), corner_a, corner_b)
+    # One root corner per fan (the corner labeling it)
+    fan_vertices = indices[np.flatnonzero(fans == np.arange(len(fans)))]
+    fans_per_vertex = np.bincount(fan_vertices, minlength=topo.numVertices)
+    res.addComponents("nonManifoldVertices", path, "vtx", np.flatnonzero((fans_per_vertex > 1) & vertex_mask))
+
+    # Faces using the same vertices (grouped by size)
+    lamina = []
+    duplicated = []
+    for n in np.unique(counts).tolist():
+        if n < 3:
+            continue
+        group = np.flatnonzero(counts == n)
+        cycles, reversed_ = canonicalFaces(mesh, group)
+        _, cycle_ids, cycle_counts = np.unique(cycles, axis=0, return_inverse=True, return_counts=True)
+        cycle_ids = cycle_ids.reshape(-1)
+        shared = cycle_counts[cycle_ids] > 1
+        if not np.any(shared):
+            continue
+        # Faces of a cycle with both windings are lamina. Faces sharing cycle and winding are duplicated
+        reversed_per_cycle = np.bincount(cycle_ids, weights=reversed_, minlength=len(cycle_counts))
+        both_windings = (reversed_per_cycle > 0) & (reversed_per_cycle < cycle_counts)
+        key = cycle_ids * 2 + reversed_
+        same_winding = np.bincount(key, minlength=2 * len(cycle_counts))[key] > 1
+        lamina.append(group[shared & both_windings[cycle_ids]])
+        duplicated.append(group[shared & same_winding])
+    for cond_name, found in (("laminaFaces", lamina), ("duplicatedFaces", duplicated)):
+        found = np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+        res.addComponents(cond_name, path, "f", np.sort(found[face_mask[found]]))
+
+    return res
+
+
+def vertexValences(topology):
+    """Number of edges connected to each vertex
+
+    Args:
+        topology (MeshTopology): Edge-face incidence of the mesh
+
+    Returns:
+        int[]: Valence of each vertex (0 for vertices not used by any face)
+    """
+    return np.bincount(topology.edges.reshape(-1), minlength=topology.numVertices)
+
+
+def analyzeValences(mesh, path="", faces=None, topology=None):
+    """Find poles (vertices connecting a number of edges other than 4),
+    split by valence: 3, 5 and 6 or more
+
+    Args:
+        mesh (MeshData): Mesh data
+        path (str, optional): DAG path (full path name) of the mesh. Defaults to "".
+        faces (int[], optional): Face indices to analyze (their vertices are checked). Defaults to all faces.
+        topology (MeshTopology, optional): Edge-face incidence of the mesh. Defaults to building it.
+
+    Returns:
+        MeshAnalysis: Analysis results
+    """
+    res = MeshAnalysis()
+    topo = topology if topology is not None else MeshTopology(mesh)
+    valences = vertexValences(topo)
+    if faces is None:
+        vertex_mask = np.ones(topo.numVertices, dtype=bool)
+    else:
+        fv_mask = faceMask(len(mesh.faceVertexCounts), faces)[topo.faceVertexFaces]
+        vertex_mask = np.bincount(mesh.faceVertexIndices[fv_mask], minlength=topo.numVertices) > 0
+    res.addComponents("poles", path, "vtx", np.flatnonzero((valences != 4) & vertex_mask))
+    res.addComponents("poles3", path, "vtx", np.flatnonzero((valences == 3) & vertex_mask))
+    res.addComponents("poles5", path, "vtx", np.flatnonzero((valences == 5) & vertex_mask))
+    res.addComponents("poles6", path, "vtx", np.flatnonzero((valences >= 6) & vertex_mask))
+    return res
@@ -0,0 +1,336 @@
+"""
+UV overlap detection.
+
+This module finds faces overlapping in UV space, inside one mesh or across
+several meshes. It works on plain arrays (MeshData), so it does not depend
+on Maya.
+
+The faces are split into triangles. A uniform grid is used as broadphase
+(over the bounding boxes of the triangles, the few boxes too large for the
+grid are swept along X instead) and the candidate pairs are checked with an
+exact triangle-triangle overlap test (separating axis theorem). Triangles
+touching only at their borders are not considered overlapping.
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from tlc.modeling.meshanalysis import faceOffsets
+from tlc.modeling.meshanalysis import fanTriangles
+
+
+defaultTolerance = 1e-7
+"""Penetration (in UV units) below which triangles are considered touching, not overlapping
+"""
+
+maxPairsPerBatch = 4000000
+"""Maximum number of candidate pairs generated at once in the broadphase (limits memory usage)
+"""
+
+maxCellsPerBox = 64
+"""Maximum number of grid cells a box is inserted in. Larger boxes (e.g.
+triangles stretched by stray UVs) are kept out of the grid and paired by
+sweep and prune on X
+"""
+
+
+class UVTriangles():
+    """UV triangles of a collection of meshes (flat arrays)
+    """
+
+    def __init__(self, meshes):
+        """Constructor. Triangulate the UV faces of the meshes
+
+        Args:
+            meshes (MeshData[]): Meshes to triangulate
+        """
+        corners = [ [], [], [], [], [], [] ]
+        mesh_ids = []
+        face_ids = []
+        face_tiles = []
+        for mi, mesh in enumerate(meshes):
+            uv_faces = np.flatnonzero(mesh.uvCounts > 0)
+            uv_counts = mesh.uvCounts[uv_faces]
+            fv_u = mesh.u[mesh.uvIds]
+            fv_v = mesh.v[mesh.uvIds]
+            tri_face, a, b, c = fanTriangles(uv_counts)
+            for i, fv in enumerate((a, b, c)):
+                corners[2 * i].append(fv_u[fv])
+                corners[2 * i + 1].append(fv_v[fv])
+            mesh_ids.append(np.full(len(tri_face), mi, dtype=np.int64))
+            face_ids.append(uv_faces[tri_face])
+            # Faces are assigned to the tile containing their UV centroid
+            if len(uv_faces):
+                offsets = faceOffsets(uv_counts)
+                with np.errstate(invalid="ignore"):
+                    cu = np.add.reduceat(fv_u, offsets) / uv_counts
+                    cv = np.add.reduceat(fv_v, offsets) / uv_counts
+                tiles = np.nan_to_num(np.stack((np.floor(cu), np.floor(cv)), axis=1))[tri_face]
+            else:
+                tiles = np.zeros((0, 2))
+            face_tiles.append(tiles)
+
+        def concat(arrays, dtype):
+            return np.concatenate(arrays).astype(dtype) if arrays else np.zeros(0, dtype=dtype)
+
+        self.ax, self.ay, self.bx, self.by, self.cx, self.cy = [ concat(c, np.float64) for c in corners ]
+        """Coordinates of the three corners of each triangle
+        """
+        self.meshIds = concat(mesh_ids, np.int64)
+        """Index of the mesh of each triangle
+        """
+        self.faceIds = concat(face_ids, np.int64)
+        """Face index (in its mesh) of each triangle
+        """
+        self.tiles = np.concatenate(face_tiles) if face_tiles else np.zeros((0, 2))
+        """UV tile (tu, tv) of the face of each triangle
+        """
+
+    def __len__(self):
+        return len(self.meshIds)
+
+
+def trianglesOverlap(t1, t2, tolerance=defaultTolerance):
+    """Exact overlap test for pairs of 2D triangles (separating axis theorem)
+
+    Args:
+        t1 (float[][6]): First triangle of each pair (ax, ay, bx, by, cx, cy)
+        t2 (float[][6]): Second triangle of each pair (ax, ay, bx, by, cx, cy)
+        tolerance (float, optional): Penetration below which triangles are considered touching. Defaults to defaultTolerance.
+
+    Returns:
+        bool[]: The interiors of the triangles overlap
+    """
+    t1 = np.asarray(t1, dtype=np.float64).reshape(-1, 3, 2)
+    t2 = np.asarray(t2, dtype=np.float64).reshape(-1, 3, 2)
+    overlap = np.ones(len(t1), dtype=bool)
+    for tri in (t1, t2):
+        for i in range(3):
+            edge = tri[:, (i + 1) % 3] - tri[:, i]
+            length = np.sqrt(np.sum(edge * edge, axis=1))
+            length[length == 0] = 1.
+            axis = np.stack((-edge[:, 1], edge[:, 0]), axis=1) / length[:, None]
+            p1 = np.einsum("nkj,nj->nk", t1, axis)
+            p2 = np.einsum("nkj,nj->nk", t2, axis)
+            separated = (p1.max(axis=1) <= p2.min(axis=1) + tolerance) | (p2.max(axis=1) <= p1.min(axis=1) + tolerance)
+            overlap &= ~separated
+    return overlap
+
+
+def _gridPairs(ix0, iy0, nx, ny):
+    """Find pairs of boxes sharing a cell of a uniform grid
+
+    Each pair is generated only once: in the cell containing the maximum of
+    the minimum corners of both boxes
+
+    Args:
+        ix0 (int[]): First cell of each box in X
+        iy0 (int[]): First cell of each box in Y
+        nx (int[]): Number of cells covered by each box in X
+        ny (int[]): Number of cells covered by each box in Y
+
+    Yields:
+        (int[], int[]): Batches of candidate pairs (box indices)
+    """
+    num = len(ix0)
+    if num < 2:
+        return
+    # Insert every box in all the cells it covers
+    cells_per_box = nx * ny
+    box = np.repeat(np.arange(num), cells_per_box)
+    local = np.arange(len(box)) - faceOffsets(cells_per_box)[box]
+    cx = ix0[box] + local % nx[box]
+    cy = iy0[box] + local // nx[box]
+    cx_offset = int(cx.min())
+    cy_offset = int(cy.min())
+    cx -= cx_offset
+    cy -= cy_offset
+    key = cx * (int(cy.max()) + 1) + cy
+    order = np.argsort(key, kind="stable")
+    key = key[order]
+    box = box[order]
+    cx = cx[order]
+    cy = cy[order]
+
+    # Groups of boxes sharing a cell
+    starts = np.flatnonzero(np.concatenate(([True], key[1:] != key[:-1])))
+    sizes = np.diff(np.concatenate((starts, [len(key)])))
+    pairs_per_group = sizes * (sizes - 1) // 2
+    cumulative = np.cumsum(pairs_per_group)
+
+    g0 = 0
+    num_groups = len(starts)
+    while g0 < num_groups:
+        base = cumulative[g0 - 1] if g0 > 0 else 0
+        g1 = int(np.searchsorted(cumulative, base + maxPairsPerBatch, side="right"))
+        g1 = min(max(g1, g0 + 1), num_groups)
+        # Partners of each element: the following elements of its group
+        first_pos = np.arange(starts[g0], starts[g1 - 1] + sizes[g1 - 1])
+        group_end = np.repeat(starts[g0:g1] + sizes[g0:g1], sizes[g0:g1])
+        partners = group_end - first_pos - 1
+        i = np.repeat(first_pos, partners)
+        j = i + 1 + np.arange(len(i)) - faceOffsets(partners)[np.repeat(np.arange(len(partners)), partners)]
+        a = box[i]
+        b = box[j]
+        # Keep the pair only in its reference cell (avoid duplicates)
+        keep = (np.maximum(ix0[a], ix0[b]) == cx[i] + cx_offset) & (np.maximum(iy0[a], iy0[b]) == cy[i] + cy_offset)
+        yield a[keep], b[keep]
+        g0 = g1
+
+
+def _sweepPairs(large, minx, miny, maxx, maxy):
+    """Find the boxes overlapping some (large) boxes, sweeping the boxes sorted by minimum X
+
+    Pairs of two large boxes are generated only once
+
+    Args:
+        large (int[]): Indices of the large boxes
+        minx (float[]): Minimum X of each box
+        miny (float[]): Minimum Y of each box
+        maxx (float[]): Maximum X of each box
+        maxy (float[]): Maximum Y of each box
+
+    Yields:
+        (int[], int[]): Batches of candidate pairs (box indices)
+    """
+    is_large = np.zeros(len(minx), dtype=bool)
+    is_large[large] = True
+    order = np.argsort(minx, kind="stable")
+    sorted_minx = minx[order]
+    batch_a = []
+    batch_b = []
+    batch_size = 0
+    for l in large.tolist():
+        # Boxes starting before the end of the large box, and overlapping it
+        other = order[:np.searchsorted(sorted_minx, maxx[l], side="right")]
+        other = other[(maxx[other] >= minx[l]) & (miny[other] <= maxy[l]) & (maxy[other] >= miny[l])]
+        other = other[~is_large[other] | (other > l)]
+        batch_a.append(np.full(len(other), l, dtype=np.int64))
+        batch_b.append(other)
+        batch_size += len(other)
+        if batch_size >= maxPairsPerBatch:
+            yield np.concatenate(batch_a), np.concatenate(batch_b)
+            batch_a = []
+            batch_b = []
+            batch_size = 0
+    if batch_size:
+        yield np.concatenate(batch_a), np.concatenate(batch_b)
+
+
+def _candidatePairs(minx, miny, maxx, maxy):
+    """Broadphase. Find pairs of boxes which may overlap
+
+    Boxes are inserted in the cells of a uniform grid they cover (see
+    _gridPairs). Boxes covering more than maxCellsPerBox cells are paired
+    by sweep and prune instead (see _sweepPairs), so a single stretched
+    triangle does not fill the whole grid
+
+    Args:
+        minx (float[]): Minimum X of each box
+        miny (float[]): Minimum Y of each box
+        maxx (float[]): Maximum X of each box
+        maxy (float[]): Maximum Y of each box
+
+    Yields:
+        (int[], int[]): Batches of candidate pairs (box indices)
+    """
+    num = len(minx)
+    if num < 2:
+        return
+    # Cell size from the typical size of the boxes
+    extent = np.maximum(maxx - minx, maxy - miny)
+    cell_size = float(np.median(extent)) * 2.
+    if not cell_size > 0.:
+        cell_size = 1.
+    ix0 = np.floor(minx / cell_size).astype(np.int64)
+    iy0 = np.floor(miny / cell_size).astype(np.int64)
+    nx = np.floor(maxx / cell_size).astype(np.int64) - ix0 + 1
+    ny = np.floor(maxy / cell_size).astype(np.int64) - iy0 + 1
+    # Compared as floats, so huge boxes do not overflow the product
+    large = nx.astype(np.float64) * ny > maxCellsPerBox
+    small = np.flatnonzero(~large)
+    for a, b in _gridPairs(ix0[small], iy0[small], nx[small], ny[small]):
+        yield small[a], small[b]
+    if np.any(large):
+        yield from _sweepPairs(np.flatnonzero(large), minx, miny, maxx, maxy)
+
+
+def findOverlappingFaces(meshes, tolerance=defaultTolerance):
+    """Find faces overlapping in UV space (in the current UV set of each
+    mesh data), inside each mesh and across meshes
+
+    Args:
+        meshes (MeshData[]): Meshes to check
+        tolerance (float, optional): Penetration below which faces are considered touching. Defaults to defaultTolerance.
+
+    Returns:
+        dict: Map of UV tile (tu, tv) to a map of mesh index to sorted overlapping face indices
+    """
+    tris = UVTriangles(meshes)
+
+    minx = np.minimum(np.minimum(tris.ax, tris.bx), tris.cx)
+    maxx = np.maximum(np.maximum(tris.ax, tris.bx), tris.cx)
+    miny = np.minimum(np.minimum(tris.ay, tris.by), tris.cy)
+    maxy = np.maximum(np.maximum(tris.ay, tris.by), tris.cy)
+    # Discard degenerated triangles (zero area or invalid values). They cannot overlap anything
+    area2 = (tris.bx - tris.ax) * (tris.cy - tris.ay) - (tris.cx - tris.ax) * (tris.by - tris.ay)
+    with np.errstate(invalid="ignore"):
+        valid = np.flatnonzero(np.abs(area2) > tolerance * tolerance)
+
+    coords = np.stack((tris.ax, tris.ay, tris.bx, tris.by, tris.cx, tris.cy), axis=1)
+    overlapping = np.zeros(len(tris), dtype=bool)
+    for a, b in _candidatePairs(minx[valid], miny[valid], maxx[valid], maxy[valid]):
+        a = valid[a]
+        b = valid[b]
+        # Triangles of the same face do not overlap each other
+        same_face = (tris.meshIds[a] == tris.meshIds[b]) & (tris.faceIds[a] == tris.faceIds[b])
+        boxes_overlap = (minx[a] < maxx[b] - tolerance) & (minx[b] < maxx[a] - tolerance) & (miny[a] < maxy[b] - tolerance) & (miny[b] < maxy[a] - tolerance)
+        test = ~same_face & boxes_overlap
+        a = a[test]
+        b = b[test]
+        hit = trianglesOverlap(coords[a], coords[b], tolerance)
+        overlapping[a[hit]] = True
+        overlapping[b[hit]] = True
+
+    result = dict()
+    hits = np.flatnonzero(overlapping)
+    for mi in np.unique(tris.meshIds[hits]).tolist():
+        mesh_hits = hits[tris.meshIds[hits] == mi]
+        tiles = tris.tiles[mesh_hits]
+        for tile in np.unique(tiles, axis=0):
+            in_tile = np.all(tiles == tile, axis=1)
+            tile_key = (int(tile[0]), int(tile[1]))
+            result.setdefault(tile_key, dict())[mi] = np.unique(tris.faceIds[mesh_hits[in_tile]])
+    return result
+
+
+def overlappingFacesPerMesh(overlaps, numMeshes):
+    """Gather the overlapping faces of each mesh from all the tiles
+
+    Args:
+        overlaps (dict): Result of findOverlappingFaces
+        numMeshes (int): Number of meshes
+
+    Returns:
+        int[][]: Sorted overlapping face indices of each mesh
+    """
+    per_mesh = [ [] for _ in range(numMeshes) ]
+    for tile in overlaps:
+        for mi, faces in overlaps[tile].items():
+            per_mesh[mi].append(faces)
+    return [ np.unique(np.concatenate(f)) if f else np.zeros(0, dtype=np.int64) for f in per_mesh ]
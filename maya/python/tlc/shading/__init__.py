@@ -1,4 +1,9 @@
 """Shading/Texturing/Surfacing/Lookdev Tools
 """
+from . import imageheader
+from . import texturememory
+from . import texturecache
+from . import texelsperpixel
+from . import visibility
 from . import textureanalyzer
 from . import textureanalyzer_ui
@@ -0,0 +1,472 @@
+"""
+Image file header reader.
+
+This module gets the properties of image files (resolution, channels, bit
+depth, tiling and mipmaps...) reading only their headers (usually the
+first few KB), without loading the images nor depending on Maya. Supported
+formats: PNG, JPEG, TIFF (and .tx, tiled TIFF with mipmaps), OpenEXR,
+Radiance HDR and TGA.
+
+It can be run as an standalone script to list the properties of the images
+in files or directories:
+
+    python imageheader.py <file or directory> ...
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import sys
+import math
+import struct
+
+
+class ImageInfo():
+    """Properties of an image file read from its header
+    """
+
+    def __init__(self, fmt):
+        self.format = fmt
+        """File format (png, jpeg, tiff, tx, exr, hdr, tga)
+        """
+        self.width = 0
+        self.height = 0
+        self.channels = 0
+        """Number of channels (including alpha)
+        """
+        self.bitDepth = 8
+        """Bits per channel (of the largest channel)
+        """
+        self.sampleFormat = "uint"
+        """Sample format of the channels: uint, half or float
+        """
+        self.colorType = ""
+        """Color type: Gray, GrayAlpha, RGB, RGBA, Palette, YCbCr, CMYK...
+        """
+        self.hasAlpha = False
+        self.tiled = False
+        self.tileWidth = 0
+        self.tileHeight = 0
+        self.mipLevels = 1
+        """Number of resolution levels stored in the file (1 when no mipmaps)
+        """
+        self.compression = ""
+
+    def bytesPerPixel(self):
+        """Size of a pixel of the (decoded) image
+
+        Returns:
+            float: Bytes per pixel
+        """
+        return self.channels * self.bitDepth / 8.
+
+    def pixelFormat(self):
+        """Readable pixel format (e.g. "RGBA 16-bit half")
+
+        Returns:
+            str: Pixel format
+        """
+        return self.colorType + " " + str(self.bitDepth) + "-bit " + self.sampleFormat
+
+    def toDict(self):
+        return dict(vars(self))
+
+    @staticmethod
+    def fromDict(values):
+        """Build an ImageInfo object from the values returned by toDict
+        """
+        info = ImageInfo(values.get("format", ""))
+        for k, v in values.items():
+            if hasattr(info, k):
+                setattr(info, k, v)
+        return info
+
+
+def _mipLevels(width, height, roundUp=False):
+    """Number of levels of a full mipmap chain
+    """
+    size = max(width, height, 1)
+    if roundUp:
+        return int(math.ceil(math.log2(size))) + 1
+    return int(math.floor(math.log2(size))) + 1
+
+
+def _readPNG(f):
+    f.seek(8)
+    info = ImageInfo("png")
+    palette_alpha = False
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            break
+        length, chunk_type = struct.unpack(">I4s", chunk)
+        if chunk_type == b"IHDR":
+            data = f.read(13)
+            info.width, info.height, depth, color, compression, filtering, interlace = struct.unpack(">IIBBBBB", data)
+            info.bitDepth = depth
+            info.colorType, info.channels = { 0: ("Gray", 1), 2: ("RGB", 3), 3: ("Palette", 3),
+                                              4: ("GrayAlpha", 2), 6: ("RGBA", 4) }.get(color, ("", 0))
+            if color == 3:
+                # Palette entries are 8-bit RGB
+                info.bitDepth = 8
+            info.hasAlpha = color in (4, 6)
+            info.compression = "deflate"
+            f.seek(4, 1)
+        elif chunk_type == b"tRNS":
+            # Transparency of palette or gray/RGB images
+            palette_alpha = True
+            break
+        elif chunk_type in (b"IDAT", b"IEND"):
+            break
+        else:
+            f.seek(length + 4, 1)
+    if palette_alpha:
+        info.hasAlpha = True
+        info.channels += 1
+        info.colorType = info.colorType + "Alpha" if info.colorType != "RGB" else "RGBA"
+    return info if info.width else None
+
+
+def _readJPEG(f):
+    f.seek(2)
+    info = ImageInfo("jpeg")
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        if code == 0xFF:
+            # Fill byte
+            f.seek(-1, 1)
+            continue
+        if code in (0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7):
+            # Markers without segment
+            continue
+        if code in (0xD9, 0xDA):
+            # End of image or start of scan before any frame header
+            return None
+        length = struct.unpack(">H", f.read(2))[0]
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            # Start of frame
+            depth, height, width, components = struct.unpack(">BHHB", f.read(6))
+            info.width = width
+            info.height = height
+            info.bitDepth = depth
+            info.channels = components
+            info.colorType = { 1: "Gray", 3: "YCbCr", 4: "CMYK" }.get(components, "")
+            info.compression = "jpeg-lossless" if code in (0xC3, 0xC7, 0xCB, 0xCF) else "jpeg"
+            return info
+        f.seek(length - 2, 1)
+
+
+_tiffTypeSizes = { 1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 6: 1, 7: 1, 8: 2, 9: 4, 10: 8, 11: 4, 12: 8, 16: 8, 17: 8, 18: 8 }
+_tiffTypeFormats = { 1: "B", 3: "H", 4: "I", 6: "b", 8: "h", 9: "i", 16: "Q", 17: "q", 18: "Q" }
+_tiffTags = { 256, 257, 258, 259, 262, 277, 322, 323, 338, 339 }
+"""Tags read: width, height, bits per sample, compression, photometric interpretation,
+samples per pixel, tile width, tile height, extra samples and sample format
+"""
+_tiffCompressions = { 1: "none", 5: "lzw", 7: "jpeg", 8: "deflate", 32773: "packbits", 32946: "deflate", 34925: "lzma", 50000: "zstd" }
+
+
+def _readTIFF(f, fmt):
+    f.seek(0)
+    header = f.read(16)
+    order = "<" if header[:2] == b"II" else ">"
+    magic = struct.unpack(order + "H", header[2:4])[0]
+    if magic == 43:
+        # BigTIFF
+        offset = struct.unpack(order + "Q", header[8:16])[0]
+        count_format, entry_format, offset_format, inline_size = "Q", "HHQ", "Q", 8
+    else:
+        offset = struct.unpack(order + "I", header[4:8])[0]
+        count_format, entry_format, offset_format, inline_size = "H", "HHI", "I", 4
+    count_size = struct.calcsize(count_format)
+    entry_size = struct.calcsize(order + entry_format) + inline_size
+    offset_size = struct.calcsize(offset_format)
+
+    def readValues(entry):
+        tag, value_type, count = struct.unpack(order + entry_format, entry[:entry_size - inline_size])
+        value_format = _tiffTypeFormats.get(value_type)
+        if value_format is None or tag not in _tiffTags:
+            # Strip/tile offsets and other large arrays are not read
+            return tag, []
+        size = _tiffTypeSizes[value_type] * count
+        if size <= inline_size:
+            data = entry[entry_size - inline_size:entry_size - inline_size + size]
+        else:
+            data_offset = struct.unpack(order + offset_format, entry[entry_size - inline_size:])[0]
+            position = f.tell()
+            f.seek(data_offset)
+            data = f.read(size)
+            f.seek(position)
+        return tag, list(struct.unpack(order + value_format * count, data))
+
+    # Image file directories (IFD). All the properties are taken from the first
+    # (full resolution) image, next ones smaller than the previous are mipmaps
+    tags = None
+    levels = 0
+    last_width = None
+    visited = set()
+    while offset and offset not in visited:
+        visited.add(offset)
+        f.seek(offset)
+        num_entries = struct.unpack(order + count_format, f.read(count_size))[0]
+        entries = f.read(num_entries * entry_size)
+        ifd_tags = dict()
+        for i in range(num_entries):
+            tag, values = readValues(entries[i * entry_size:(i + 1) * entry_size])
+            ifd_tags[tag] = values
+        width = ifd_tags.get(256, [ 0 ])[0]
+        if tags is None:
+            tags = ifd_tags
+            levels = 1
+        elif width and width < last_width:
+            levels += 1
+        else:
+            # Other pages of multi-page files
+            break
+        last_width = width
+        f.seek(offset + count_size + num_entries * entry_size)
+        data = f.read(offset_size)
+        if len(data) < offset_size:
+            break
+        offset = struct.unpack(order + offset_format, data)[0]
+
+    if not tags or 256 not in tags or 257 not in tags:
+        return None
+    info = ImageInfo(fmt)
+    info.width = tags[256][0]
+    info.height = tags[257][0]
+    info.channels = tags.get(277, [ 1 ])[0]
+    info.bitDepth = max(tags.get(258, [ 1 ]))
+    info.sampleFormat = { 1: "uint", 2: "int", 3: "float" }.get(tags.get(339, [ 1 ])[0], "uint")
+    if info.sampleFormat == "float" and info.bitDepth == 16:
+        info.sampleFormat = "half"
+    photometric = tags.get(262, [ 2 ])[0]
+    extra_samples = tags.get(338, [])
+    info.hasAlpha = bool(extra_samples) and extra_samples[0] in (1, 2)
+    if photometric in (0, 1):
+        info.colorType = "GrayAlpha" if info.hasAlpha else "Gray"
+    elif photometric == 2:
+        info.colorType = "RGBA" if info.hasAlpha else "RGB"
+    else:
+        info.colorType = { 3: "Palette", 5: "CMYK", 6: "YCbCr" }.get(photometric, "")
+    info.compression = _tiffCompressions.get(tags.get(259, [ 1 ])[0], str(tags.get(259, [ 1 ])[0]))
+    if 322 in tags and 323 in tags:
+        info.tiled = True
+        info.tileWidth = tags[322][0]
+        info.tileHeight = tags[323][0]
+    info.mipLevels = max(levels, 1)
+    return info
+
+
+_exrPixelTypes = { 0: ("uint", 32), 1: ("half", 16), 2: ("float", 32) }
+_exrCompressions = [ "none", "rle", "zips", "zip", "piz", "pxr24", "b44", "b44a", "dwaa", "dwab" ]
+
+
+def _readEXR(f):
+    f.seek(4)
+    version = struct.unpack("<I", f.read(4))[0]
+    info = ImageInfo("exr")
+    # Single part tiled flag (multipart files have a "tiles" attribute in the headers of tiled parts)
+    info.tiled = bool(version & 0x200)
+    data = f.read(65536)
+    pos = 0
+
+    def readString():
+        nonlocal pos
+        end = data.index(b"\0", pos)
+        text = data[pos:end].decode("latin-1")
+        pos = end + 1
+        return text
+
+    channels = []
+    level_mode = 0
+    round_up = False
+    while pos < len(data):
+        name = readString()
+        if not name:
+            # End of the header (of the first part in multipart files)
+            break
+        readString()   # attribute type
+        size = struct.unpack("<i", data[pos:pos + 4])[0]
+        pos += 4
+        value = data[pos:pos + size]
+        pos += size
+        if name == "channels":
+            p = 0
+            while p < len(value) and value[p] != 0:
+                end = value.index(b"\0", p)
+                channel_name = value[p:end].decode("latin-1")
+                pixel_type = struct.unpack("<i", value[end + 1:end + 5])[0]
+                channels.append((channel_name, pixel_type))
+                p = end + 1 + 16
+        elif name == "dataWindow":
+            x_min, y_min, x_max, y_max = struct.unpack("<iiii", value)
+            info.width = x_max - x_min + 1
+            info.height = y_max - y_min + 1
+        elif name == "tiles":
+            info.tiled = True
+            info.tileWidth, info.tileHeight, mode = struct.unpack("<IIB", value)
+            level_mode = mode & 0x0F
+            round_up = bool(mode >> 4)
+        elif name == "compression":
+            info.compression = _exrCompressions[value[0]] if value[0] < len(_exrCompressions) else str(value[0])
+
+    if not channels or not info.width:
+        return None
+    info.channels = len(channels)
+    sample_format, info.bitDepth = max((_exrPixelTypes.get(t, ("half", 16)) for n, t in channels), key=lambda x: x[1])
+    info.sampleFormat = sample_format
+    names = [ n.split(".")[-1] for n, t in channels ]
+    info.hasAlpha = "A" in names
+    if set(names) >= { "R", "G", "B" }:
+        info.colorType = "RGBA" if info.hasAlpha else "RGB"
+    elif "Y" in names:
+        info.colorType = "GrayAlpha" if info.hasAlpha else "Gray"
+    else:
+        info.colorType = "".join(names)
+    if level_mode == 1:
+        info.mipLevels = _mipLevels(info.width, info.height, round_up)
+    elif level_mode == 2:
+        # Ripmaps: levels in each direction (counted as the longest chain)
+        info.mipLevels = _mipLevels(info.width, info.height, round_up)
+    return info
+
+
+def _readHDR(f):
+    f.seek(0)
+    data = f.read(8192)
+    lines = data.split(b"\n")
+    info = ImageInfo("hdr")
+    # Header lines until an empty line, followed by the resolution string (e.g. "-Y 512 +X 1024")
+    for i, line in enumerate(lines):
+        if line.strip() == b"" and i + 1 < len(lines):
+            tokens = lines[i + 1].split()
+            if len(tokens) != 4:
+                return None
+            sizes = { tokens[0][1:]: int(tokens[1]), tokens[2][1:]: int(tokens[3]) }
+            info.width = sizes.get(b"X", 0)
+            info.height = sizes.get(b"Y", 0)
+            break
+        if line.startswith(b"FORMAT="):
+            info.colorType = "XYZ" if b"xyze" in line else "RGB"
+    if not info.width:
+        return None
+    # Stored as RGBE (4 bytes per pixel), decoded as float RGB
+    info.colorType = info.colorType or "RGB"
+    info.channels = 3
+    info.bitDepth = 32
+    info.sampleFormat = "float"
+    info.compression = "rle"
+    return info
+
+
+def _readTGA(f):
+    f.seek(0)
+    header = f.read(18)
+    if len(header) < 18:
+        return None
+    id_length, color_map_type, image_type, cm_first, cm_length, cm_depth, x0, y0, width, height, depth, descriptor = \
+        struct.unpack("<BBBHHBHHHHBB", header)
+    if color_map_type not in (0, 1) or image_type not in (1, 2, 3, 9, 10, 11) or not width or not height:
+        return None
+    info = ImageInfo("tga")
+    info.width = width
+    info.height = height
+    alpha_bits = descriptor & 0x0F
+    info.hasAlpha = alpha_bits > 0 or depth == 32
+    if image_type in (1, 9):
+        info.colorType = "Palette"
+        info.channels = 4 if cm_depth == 32 else 3
+        info.hasAlpha = cm_depth == 32
+    elif image_type in (3, 11):
+        info.colorType = "GrayAlpha" if depth == 16 else "Gray"
+        info.channels = 2 if depth == 16 else 1
+        info.hasAlpha = depth == 16
+    else:
+        info.channels = 4 if info.hasAlpha else 3
+        info.colorType = "RGBA" if info.hasAlpha else "RGB"
+    info.compression = "rle" if image_type >= 9 else "none"
+    return info
+
+
+def readImageHeader(path):
+    """Read the properties of an image file from its header
+
+    Args:
+        path (str): Image file path
+
+    Returns:
+        ImageInfo: Image properties (None if the format is not supported or the file cannot be read)
+    """
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        with open(path, "rb") as f:
+            magic = f.read(4)
+            if magic == b"\x89PNG":
+                return _readPNG(f)
+            if magic[:2] == b"\xFF\xD8":
+                return _readJPEG(f)
+            if magic in (b"II*\0", b"MM\0*", b"II+\0", b"MM\0+"):
+                return _readTIFF(f, "tx" if ext == ".tx" else "tiff")
+            if magic == b"\x76\x2F\x31\x01":
+                return _readEXR(f)
+            if magic[:2] == b"#?":
+                return _readHDR(f)
+            if ext in (".tga", ".targa"):
+                # TGA files have no signature at the beginning
+                return _readTGA(f)
+    except (OSError, struct.error, ValueError, IndexError):
+        pass
+    return None
+
+
+imageExtensions = [ ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".tx", ".exr", ".hdr", ".tga" ]
+"""Extensions of the image files supported
+"""
+
+
+def readImageHeadersInDirectory(path):
+    """Read the headers of all the image files in a directory tree
+
+    Args:
+        path (str): Directory path
+
+    Returns:
+        dict: Map of file path to ImageInfo (None for unreadable files)
+    """
+    headers = dict()
+    for root, dirs, files in os.walk(path):
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() in imageExtensions:
+                file_path = os.path.join(root, name)
+                headers[file_path] = readImageHeader(file_path)
+    return headers
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:]:
+        headers = readImageHeadersInDirectory(arg) if os.path.isdir(arg) else { arg: readImageHeader(arg) }
+        for file_path, info in headers.items():
+            if info is None:
+                print(file_path, "(unsupported)")
+            else:
+                print(file_path, info.format, str(info.width) + "x" + str(info.height), info.pixelFormat(),
+                      "tiled " + str(info.tileWidth) + "x" + str(info.tileHeight) if info.tiled else "scanline",
+                      "mips " + str(info.mipLevels), info.compression)
@@ -0,0 +1,376 @@
+"""
+Texels per pixel estimation.
+
+This module estimates the on-screen density of the textures (texels per
+pixel of the rendered image) from a camera. Instead of measuring the
+distance from the camera to the center of each mesh, it samples points on
+the surface of the meshes (area weighted) and projects all of them through
+the camera (matrix, focal length, film aperture and film fit, or the
+orthographic width) in NumPy batches. The size of a pixel in world units is computed at every sample in
+the image, and texels per pixel follow from the texel density of each
+texture.
+
+The samples of each mesh are taken once (in object space, from the mesh at
+the current time) and the sizes of the pixels are cached per mesh, so the
+textures sharing meshes only scale them. Animated transforms are evaluated
+at each frame, deformations are not.
+
+Usage:
+
+    estimator = TexelsPerPixelEstimator("cameraShape1", TexelsPerPixelEstimator.playbackFrames())
+    stats = estimator.meshStats("pCube1", texel_density)
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+import maya.api.OpenMaya as om  # Maya Python API 2.0
+import maya.cmds as cmds
+import tlc.modeling.meshanalysis as meshanalysis
+import tlc.modeling.meshcheck as meshcheck
+
+
+defaultSamples = 256
+"""Number of surface samples per mesh
+"""
+
+defaultPercentiles = (5, 50, 95)
+"""Percentiles reported by default
+"""
+
+FILM_FIT_FILL = 0
+FILM_FIT_HORIZONTAL = 1
+FILM_FIT_VERTICAL = 2
+FILM_FIT_OVERSCAN = 3
+
+
+def sampleSurface(mesh, numSamples=defaultSamples, seed=0):
+    """Random points on the surface of a mesh, distributed by area
+
+    Args:
+        mesh (MeshData): Mesh data (faces, points and world points)
+        numSamples (int, optional): Number of samples. Defaults to defaultSamples.
+        seed (int, optional): Seed of the random generator (so the results are repeatable). Defaults to 0.
+
+    Returns:
+        float[][3]: Sample positions in object space (empty if the mesh has no area)
+    """
+    tri_face, a, b, c = meshanalysis.fanTriangles(mesh.faceVertexCounts)
+    indices = mesh.faceVertexIndices
+    # Triangles are chosen by their world space area (object space may be scaled non uniformly)
+    w0 = mesh.worldPoints[indices[a]]
+    cross = np.cross(mesh.worldPoints[indices[b]] - w0, mesh.worldPoints[indices[c]] - w0)
+    areas = np.sqrt(np.einsum("ij,ij->i", cross, cross))
+    total = areas.sum()
+    if not len(areas) or not np.isfinite(total) or total <= 0.:
+        return np.zeros((0, 3))
+    rng = np.random.default_rng(seed)
+    tri = rng.choice(len(areas), size=numSamples, p=areas / total)
+    # Uniform barycentric coordinates
+    r1 = np.sqrt(rng.random(numSamples))
+    r2 = rng.random(numSamples)
+    p0 = mesh.points[indices[a[tri]]]
+    p1 = mesh.points[indices[b[tri]]]
+    p2 = mesh.points[indices[c[tri]]]
+    return (1. - r1)[:, None] * p0 + (r1 * (1. - r2))[:, None] * p1 + (r1 * r2)[:, None] * p2
+
+
+def worldMatrices(objects, frames):
+    """World matrices of several objects at several frames. The worldMatrix
+    plugs are found once, and all of them are read in the context of each
+    frame (instead of a getAttr per object and frame)
+
+    Args:
+        objects (str[]): DAG node names
+        frames (float[]): Frames (None is the current time)
+
+    Returns:
+        float[][][4][4]: Matrices (frames x objects)
+    """
+    plugs = []
+    for o in objects:
+        sel = om.MSelectionList()
+        sel.add(o)
+        plugs.append(om.MFnDependencyNode(sel.getDependNode(0)).findPlug("worldMatrix", False).elementByLogicalIndex(0))
+    matrices = np.zeros((len(frames), len(objects), 4, 4))
+    for i, f in enumerate(frames):
+        context = om.MDGContext.kNormal if f is None else om.MDGContext(om.MTime(f, om.MTime.uiUnit()))
+        with om.MDGContextGuard(context):
+            for j, plug in enumerate(plugs):
+                matrices[i, j] = np.array(list(om.MFnMatrixData(plug.asMObject()).matrix()), dtype=np.float64).reshape(4, 4)
+    return matrices
+
+
+class CameraView():
+    """Camera parameters at a frame (projection of world space points to the rendered image)
+    """
+
+    def __init__(self, camera, frame=None):
+        """Constructor
+
+        Args:
+            camera (str): Camera (shape or transform) node name
+            frame (float, optional): Frame. Defaults to None (current time).
+        """
+        time_args = {} if frame is None else { "time": frame }
+        self.frame = frame
+        resolution = cmds.listConnections("defaultRenderGlobals.resolution")[0]
+        self.width = cmds.getAttr(resolution + ".width")
+        """Image width in pixels
+        """
+        self.height = cmds.getAttr(resolution + ".height")
+        """Image height in pixels
+        """
+        self.worldMatrix = np.array(cmds.getAttr(camera + ".worldMatrix", **time_args), dtype=np.float64).reshape(4, 4)
+        """Camera to world transformation (row vectors)
+        """
+        self.viewMatrix = np.linalg.inv(self.worldMatrix)
+        """World to camera transformation (row vectors)
+        """
+        self.focalLength = cmds.getAttr(camera + ".focalLength", **time_args)
+        aperture_h = cmds.getAttr(camera + ".horizontalFilmAperture", **time_args) * 25.4   # inches to mm
+        aperture_v = cmds.getAttr(camera + ".verticalFilmAperture", **time_args) * 25.4
+        self.nearClip = cmds.getAttr(camera + ".nearClipPlane", **time_args)
+        self.farClip = cmds.getAttr(camera + ".farClipPlane", **time_args)
+        film_fit = cmds.getAttr(camera + ".filmFit")
+        self.orthographic = bool(cmds.getAttr(camera + ".orthographic"))
+        """Orthographic camera (the size of the pixels does not depend on the depth)
+        """
+        ortho_width = cmds.getAttr(camera + ".orthographicWidth", **time_args)
+        film_aperture_h = aperture_h
+        image_aspect = self.width / float(self.height)
+        if film_fit == FILM_FIT_FILL:
+            film_fit = FILM_FIT_HORIZONTAL if aperture_h / aperture_v < image_aspect else FILM_FIT_VERTICAL
+        elif film_fit == FILM_FIT_OVERSCAN:
+            film_fit = FILM_FIT_VERTICAL if aperture_h / aperture_v < image_aspect else FILM_FIT_HORIZONTAL
+        if film_fit == FILM_FIT_VERTICAL:
+            aperture_h = aperture_v * image_aspect
+        else:
+            aperture_v = aperture_h / image_aspect
+        self.filmWidth = aperture_h
+        """Width of the film back covered by the image (mm)
+        """
+        self.filmHeight = aperture_v
+        """Height of the film back covered by the image (mm)
+        """
+        # The orthographic width spans the horizontal film aperture, and is fitted to the image in the same way
+        self.viewWidth = ortho_width * aperture_h / film_aperture_h
+        """Width of the view covered by the image in world units (orthographic cameras)
+        """
+        self.viewHeight = self.viewWidth * aperture_v / aperture_h
+        """Height of the view covered by the image in world units (orthographic cameras)
+        """
+
+    def unitsPerPixel(self, depth):
+        """Size of a pixel in world units at some depths
+
+        Args:
+            depth (float[]): Distances along the view direction
+
+        Returns:
+            float[]: Pixel widths in world units
+        """
+        if self.orthographic:
+            return np.full(np.shape(depth), self.viewWidth / self.width)
+        return depth * self.filmWidth / (self.focalLength * self.width)
+
+    def project(self, points):
+        """Project points to the image
+
+        Args:
+            points (float[][3]): World space positions (any number of leading dimensions)
+
+        Returns:
+            (float[], float[], float[]): x and y in pixels (origin at the bottom left corner) and depth (distance along the view direction)
+        """
+        return self.projectCamera(points @ self.viewMatrix[:3, :3] + self.viewMatrix[3, :3])
+
+    def projectCamera(self, cam):
+        """Project camera space points to the image
+
+        Args:
+            cam (float[][3]): Camera space positions (any number of leading dimensions)
+
+        Returns:
+            (float[], float[], float[]): x and y in pixels (origin at the bottom left corner) and depth (distance along the view direction)
+        """
+        # Cameras look down their -Z axis
+        depth = -cam[..., 2]
+        if self.orthographic:
+            x = (cam[..., 0] / self.viewWidth + .5) * self.width
+            y = (cam[..., 1] / self.viewHeight + .5) * self.height
+            return x, y, depth
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = (cam[..., 0] * self.focalLength / depth / self.filmWidth + .5) * self.width
+            y = (cam[..., 1] * self.focalLength / depth / self.filmHeight + .5) * self.height
+        return x, y, depth
+
+    def inImage(self, x, y, depth):
+        """Projected points inside the image and the clipping planes
+
+        Returns:
+            bool[]: True for the points seen by the camera
+        """
+        with np.errstate(invalid="ignore"):
+            return (depth >= self.nearClip) & (depth <= self.farClip) & (x >= 0.) & (x < self.width) & (y >= 0.) & (y < self.height)
+
+
+class TexelsPerPixelEstimator():
+    """Texels per pixel of meshes seen from a camera, at one or several frames
+    """
+
+    def __init__(self, camera, frames=None, numSamples=defaultSamples, seed=0, visibility=None):
+        """Constructor
+
+        Args:
+            camera (str): Camera (shape or transform) node name
+            frames (float[], optional): Frames evaluated (e.g. playbackFrames()). Defaults to None (current time only).
+            numSamples (int, optional): Number of surface samples per mesh. Defaults to defaultSamples.
+            seed (int, optional): Seed of the random sampling. Defaults to 0.
+            visibility (visibility.VisibilityEngine, optional): Visibility of the meshes at the same frames (meshes are skipped in the frames they are culled or occluded). Defaults to None.
+        """
+        self.camera = camera
+        self.visibility = visibility
+        self.frames = list(frames) if frames else [ None ]
+        """Frames evaluated (None is the current time)
+        """
+        self.views = [ CameraView(camera, f) for f in self.frames ]
+        """Camera parameters at each frame
+        """
+        self.numSamples = numSamples
+        self.seed = seed
+        self.unitsPerPixel = dict()
+        """Cache of pixel sizes. Map of mesh name to list (one per frame) of arrays with the pixel size (world units) at the visible samples
+        """
+
+    @staticmethod
+    def playbackFrames(step=1.):
+        """Frames of the playback range
+
+        Args:
+            step (float, optional): Frame step. Defaults to 1.
+
+        Returns:
+            float[]: Frames from the start to the end of the playback range
+        """
+        start = cmds.playbackOptions(q=True, minTime=True)
+        end = cmds.playbackOptions(q=True, maxTime=True)
+        return np.arange(start, end + step * .5, step).tolist()
+
+    def samples(self, mesh):
+        """Surface samples of a mesh (object space)
+
+        Args:
+            mesh (str): Mesh (transform or shape) node name
+
+        Returns:
+            float[][3]: Sample positions (empty if the mesh has no faces)
+        """
+        sel = om.MSelectionList()
+        sel.add(mesh)
+        dag = sel.getDagPath(0)
+        try:
+            dag.extendToShape()
+        except:
+            # No shape!
+            return np.zeros((0, 3))
+        if dag.apiType() != om.MFn.kMesh:
+            return np.zeros((0, 3))
+        mesh_data = meshcheck.getMeshData(dag, [ "faces", "worldPoints" ])
+        return sampleSurface(mesh_data, self.numSamples, self.seed)
+
+    def meshUnitsPerPixel(self, mesh):
+        """Pixel sizes at the visible samples of a mesh, per frame (cached)
+
+        Args:
+            mesh (str): Mesh (transform or shape) node name
+
+        Returns:
+            list: Array of pixel sizes (world units) per frame
+        """
+        if mesh in self.unitsPerPixel:
+            return self.unitsPerPixel[mesh]
+        if self.visibility is not None and not self.visibility.isVisible(mesh):
+            # Culled or occluded at every frame (or not tested): no need to sample it
+            self.unitsPerPixel[mesh] = [ np.zeros(0) for _ in self.frames ]
+            return self.unitsPerPixel[mesh]
+        points = self.samples(mesh)
+        result = []
+        if len(points):
+            # Transform the samples of all the frames at once (the matrices already read by the visibility are reused)
+            matrices = self.visibility.worldMatrices(mesh) if self.visibility is not None else None
+            if matrices is None:
+                matrices = worldMatrices([ mesh ], self.frames)[:, 0]
+            world = np.einsum("nj,fjk->fnk", points, matrices[:, :3, :3]) + matrices[:, None, 3, :3]
+            for frame, view, frame_points in zip(self.frames, self.views, world):
+                if self.visibility is not None and not self.visibility.isVisible(mesh, frame):
+                    result.append(np.zeros(0))
+                    continue
+                x, y, depth = view.project(frame_points)
+                visible = view.inImage(x, y, depth)
+                result.append(view.unitsPerPixel(depth[visible]))
+        else:
+            result = [ np.zeros(0) for _ in self.frames ]
+        self.unitsPerPixel[mesh] = result
+        return result
+
+    def meshStats(self, mesh, texelDensity, frame=None, percentiles=defaultPercentiles):
+        """Texels per pixel statistics of a mesh
+
+        Args:
+            mesh (str): Mesh (transform or shape) node name
+            texelDensity (float): Texel density of the texture (texels per world unit)
+            frame (float, optional): Frame (one of self.frames). Defaults to None (all the frames).
+            percentiles (float[], optional): Percentiles computed. Defaults to defaultPercentiles.
+
+        Returns:
+            dict: "min", "max", "percentiles" (map of percentile to value) and "visible"
+                (fraction of the samples seen by the camera). None if the mesh is not visible
+        """
+        upp = self.meshUnitsPerPixel(mesh)
+        if frame is not None:
+            upp = [ upp[self.frames.index(frame)] ]
+        upp = np.concatenate(upp) if upp else np.zeros(0)
+        if not len(upp):
+            return None
+        tpp = texelDensity * upp
+        return {
+            "min": float(tpp.min()),
+            "max": float(tpp.max()),
+            "percentiles": dict(zip(percentiles, np.percentile(tpp, percentiles).tolist())),
+            "visible": len(upp) / float(self.numSamples * (1 if frame is not None else len(self.frames)))
+        }
+
+    def texelsPerPixel(self, meshes, texelDensity, frame=None, percentiles=defaultPercentiles):
+        """Texels per pixel statistics of several meshes (e.g. the meshes using a texture)
+
+        Args:
+            meshes (str[]): Mesh node names
+            texelDensity (float): Texel density of the texture (texels per world unit)
+            frame (float, optional): Frame (one of self.frames). Defaults to None (all the frames).
+            percentiles (float[], optional): Percentiles computed. Defaults to defaultPercentiles.
+
+        Returns:
+            dict: Map of mesh name to statistics (see meshStats) of the visible meshes
+        """
+        stats = dict()
+        for m in meshes:
+            s = self.meshStats(m, texelDensity, frame, percentiles)
+            if s is not None:
+                stats[m] = s
+        return stats
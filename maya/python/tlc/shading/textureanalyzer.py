@@ -25,13 +25,28 @@ this program. If not, see <https://www.gnu.org/licenses/>.
 import tlc.common.miscutils as miscutils
 import tlc.common.naming as naming
 import tlc.common.pipeline as pipeline
+import tlc.common.tracing as tracing
+import tlc.shading.imageheader as imageheader
+import tlc.shading.texturememory as texturememory
+import tlc.shading.texturecache as texturecache
+import tlc.shading.texelsperpixel as texelsperpixel
+import tlc.shading.visibility as visibility
+import tlc.modeling.meshanalysis as meshanalysis
+import tlc.modeling.meshcheck as meshcheck
 import maya.api.OpenMaya as om  # Maya Python API 2.0
 import maya.cmds as cmds
 import math
 import os
+import logging
+import sqlite3
+import queue
+import threading
 from enum import Enum
 
 
+log = tracing.getLogger(__name__)
+
+
 class ImageSource(Enum):
     IMG_SRC_UNKNOWN=0,
     IMG_SRC_OWN=1,
@@ -169,15 +184,302 @@ eightBitFormats = [
     "PNG"
 ]
 
+fileTextureAttrs = {
+    "fileTextureName": "string",
+    "colorSpace": "string",
+    "outSizeX": "float",
+    "outSizeY": "float",
+    "fileHasAlpha": "bool",
+    "alphaIsLuminance": "bool",
+    "uvTilingMode": "int"
+}
+"""Attributes of file nodes read by FileTexture checks (and their types)
+"""
+
+
+normalMapAttrs = {
+    "invertX": "bool",
+    "invertY": "bool",
+    "invertZ": "bool",
+    "tangentSpace": "bool",
+    "colorToSigned": "bool"
+}
+"""Attributes of normal map (aiNormalMap) nodes read by FileTexture checks (and their types)
+"""
+
+
+def prefetchFileTextureAttrs(nodes):
+    """Read the checked attributes (fileTextureAttrs) of several file nodes
+    in a single pass (see prefetchAttrs)
+
+    Args:
+        nodes (str[]): File texture node names
+
+    Returns:
+        dict: Map of node name to a map of attribute name to value
+    """
+    return prefetchAttrs(nodes, fileTextureAttrs)
+
+
+def prefetchAttrs(nodes, attrTypes):
+    """Read some attributes of several nodes in a single pass, through their
+    plugs (OpenMaya) instead of one getAttr command per attribute and node
+
+    Args:
+        nodes (str[]): Node names
+        attrTypes (dict): Map of attribute name to type (string, float, int or bool)
+
+    Returns:
+        dict: Map of node name to a map of attribute name to value
+    """
+    records = dict()
+    if not nodes:
+        return records
+    sel = om.MSelectionList()
+    for n in nodes:
+        sel.add(n)
+    fn = om.MFnDependencyNode()
+    for i, n in enumerate(nodes):
+        fn.setObject(sel.getDependNode(i))
+        record = dict()
+        for attr, attr_type in attrTypes.items():
+            plug = fn.findPlug(attr, False)
+            if attr_type == "string":
+                record[attr] = plug.asString()
+            elif attr_type == "float":
+                record[attr] = plug.asFloat()
+            elif attr_type == "int":
+                record[attr] = plug.asInt()
+            else:
+                record[attr] = plug.asBool()
+        records[n] = record
+    return records
+
+
+_metadataCache = (None, None)
+
+
+def getMetadataCache(project=None):
+    """Get the texture metadata cache of the current project (stored in its
+    cache directory, or in memory if it cannot be written)
+
+    Args:
+        project (str, optional): Project path. Defaults to None (current project).
+
+    Returns:
+        texturecache.TextureMetadataCache: Metadata cache
+    """
+    global _metadataCache
+    if project is None:
+        project = miscutils.getCurrentProject()
+    if _metadataCache[0] != project or _metadataCache[1] is None:
+        cache_dir = project + "/" + naming.DCCProjTopDirs["CACHE"]
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            cache = texturecache.TextureMetadataCache(cache_dir + "/" + texturecache.cacheFileName)
+        except (OSError, sqlite3.Error):
+            log.warning("Texture metadata cache not writable in %s. Using a memory cache", cache_dir)
+            cache = texturecache.TextureMetadataCache()
+        if _metadataCache[1] is not None:
+            _metadataCache[1].close()
+        _metadataCache = (project, cache)
+    return _metadataCache[1]
+
+
+class TexelDensityCache():
+    """Normalized texel density per mesh
+
+    Meshes are shared by all the textures of their shading groups, so the
+    density of each mesh (and UV set) is computed once per scan from its
+    arrays and reused. Entries are keyed by DAG path and UV set, and
+    validated by a fingerprint of the mesh (vertex, face and UV counts and
+    world matrix) queried without pulling the arrays.
+    """
+
+    def __init__(self):
+        self.entries = dict()
+        """Map of (DAG path, UV set) to (fingerprint, normalized texel density)
+        """
+        self.lock = threading.Lock()
+
+    def getNormalizedTexelDensity(self, mesh, uvSet=""):
+        """Get the mean normalized texel density (UV area / world area) of the faces of a mesh
+
+        Args:
+            mesh (str): Mesh (transform or shape) node name
+            uvSet (str, optional): UV set. Defaults to "" (current UV set).
+
+        Returns:
+            float: Mean normalized texel density (None if the mesh has no faces with UVs)
+        """
+        sel = om.MSelectionList()
+        sel.add(mesh)
+        dag = sel.getDagPath(0)
+        try:
+            dag.extendToShape()
+        except:
+            # No shape!
+            return None
+        if dag.apiType() != om.MFn.kMesh:
+            return None
+        fn_mesh = om.MFnMesh(dag)
+        uv_set = uvSet if uvSet else fn_mesh.currentUVSetName()
+        key = (dag.fullPathName(), uv_set)
+        fingerprint = (fn_mesh.numVertices, fn_mesh.numPolygons, fn_mesh.numUVs(uv_set), tuple(dag.inclusiveMatrix()))
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry and entry[0] == fingerprint:
+            return entry[1]
+        mesh_data = meshcheck.getMeshData(dag, [ "faces", "worldPoints", "uvs" ], uv_set)
+        ntd = meshanalysis.normalizedTexelDensities(mesh_data)[0]
+        avg_ntd = float(ntd.mean()) if len(ntd) else None
+        with self.lock:
+            self.entries[key] = (fingerprint, avg_ntd)
+        return avg_ntd
+
+
+class ShadingGraph():
+    """Snapshot of the shading network (connections and node types)
+
+    Built with a few bulk queries (all the nodes with their types and all
+    the connections of the dependency graph nodes) and kept in dicts, so
+    walking the network downstream from every texture does not issue Maya
+    commands. It must be rebuilt when the network changes.
+
+    It also keeps the rest of the scene state read by the texture checks
+    (project, scene file and normal map attributes), so checks working on
+    a snapshot can run outside the main thread
+    """
+
+    def __init__(self):
+        """Constructor. Take the snapshot of the current scene
+        """
+        names_and_types = cmds.ls(showType=True)
+        self.nodeTypes = dict(zip(names_and_types[0::2], names_and_types[1::2]))
+        """Map of node name to node type
+        """
+        self.plugConnections = dict()
+        """Map of plug (node.attribute) to connected plugs (outgoing first)
+        """
+        self.nodeConnections = dict()
+        """Map of node name to plugs connected to any of its attributes
+        """
+        self.shapeParents = dict()
+        """Map of shape node to transform (filled on demand)
+        """
+        self.project = miscutils.getCurrentProject()
+        """Path of the current project
+        """
+        self.sceneName = cmds.file(q=True, sn=True)
+        """Path of the open scene file
+        """
+        self.normalMapAttrs = prefetchAttrs([ n for n, t in self.nodeTypes.items() if t == "aiNormalMap" ], normalMapAttrs)
+        """Map of normal map node name to a map of attribute name to value (see normalMapAttrs)
+        """
+        self.texelDensities = TexelDensityCache()
+        """Normalized texel density of the meshes (shared by the textures of this snapshot)
+        """
+        dag_nodes = set(cmds.ls(dag=True))
+        shading_nodes = [ n for n in self.nodeTypes if n not in dag_nodes ]
+        if not shading_nodes:
+            return
+        for source, destination in ((False, True), (True, False)):
+            conns = cmds.listConnections(shading_nodes, connections=True, plugs=True, source=source, destination=destination) or []
+            for plug, other in zip(conns[0::2], conns[1::2]):
+                self.__addConnection(plug, other)
+                # DAG nodes (e.g. meshes in a shading group) are not queried. Keep both sides of their connections
+                if other.split(".")[0] in dag_nodes:
+                    self.__addConnection(other, plug)
+
+    def __addConnection(self, plug, other):
+        connected = self.plugConnections.setdefault(plug, [])
+        if other not in connected:
+            connected.append(other)
+            self.nodeConnections.setdefault(plug.split(".")[0], []).append(other)
+
+    def nodeType(self, name):
+        """Get the type of a node
+
+        Args:
+            name (str): Node name or plug (node.attribute)
+
+        Returns:
+            str: Node type (None if not found)
+        """
+        return self.nodeTypes.get(name.split(".")[0])
+
+    def getConnectionsThroughAttrs(self, node, outAttrs):
+        """Get the list of connections for the first attribute in the list that has a connection
+
+        Args:
+            node (str): Node name
+            outAttrs (str[]): List of output attributes to check
+
+        Returns:
+            str[]: List of connections for the first attribute with connections
+        """
+        for outAttr in outAttrs:
+            conns = self.plugConnections.get(node + "." + outAttr)
+            if conns:
+                return conns
+        return None
+
+    def getFirstConnectionThroughAttrs(self, node, outAttrs):
+        """Get the first connection for any of the output attributes
+
+        Args:
+            node (str): Node name
+            outAttrs (str): List of output attributes to check
+
+        Returns:
+            str: First connection for any of the output attributes
+        """
+        conns = self.getConnectionsThroughAttrs(node, outAttrs)
+        if conns:
+            node_name = conns[0].split(".")[0]
+            node_type = self.nodeType(node_name)
+            # Nodes to bypass
+            if node_type in nodesToBypass:
+                return self.getFirstConnectionThroughAttrs(node_name, nodesToBypass[node_type])
+            return conns[0]
+        else:
+            return None
+
+    def validMaterial(self, conn):
+        return self.nodeType(conn) in inputConnectionsToMapType
+
+    def getMeshes(self, shadingGroup):
+        """Get the meshes connected to a shading group
+
+        Args:
+            shadingGroup (str): Shading group (shadingEngine) node name
+
+        Returns:
+            str[]: Transform nodes of the meshes
+        """
+        meshes = []
+        for conn in self.nodeConnections.get(shadingGroup, []):
+            shape = conn.split(".")[0]
+            if self.nodeType(shape) != "mesh":
+                continue
+            if shape not in self.shapeParents:
+                self.shapeParents[shape] = cmds.listRelatives(shape, parent=True)[0]
+            if self.shapeParents[shape] not in meshes:
+                meshes.append(self.shapeParents[shape])
+        return meshes
+
+
 class FileTexture():
     """File texture class
     """
 
-    def __init__(self, node):
+    def __init__(self, node, graph=None, attrs=None):
         """Constructor
 
         Args:
             node (str): Texture file node name
+            graph (ShadingGraph, optional): Snapshot of the shading network. Defaults to a new snapshot.
+            attrs (dict, optional): Attribute values of the node (see prefetchFileTextureAttrs). Defaults to reading them.
         """
 
         self.errorMessage = ""
@@ -212,6 +514,12 @@ class FileTexture():
         """
         self.fileFormat = ""
         self.pixelFormat = ""
+        self.imageInfo = None
+        """Properties read from the header of the image file (imageheader.ImageInfo, None if not available)
+        """
+        self.fileSize = 0
+        """Size of the texture file in bytes (0 if not found)
+        """
         self.worldSize = ""
         self.elementID = ""
         self.version = 0
@@ -231,7 +539,7 @@ class FileTexture():
         self.nodeName = node
         """Texture node name
         """
-        self.fullPath = cmds.getAttr( node + ".fileTextureName")
+        self.fullPath = ""
         """Full path of the file texture (including file name)
         """
         self.errors = set()
@@ -243,11 +551,16 @@ class FileTexture():
         self.assetFile = None
         """AssetFile object. Asset file where texture is located
         """
+        self.graph = None
+        """Snapshot of the shading network used in the last check (ShadingGraph)
+        """
 
-        # UDIM (TO-DO)
+        self.udim = False
+        """Texture split in UDIM tiles (UV tiling mode UDIM or <UDIM> token in the path)
+        """
 
         # Perform checks (may be called anytime to update status)
-        self.reCheck()
+        self.reCheck(graph, attrs)
 
 
     def valid(self):
@@ -274,10 +587,13 @@ class FileTexture():
         """
         return "notInProject" in self.errors
 
-    def reCheck(self):
+    def reCheck(self, graph=None, attrs=None):
         """Recheck file texture node
+
+        Args:
+            graph (ShadingGraph, optional): Snapshot of the shading network. Defaults to a new snapshot.
+            attrs (dict, optional): Attribute values of the node (see prefetchFileTextureAttrs). Defaults to reading them.
         """
-        print("================== RECHECKING ================")
         self.errorMessage = ""
         self.pathInProject = ""
         self.fileName = ""
@@ -290,6 +606,8 @@ class FileTexture():
         self.shadingGroup = ""
         self.fileFormat = ""
         self.pixelFormat = ""
+        self.imageInfo = None
+        self.fileSize = 0
         self.worldSize = ""
         self.elementID = ""
         self.version = 0
@@ -306,100 +624,69 @@ class FileTexture():
 
         # nodeName is already set in constructor
 
-        self.fullPath = cmds.getAttr( self.nodeName + ".fileTextureName")
+        self.graph = graph if graph else ShadingGraph()
+        if not attrs:
+            attrs = prefetchFileTextureAttrs([ self.nodeName ])[self.nodeName]
+
+        self.fullPath = attrs["fileTextureName"]
+        self.udim = attrs["uvTilingMode"] == 3 or texturememory.udimToken in self.fullPath
         self.errors = set()
         self.warnings = set()
 
-        self.checkFileTexture()
-        print("Full path: ", self.fullPath)
-        print("Node: ", self.nodeName)
-        print("File name: ", self.fileName)
-        print("Path in project: ", self.pathInProject)
-        print("Format: ", self.fileFormat)
+        with tracing.timer(log, "checkFileTexture", node=self.nodeName):
+            self.checkFileTexture()
 
-        self.colorSpace = cmds.getAttr( self.nodeName + ".colorSpace")
-        print("Color space: ", self.colorSpace)
+        self.colorSpace = attrs["colorSpace"]
 
-        self.resX = int(cmds.getAttr( self.nodeName + ".outSizeX"))
-        self.resY = int(cmds.getAttr( self.nodeName + ".outSizeY"))
-        print("Resolution: ", self.resX, "x", self.resY)
+        if self.imageInfo:
+            # Actual resolution of the file (outSize is only set once Maya loads the image)
+            self.resX = self.imageInfo.width
+            self.resY = self.imageInfo.height
+            self.pixelFormat = self.imageInfo.pixelFormat()
+        else:
+            self.resX = int(attrs["outSizeX"])
+            self.resY = int(attrs["outSizeY"])
 
-        self.mapType = self.checkDestination(self.nodeName)
-        print("Map type: ", self.mapType)
-        print("Target: ", self.target)
-        print("Channel: ", self.channel)
+        with tracing.timer(log, "checkDestination", node=self.nodeName):
+            self.mapType = self.checkDestination(self.nodeName)
         if self.mapType == "unknown":
             self.errors.add("mapType")
 
-        self.checkAlpha()
+        self.checkAlpha(attrs)
 
-        self.shadingGroup = self.checkShadingGroup()
-        print("SG: ", self.shadingGroup)
+        with tracing.timer(log, "checkShadingGroup", node=self.nodeName):
+            self.shadingGroup = self.checkShadingGroup()
 
-        self.assetFile = pipeline.AssetFile()
-        try:
-            self.assetFile.createForOpenScene()
-        except:
-            self.errorMessage += "Scene not compliant with the pipeline\n"
-            self.assetFile = None
+        with tracing.timer(log, "checkAssetFile", node=self.nodeName):
+            self.assetFile = pipeline.AssetFile()
+            try:
+                self.assetFile.createFromPath(self.graph.sceneName)
+            except:
+                self.errorMessage += "Scene not compliant with the pipeline\n"
+                self.assetFile = None
 
-        self.imgSrc = self.getImageSource(False)
-        if self.imgSrc == ImageSource.IMG_SRC_UNKNOWN:
-            self.errorMessage += "Image source unknown\n"
-            self.warnings.add("imgSrc")
-        print("Source: ", imgSrcName[self.imgSrc])
+        with tracing.timer(log, "checkNaming", node=self.nodeName):
+            self.imgSrc = self.getImageSource(False)
+            if self.imgSrc == ImageSource.IMG_SRC_UNKNOWN:
+                self.errorMessage += "Image source unknown\n"
+                self.warnings.add("imgSrc")
 
-        if self.imgSrc != ImageSource.IMG_SRC_UNKNOWN and not self.verifyTextureName(True):
-            self.errors.add("wrongNaming")
+            if self.imgSrc != ImageSource.IMG_SRC_UNKNOWN and not self.verifyTextureName(True):
+                self.errors.add("wrongNaming")
 
-        self.validateColorSpace()
+        with tracing.timer(log, "validateColorSpace", node=self.nodeName):
+            self.validateColorSpace()
     
         if self.throughNormal:
-            self.validateNormalNode()
-
-        print("ERRORS:", self.errors)
-        print("ERR MSGS:", self.errorMessage)
+            with tracing.timer(log, "validateNormalNode", node=self.nodeName):
+                self.validateNormalNode()
 
+        tracing.event(log, "texture", node=self.nodeName, fullPath=self.fullPath, fileName=self.fileName,
+                      pathInProject=self.pathInProject, format=self.fileFormat, colorSpace=self.colorSpace,
+                      resolution=[ self.resX, self.resY ], mapType=self.mapType, target=self.target,
+                      channel=self.channel, shadingGroup=self.shadingGroup, source=imgSrcName[self.imgSrc],
+                      errors=sorted(self.errors), warnings=sorted(self.warnings), errorMessage=self.errorMessage)
 
-    def getConnectionsThroughAttrs(node, outAttrs):
-        """Get the list of connections for the first attribute in the list that has a connection
-
-        Args:
-            node (str): Node name
-            outAttrs (str[]): List of output attributes to check
-
-        Returns:
-            str[]: List of connections for the first attribute with connections
-        """
-        for outAttr in outAttrs:
-            conns = cmds.listConnections(node + "." + outAttr, plugs=True)
-            if conns:
-                return conns
-        return None
-    
-    def getFirstConnectionThroughAttrs(node, outAttrs):
-        """Get the first connection for any of the output attributes
-
-        Args:
-            node (str): Node name
-            outAttrs (str): List of output attributes to check
-
-        Returns:
-            str: First connection for any of the output attributes
-        """
-        conns = FileTexture.getConnectionsThroughAttrs(node, outAttrs)
-        if conns:
-            node_name = conns[0].split(".")[0]
-            node_type = cmds.nodeType(node_name)
-            # Nodes to bypass
-            if node_type in nodesToBypass:
-                return FileTexture.getFirstConnectionThroughAttrs(node_name, nodesToBypass[node_type])
-            return conns[0]
-        else:
-            return None
-
-    def validMaterial(conn):
-        return cmds.nodeType(conn) in inputConnectionsToMapType
 
     def checkDestination(self, node):
         """Check the destination of the texture and return the map type
@@ -414,9 +701,9 @@ class FileTexture():
 
         # Out connection may be outColor OR outAlpha
         outAttrs = [ "outColor", "outColorR", "outColorG", "outColorB" ]
-        conn = FileTexture.getFirstConnectionThroughAttrs(node, outAttrs)
+        conn = self.graph.getFirstConnectionThroughAttrs(node, outAttrs)
         if not conn:
-            conn = FileTexture.getFirstConnectionThroughAttrs(node, ["outAlpha"])
+            conn = self.graph.getFirstConnectionThroughAttrs(node, ["outAlpha"])
             if not conn:
                 self.errorMessage += "Texture is not connected\n"
                 return "unknown"
@@ -424,12 +711,12 @@ class FileTexture():
                 self.throughAlpha = True
 
         # Connected through a projection node
-        if cmds.nodeType(conn) == "projection":
+        if self.graph.nodeType(conn) == "projection":
             node = conn.split(".")[0]
             self.throughProjection = True
-            conn = FileTexture.getFirstConnectionThroughAttrs(node, outAttrs)
+            conn = self.graph.getFirstConnectionThroughAttrs(node, outAttrs)
             if not conn:
-                conn = FileTexture.getFirstConnectionThroughAttrs(node, ["outAlpha"])
+                conn = self.graph.getFirstConnectionThroughAttrs(node, ["outAlpha"])
                 if not conn:
                     self.errorMessage += "Texture projection is not connected\n"
                     return "unknown"
@@ -437,16 +724,16 @@ class FileTexture():
                     self.throughAlpha = True
 
         # Connected through a bump map node        
-        if cmds.nodeType(conn) == "bump2d":
+        if self.graph.nodeType(conn) == "bump2d":
             node = conn.split(".")[0]
             self.throughBump = True
-            conn = FileTexture.getFirstConnectionThroughAttrs(node, ["outNormal"])
+            conn = self.graph.getFirstConnectionThroughAttrs(node, ["outNormal"])
             if not conn:
                 self.errorMessage += "Bump map not connected\n"
                 return "unknown"
 
         # Connected through a normal map node        
-        elif cmds.nodeType(conn) == "aiNormalMap":
+        elif self.graph.nodeType(conn) == "aiNormalMap":
             node = conn.split(".")[0]
             dest_attr = conn.split(".")[1]
             if dest_attr != "input":
@@ -455,26 +742,26 @@ class FileTexture():
 
             self.throughNormal = True
             self.normalNode = node
-            conn = FileTexture.getFirstConnectionThroughAttrs(node, ["outValue"])
+            conn = self.graph.getFirstConnectionThroughAttrs(node, ["outValue"])
             if not conn:
                 self.errorMessage += "Normal map not connected\n"
                 return "unknown"
 
         # Connected through a displacement node
-        elif cmds.nodeType(conn) == "displacementShader":
+        elif self.graph.nodeType(conn) == "displacementShader":
             node = conn.split(".")[0]
             self.throughDisplacement = True
             self.channel = "displacement"
-            conn = FileTexture.getFirstConnectionThroughAttrs(node, ["displacement"])
+            conn = self.graph.getFirstConnectionThroughAttrs(node, ["displacement"])
             if not conn:
                 self.errorMessage += "Displacement shader not connected\n"
                 return "unknown"
             node = conn.split(".")[0]
-            if not cmds.nodeType(node) == "shadingEngine":
+            if not self.graph.nodeType(node) == "shadingEngine":
                 self.errorMessage += "Displacement shader not connected to a Shading Engine/Group\n"
                 return "unknown"
             self.target = node
-            conn = FileTexture.getFirstConnectionThroughAttrs(node, ["surfaceShader"])
+            conn = self.graph.getFirstConnectionThroughAttrs(node, ["surfaceShader"])
             if not conn:
                 self.errorMessage += "Shading group has no surface shader: " + node + "\n"
                 return "unknown"
@@ -482,10 +769,10 @@ class FileTexture():
 
         # Skip nodes until we reach a valid material
 #        while not validMaterial(conn):
-#            conn = FileTexture.getFirstConnectionThroughAttrs(node, ["outValue"])
+#            conn = self.graph.getFirstConnectionThroughAttrs(node, ["outValue"])
 
         # Check destination material
-        if FileTexture.validMaterial(conn):
+        if self.graph.validMaterial(conn):
             self.target = conn.split(".")[0]
             conn_attr = conn.split(".")[1]
             if self.throughBump:
@@ -503,7 +790,7 @@ class FileTexture():
                     self.channel = "normalCamera"
                     return "normal"
             else:
-                material = cmds.nodeType(conn)
+                material = self.graph.nodeType(conn)
                 if conn_attr in inputConnectionsToMapType[material]:
                     self.channel = conn_attr
                     return inputConnectionsToMapType[material][conn_attr]
@@ -515,12 +802,15 @@ class FileTexture():
             return "unknown"
 
 
-    def checkAlpha(self):
-        self.fileHasAlpha = int(cmds.getAttr( self.nodeName + ".fileHasAlpha"))
+    def checkAlpha(self, attrs):
+        if self.imageInfo:
+            self.fileHasAlpha = int(self.imageInfo.hasAlpha)
+        else:
+            self.fileHasAlpha = int(attrs["fileHasAlpha"])
         if not self.throughAlpha:
             return
         if self.throughAlpha and not self.fileHasAlpha:
-            alphaIsLuminance = int(cmds.getAttr(self.nodeName + ".alphaIsLuminance"))
+            alphaIsLuminance = int(attrs["alphaIsLuminance"])
             if not alphaIsLuminance:
                 self.errorMessage += "No alpha in image connected through alpha\n"
                 self.errors.add("alpha")
@@ -535,8 +825,8 @@ class FileTexture():
         if self.mapType == "hdri" or self.mapType == "meshLight" or self.mapType == "areaLight" or not self.target:
             return None
         node = self.target
-        while cmds.nodeType(node) != "shadingEngine":
-            conn = FileTexture.getFirstConnectionThroughAttrs(node, ["outColor"])
+        while self.graph.nodeType(node) != "shadingEngine":
+            conn = self.graph.getFirstConnectionThroughAttrs(node, ["outColor"])
             if not conn:
                 self.errorMessage += "Material not connected to a shading group\n"
                 return None
@@ -552,8 +842,7 @@ class FileTexture():
         """
         if not self.shadingGroup:
             return None
-        meshes = cmds.listConnections(self.shadingGroup, type="mesh")
-        return meshes
+        return self.graph.getMeshes(self.shadingGroup)
 
 
     def checkFileTexture(self):
@@ -577,14 +866,18 @@ class FileTexture():
             self.fileName = os.path.splitext(os.path.basename(self.fullPath))[0]
             self.fileFormat = os.path.basename(self.fullPath).split(".")[-1]
 
-        # Check whether the file is accessible
-        if not os.path.isfile(self.fullPath) or not os.access(self.fullPath, os.R_OK):
+        # Check whether the file is accessible (metadata is reused while the file does not change)
+        metadata = getMetadataCache(self.graph.project).lookup(self.fullPath) if self.fullPath else None
+        if metadata is None:
             self.errors.add("missingFile")
             self.errorMessage += "Texture file not found\n"
             return
 
+        self.fileSize = metadata.size
+        self.imageInfo = metadata.info
+
         # Check whether the texture is inside the sourceimages directory of the current project
-        sourceimages_dir = miscutils.getCurrentProject()+"/"+naming.DCCProjTopDirs["SOURCEIMAGES"]
+        sourceimages_dir = self.graph.project+"/"+naming.DCCProjTopDirs["SOURCEIMAGES"]
         if self.fullPath.startswith(sourceimages_dir):
             path = self.fullPath[len(sourceimages_dir):]
             self.pathInProject = os.path.dirname(path)
@@ -870,10 +1163,10 @@ class FileTexture():
                         self.errors.add("colorSpace")
 
     def validateNormalNode(self):
-        normal_node = self.normalNode
-        inv_x = cmds.getAttr(normal_node + ".invertX")
-        inv_y = cmds.getAttr(normal_node + ".invertY")
-        inv_z = cmds.getAttr(normal_node + ".invertZ")
+        normal_attrs = self.graph.normalMapAttrs[self.normalNode]
+        inv_x = normal_attrs["invertX"]
+        inv_y = normal_attrs["invertY"]
+        inv_z = normal_attrs["invertZ"]
         if self.normalMapType == NormalType.NORMAL_TYPE_GL:
             if inv_x or inv_y or inv_z:
                 self.errors.add("normal")
@@ -882,14 +1175,14 @@ class FileTexture():
             if inv_x or not inv_y or inv_z:
                 self.errors.add("normal")
                 self.errorMessage += "Using DX normal map. Check normal node for correct axis orientation\n"
-        tangent_space = cmds.getAttr(normal_node + ".tangentSpace")
+        tangent_space = normal_attrs["tangentSpace"]
         if not tangent_space:
             self.errors.add("normal")
-            self.errorMessage("Normal map not in tangent space")
-        color_to_signed = cmds.getAttr(normal_node + ".colorToSigned")
+            self.errorMessage += "Normal map not in tangent space\n"
+        color_to_signed = normal_attrs["colorToSigned"]
         if not color_to_signed:
             self.errors.add("normal")
-            self.errorMessage("Normal map not converting color to signed")
+            self.errorMessage += "Normal map not converting color to signed\n"
 
     def fixFilePath(self):
         """Try to fix file path, working on the hypothesis that it is correct
@@ -911,7 +1204,7 @@ class FileTexture():
                 cmds.setAttr(self.nodeName + ".colorSpace", color_space, type="string")
                 return True
             else:
-                print("Texture path not found in current project")
+                log.warning("Texture path not found in current project: %s", self.fullPath)
                 return False
 
     def fixColorSpace(self):
@@ -935,114 +1228,107 @@ class FileTexture():
         self.errors.remove("colorSpace")
         cmds.setAttr(self.nodeName + ".colorSpace", cs, type="string")
 
-    def getNormalizedTexelDensity(self):
-        # --> checking UV density
-        # Save original selection
-        #selection = om.MGlobal.getActiveSelectionList()  # MSelectionList
+    def getNormalizedTexelDensity(self, uvSet=""):
+        """Get the normalized texel density (texture size in world space) of
+        the first mesh using the texture with UVs. Densities are cached per
+        mesh in the shading graph, so textures of the same shading group
+        reuse them (see TexelDensityCache)
 
-        meshes = self.getMeshes()
+        Args:
+            uvSet (str, optional): UV set. Defaults to "" (current UV set of each mesh).
 
-        ntds = []
+        Returns:
+            float: Square root of the mean normalized texel density of the faces (None if unknown)
+        """
+        meshes = self.getMeshes()
         if meshes:
             for m in meshes:
-
-                sel = om.MSelectionList()
-                sel.add(m)
-
-                ntd_avg = []
-
-                for i in range(0, sel.length()):
-                    # OpenMaya API 2.0
-                    dag = sel.getDagPath(i)
-                    selected_components = sel.getComponent(i)
-                    try:
-                        dag.extendToShape()
-                    except:
-                        # No shape!
-                        continue
-                    if dag.apiType() == om.MFn.kMesh:
-                        itFaces = om.MItMeshPolygon(dag, selected_components[1])
-                        ntd_array = []
-                        while not itFaces.isDone():
-                            if itFaces.hasUVs():
-                                if itFaces.zeroArea():
-                                    pass
-                                    # TO-DO: Set error -> wrong UV mapping
-                                    # Avoid division by zero in the code below (else) because ws_area is zero in this case
-                                else:
-                                    ws_area = itFaces.getArea(om.MSpace.kWorld)
-                                    ts_area = itFaces.getUVArea()
-                                    if ws_area != 0:
-                                        ntd = ts_area / ws_area # Normalized texel density (texture size in world space)
-                                    else:
-                                        ntd = 0.
-                                    ntd_array.append( ntd )
-                            itFaces.next()
-
-                        # Compute texel density statistics
-                        if ( len(ntd_array) ):
-                            avgNTD = sum(ntd_array) / len(ntd_array)
-                            minNTD = min(ntd_array)
-                            maxNTD = max(ntd_array)
-                            varianceNTD = sum((x-avgNTD)**2 for x in ntd_array) / len(ntd_array)
-                            stdDevNTD = varianceNTD**0.5
-                            #print("AVgNTD: ", avgNTD)
-                            ntds.append(avgNTD)
-
-            # Restore original selection
-            #om.MGlobal.setActiveSelectionList(selection)  # MSelectionList
-
-
-            # mchecker = tlc.modeling.meshcheck.MeshChecker()
-            # td_text = "unknown"
-            # texel_density = []
-            # if meshes:
-            #     for m in meshes:
-            #         td = mchecker.xxxxxxx
-            #         texel_density.append(td)
-            #     td_text = str(texel_density[0])
-            # cell = self.addTextCell(table_widget, row, col, td_text)
-            # if texel_density:
-            #     cell.setToolTip(texel_density)
-
-        #cell = self.addTextCell(table_widget, row, col, "unknown")
-        if ntds:
-            return math.sqrt(ntds[0])
-        else:
-            return None
+                ntd = self.graph.texelDensities.getNormalizedTexelDensity(m, uvSet)
+                if ntd is not None:
+                    return math.sqrt(ntd)
+        return None
 
 
     def getTexelsPerPixel(self, camera, texel_density):
-        meshes = self.getMeshes()
-        tpp_list = []
-        if meshes:
-            for m in meshes:
-                tpp = 0
-                # check geometry visibility and discard off-screen elements
-                if m not in camera.visibleObjects:   # not_visible
-                    # This mesh is not visible in the camera
-                    continue
-
-                # This is a very rough approximation, we are only considering distance from camera to 
-                # BB center. We could have a better approximation by sampling visible points in the surface
-                # of the geometry (FUTURE DEVELOPMENT). It would be a more expensive approach, however
-
-                # check geometry position (bounding box center? vertices? surface sampling?)
-                geo_center = cmds.objectCenter(m)
-                # distance from camera to geometry
-                distance_vector = [ geo_center[0]-camera.center[0], geo_center[1]-camera.center[1], geo_center[2]-camera.center[2] ]
-                distance = math.sqrt(distance_vector[0]*distance_vector[0]+distance_vector[1]*distance_vector[1]+distance_vector[2]*distance_vector[2])
-                upp = 2 * distance * camera.tanFovH2 / camera.width
-                tpp = texel_density * upp
-                tpp_list.append(tpp)
-        if tpp_list:
-            # Currently taking the maximum value (maybe we could return min/max)
-            return [ min(tpp_list), max(tpp_list) ]
+        """Get the range of texels per pixel of the texture on the meshes seen by a camera
+
+        Args:
+            camera (RenderCamera): Camera
+            texel_density (float): Texel density (texels per world unit)
+
+        Returns:
+            float[2]: Minimum and maximum texels per pixel ([0, 0] if no mesh is visible)
+        """
+        stats = self.getTexelsPerPixelStats(camera, texel_density)
+        if stats:
+            return [ min(s["min"] for s in stats.values()), max(s["max"] for s in stats.values()) ]
         else:
             return [ 0, 0 ]
 
+    def getTexelsPerPixelStats(self, camera, texel_density, frame=None, percentiles=texelsperpixel.defaultPercentiles):
+        """Get the texels per pixel statistics of the texture on each mesh seen by a camera,
+        from points sampled on the surface of the meshes (see texelsperpixel)
+
+        Args:
+            camera (RenderCamera): Camera
+            texel_density (float): Texel density (texels per world unit)
+            frame (float, optional): Frame (one of the frames of the camera). Defaults to None (all the frames).
+            percentiles (float[], optional): Percentiles computed. Defaults to texelsperpixel.defaultPercentiles.
+
+        Returns:
+            dict: Map of mesh name to statistics (see TexelsPerPixelEstimator.meshStats) of the visible meshes
+        """
+        meshes = self.getMeshes()
+        if not meshes:
+            return dict()
+        estimator = camera.getEstimator()
+        if estimator is None:
+            return dict()
+        return estimator.texelsPerPixel(meshes, texel_density, frame, percentiles)
+
+    def getAssets(self):
+        """Get the assets using the texture (top level nodes of the meshes)
+
+        Returns:
+            str[]: List of asset (top level node) names
+        """
+        meshes = self.getMeshes()
+        if not meshes:
+            return []
+        return sorted(set(m.split("|")[1] for m in cmds.ls(meshes, long=True)))
+
+    def getImageInfo(self):
+        """Get the properties of the image, read from the file header or
+        estimated from the node attributes when the header is not available
+
+        Returns:
+            imageheader.ImageInfo: Image properties
+        """
+        if self.imageInfo:
+            return self.imageInfo
+        info = imageheader.ImageInfo(self.fileFormat)
+        info.width = self.resX
+        info.height = self.resY
+        info.hasAlpha = bool(self.fileHasAlpha)
+        info.channels = 4 if self.fileHasAlpha else 3
+        info.colorType = "RGBA" if self.fileHasAlpha else "RGB"
+        return info
+
+    def addToMemoryReport(self, report):
+        """Add the texture to a memory report
+
+        Args:
+            report (texturememory.MemoryReport): Memory report
+
+        Returns:
+            texturememory.TextureMemory: Memory usage of the texture
+        """
+        return report.add(self.nodeName, self.fullPath, self.target, self.getAssets(), self.udim, self.getImageInfo())
+
     def bytesPerPixel(self):
-        # TO-DO : Make a better implementation
+        if self.imageInfo:
+            return self.imageInfo.bytesPerPixel()
+        # Header not available. Assume 8-bit RGB(A)
         num_channels = 3    
         channel_size = 1    # review!
         if self.fileHasAlpha:
@@ -1052,11 +1338,34 @@ class FileTexture():
 
 class RenderCamera():
 
-    def __init__(self, camera_name=""):
+    def __init__(self, camera_name="", frames=None, occlusion=False, objects=None):
+        self.camera = ""
+        self.frames = None
+        """Frames evaluated for visibility and texels per pixel (None is the current time)
+        """
+        self.occlusion = False
+        self.objects = None
+        """Meshes (transform nodes) tested for visibility (None for all the meshes in the scene)
+        """
+        self.visibility = None
+        """Visibility of the meshes (see visibility). Built on the first request (see getEstimator)
+        """
+        self.estimator = None
+        """Texels per pixel estimator (see texelsperpixel). Built on the first request (see getEstimator)
+        """
         if camera_name:
-            self.configure(camera_name)
+            self.configure(camera_name, frames, occlusion, objects)
+
+    def configure(self, camera_name, frames=None, occlusion=False, objects=None):
+        """Set the camera. Only its parameters are read here, the visibility
+        of the meshes is computed when texels per pixel are first requested
 
-    def configure(self, camera_name):
+        Args:
+            camera_name (str): Camera node name
+            frames (float[], optional): Frames evaluated for visibility and texels per pixel (e.g. the playback range). Defaults to None (current time).
+            occlusion (bool, optional): Discard meshes hidden behind others. Defaults to False.
+            objects (str[], optional): Meshes (transform nodes) tested for visibility (e.g. the meshes of the textures). Defaults to None (all the meshes in the scene).
+        """
         if not camera_name:
             return
         self.camera = camera_name
@@ -1067,14 +1376,62 @@ class RenderCamera():
         self.focalLength = cmds.getAttr(self.camera + ".focalLength")
         self.apertureH = cmds.getAttr(self.camera + ".horizontalFilmAperture") * 25.4   # inches to mm
         self.tanFovH2 = (self.apertureH/2.) / self.focalLength
-        self.visibleObjects = self.getVisibleObjects()
+        self.frames = frames
+        self.occlusion = occlusion
+        self.objects = list(objects) if objects is not None else None
+        self.visibility = None
+        self.estimator = None
+
+    def setObjects(self, objects):
+        """Set the meshes tested for visibility. The visibility is computed
+        again on the next request if they changed
+
+        Args:
+            objects (str[]): Meshes (transform nodes). None for all the meshes in the scene
+
+        Returns:
+            bool: True if the meshes changed
+        """
+        objects = list(objects) if objects is not None else None
+        if objects == self.objects:
+            return False
+        self.objects = objects
+        self.visibility = None
+        self.estimator = None
+        return True
+
+    def getEstimator(self):
+        """Get the texels per pixel estimator, computing the visibility of the meshes on the first call
+
+        Returns:
+            texelsperpixel.TexelsPerPixelEstimator: Estimator (None if no camera is set)
+        """
+        if self.estimator is None and self.camera:
+            # Frustum culling (and occlusion) computed from the camera parameters, without using the viewport
+            with tracing.timer(log, "visibility", frames=len(self.frames) if self.frames else 1,
+                               objects=len(self.objects) if self.objects is not None else "all"):
+                self.visibility = visibility.VisibilityEngine(self.camera, self.frames, self.occlusion, objects=self.objects)
+            self.estimator = texelsperpixel.TexelsPerPixelEstimator(self.camera, self.frames, visibility=self.visibility)
+        return self.estimator
+
+    @property
+    def visibleObjects(self):
+        """Meshes seen by the camera in any of the frames (see getVisibleObjects)
+        """
+        return self.getVisibleObjects()
 
-    def getVisibleObjects(self):
-        cmds.lookThru(self.camera)
-        om.MGlobal.selectFromScreen(0, 0, self.width, self.height, om.MGlobal.kReplaceList )
-        selected_geometry = cmds.ls(selection=True)
-        cmds.select(clear=True)
-        return selected_geometry
+    def getVisibleObjects(self, frame=None):
+        """Get the meshes seen by the camera
+
+        Args:
+            frame (float, optional): Frame. Defaults to None (any of the frames configured).
+
+        Returns:
+            str[]: Transform nodes of the visible meshes
+        """
+        if self.getEstimator() is None:
+            return []
+        return self.visibility.visibleObjects(frame)
 
 
 def getAllFileTextureNodesInScene():
@@ -1083,12 +1440,110 @@ def getAllFileTextureNodesInScene():
     Returns:
         str[]: List of FileTexture objects
     """
-    paths = cmds.ls(type="file")
-    file_textures = []
-    for p in paths:
-        t = FileTexture(p)
-        file_textures.append(t)
-    return file_textures
+    # Run the checks in the calling thread
+    scan = TextureScan()
+    scan.run()
+    if scan.error:
+        raise scan.error
+    return scan.takeResults()
+
+
+class TextureScan(threading.Thread):
+    """Check all the file textures in the scene in a worker thread
+
+    The scene state needed by the checks (shading network, attributes...)
+    is read in the constructor, in the main thread, and the checks (file
+    system, image headers and naming) run in the worker thread, producing
+    the FileTexture objects progressively. They are collected with
+    takeResults (e.g. from a callback deferred to the main thread)
+    """
+
+    def __init__(self, notify=None, batchSize=16):
+        """Constructor. Take the snapshot of the scene
+
+        Args:
+            notify (function, optional): Function called from the worker thread when new results are available and when the scan ends. Defaults to None.
+            batchSize (int, optional): Number of textures checked between notifications. Defaults to 16.
+        """
+        super(TextureScan, self).__init__(daemon=True)
+        self.notify = notify
+        self.batchSize = batchSize
+        self.paths = cmds.ls(type="file")
+        # Look again for new .tx files
+        getMetadataCache().refresh()
+        # A single snapshot of the shading network is shared by all the textures
+        with tracing.timer(log, "shadingGraph"):
+            self.graph = ShadingGraph()
+        with tracing.timer(log, "prefetchAttrs", count=len(self.paths)):
+            self.attrs = prefetchFileTextureAttrs(self.paths)
+        self.results = queue.Queue()
+        self.cancelled = threading.Event()
+        self.error = None
+        """Exception raised in the worker thread (if any)
+        """
+        self.finished = False
+        """All the results have been taken (the scan is over)
+        """
+
+    def run(self):
+        try:
+            with tracing.timer(log, "scanTextures", count=len(self.paths)):
+                for i, p in enumerate(self.paths):
+                    if self.cancelled.is_set():
+                        break
+                    self.results.put(FileTexture(p, self.graph, self.attrs[p]))
+                    if self.notify and (i + 1) % self.batchSize == 0:
+                        self.notify()
+        except Exception as e:
+            log.exception("Texture scan failed")
+            self.error = e
+        # New metadata entries are stored in a single transaction per scan
+        getMetadataCache(self.graph.project).flush()
+        # End of results
+        self.results.put(None)
+        if self.notify:
+            self.notify()
+
+    def cancel(self):
+        """Stop the scan (the textures already checked are still returned by takeResults)
+        """
+        self.cancelled.set()
+
+    def takeResults(self, maxResults=0):
+        """Take the textures checked since the last call
+
+        Args:
+            maxResults (int, optional): Maximum number of textures taken. Defaults to 0 (all available).
+
+        Returns:
+            FileTexture[]: List of FileTexture objects
+        """
+        textures = []
+        while not self.finished and (not maxResults or len(textures) < maxResults):
+            try:
+                t = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if t is None:
+                self.finished = True
+            else:
+                textures.append(t)
+        return textures
+
+
+def getTextureMemoryReport(file_textures):
+    """Build the memory report of a list of textures
+
+    Args:
+        file_textures (FileTexture[]): List of FileTexture objects
+
+    Returns:
+        texturememory.MemoryReport: Memory usage per texture, material, asset and scene
+    """
+    report = texturememory.MemoryReport(getMetadataCache().readImageHeader)
+    for t in file_textures:
+        t.addToMemoryReport(report)
+    return report
 
 def checkDuplicatedFileTextureNodes(file_textures):
     new_list = []
@@ -1099,7 +1554,7 @@ def checkDuplicatedFileTextureNodes(file_textures):
         else:
             dup_set.add(t.fullPath)
     if dup_set:
-        print(">>>>> Found ", len(dup_set), "duplicated elements: ", dup_set)
+        tracing.event(log, "duplicatedTextures", level=logging.INFO, count=len(dup_set), paths=sorted(dup_set))
         for t in file_textures:
             if t.fullPath in dup_set:
                 t.duplicate = True
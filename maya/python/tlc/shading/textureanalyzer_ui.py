@@ -33,9 +33,16 @@ from PySide6 import QtUiTools
 from PySide6 import QtGui
 
 import tlc.common.qtutils as qtutils
+import tlc.common.tracing as tracing
 import tlc.shading.textureanalyzer
+import tlc.shading.texturememory
+import tlc.shading.texelsperpixel
 import tlc.modeling.meshcheck
 import maya.cmds as cmds
+import maya.utils
+
+
+log = tracing.getLogger(__name__)
 
 
 def formatUnits(val, units):
@@ -71,397 +78,615 @@ def formatUnitsBinary(val, units):
     return "%.2f" % round(val,2) + " " + symbol + units
 
 
-class TextureAnalyzerUI(qtutils.CheckerWindow):
-    """User interface for TextureAnalyzer
-    
-    This checker is based on the QTableWidget
+textureColumns = [
+    ("node", "Node"),
+    ("status", "Status"),
+    ("dup", "Dup"),
+    ("target", "Target"),
+    ("shadingGroup", "Shading Group"),
+    ("fileName", "File name"),
+    ("projection", "Pjtd"),
+    ("mapType", "Map type"),
+    ("resolution", "Res"),
+    ("colorSpace", "Color space"),
+    ("format", "Format"),
+    ("version", "Ver"),
+    ("source", "Source"),
+    ("elementID", "ElementID"),
+    ("memory", "Memory usage"),
+    ("disk", "Disk usage"),
+    ("tx", ".tx size"),
+    ("texelDensity", "Texel density"),
+    ("tpp", "Texel/pixel"),
+    ("meshes", "Meshes")
+]
+"""Columns of the texture table (name, label)
+"""
 
-    https://doc.qt.io/qtforpython-5/PySide2/QtWidgets/QTableWidget.html
+columnIndex = { c[0]: i for i, c in enumerate(textureColumns) }
+"""Map of column name to column index
+"""
 
-    """
+lazyColumns = [ "texelDensity", "tpp", "meshes" ]
+"""Columns computed only when their cells are shown (they query the meshes)
+"""
 
-    fileTextureObjects = []
+filterColumns = [ "node", "fileName", "target", "shadingGroup", "mapType" ]
+"""Columns matched by the text filter (they must not be lazy)
+"""
 
+CELL_NORMAL = 0
+CELL_OK = 1
+CELL_WARNING = 2
+CELL_ERROR = 3
 
-    def __init__(self, parent=tlc.common.qtutils.getMayaMainWindow()):
-        """Constructor
+cellColors = {
+    CELL_OK: QtCore.Qt.green,
+    CELL_WARNING: QtGui.QColor(255,127,0),   # Orange
+    CELL_ERROR: QtCore.Qt.red
+}
+
+
+class TextureTableModel(QtCore.QAbstractTableModel):
+    """Table model of the checked textures
+
+    Cell values are kept in a columnar store (one list per column of texts,
+    sort keys and states) filled when the textures are added, except for
+    the lazy columns, computed the first time their cells are requested by
+    the view (i.e. when they are visible) or by sorting.
+    """
+
+    def __init__(self, parent=None):
+        super(TextureTableModel, self).__init__(parent)
+        self.textures = []
+        """FileTexture objects (one per row)
         """
-        # .ui file saved from Qt Designer is supposed to be named this way:
-        #   "textureanalyzer_ui.py" --> "textureanalyzer.ui"
-        ui_file = os.path.basename(__file__).split(".")[0].replace("_", ".")
-        title = "Texture analyzer"
-        super(TextureAnalyzerUI, self).__init__(os.path.dirname(__file__) + "/" + ui_file, title, parent)
-        self.setGeometry(100, 100, 1500, 800)
-        # Status line. Experimental code. May be moved to a superclass or an external class in the future
-        self.ui.statusLine.setText("Texture analyzer ready!")
-        self.ui.statusLine.setReadOnly(True)
-        #self.ui.statusLine.setBackgroundColor(QtCore.Qt.green)
-        self.table_widget = self.ui.texCheckerTableWidget
-        self.resized = False
+        self.texts = { c[0]: [] for c in textureColumns }
+        """Map of column name to list of display texts (None if not computed yet)
+        """
+        self.keys = { c[0]: [] for c in textureColumns }
+        """Map of column name to list of sort keys
+        """
+        self.states = { c[0]: [] for c in textureColumns }
+        """Map of column name to list of cell states (CELL_*)
+        """
+        self.cellErrors = dict()
+        """Map of (row, column name) to error message of the lazy cells whose computation failed (shown as tooltip)
+        """
+        self.memoryReport = tlc.shading.texturememory.MemoryReport()
+        self.renderColorSpace = ""
+        self.camera = None
         self.numErrors = 0
-        self.numDupes = 0
         self.textureUsage = 0
-        self.memoryUsage = 0
         self.diskUsage = 0
         self.txUsage = 0
-        self.renderColorSpace = cmds.colorManagementPrefs(q=True, renderingSpaceName=True)
-        self.camera = tlc.shading.textureanalyzer.RenderCamera()
-        self.updateCameraList()
 
-    def addTextCell(self, row, col, text):
-        cell = QtWidgets.QTableWidgetItem(text)
-        flags = QtCore.Qt.ItemIsEnabled # Not editable, but we mark enabled flag so it is not grayed out
-        cell.setFlags(flags)
-        self.table_widget.setItem(row, col, cell)
-        #table_widget.resizeColumnToContents(col)
-        return cell
-    
+    def clear(self, memoryReport, renderColorSpace, camera):
+        """Remove all the rows and set the scene settings used to compute the cells
 
-    def resizeTable(self):
-        self.table_widget.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
-        self.table_widget.resizeColumnsToContents()
-        #for c in range(self.table_widget.columnCount()):
-        #    self.table_widget.resizeColumnToContents(c)
+        Args:
+            memoryReport (texturememory.MemoryReport): Memory report filled with the textures added
+            renderColorSpace (str): Rendering color space (for .tx file names)
+            camera (RenderCamera): Camera for texels per pixel
+        """
+        self.beginResetModel()
+        self.textures = []
+        for c in textureColumns:
+            self.texts[c[0]] = []
+            self.keys[c[0]] = []
+            self.states[c[0]] = []
+        self.cellErrors = dict()
+        self.memoryReport = memoryReport
+        self.renderColorSpace = renderColorSpace
+        self.camera = camera
+        self.numErrors = 0
+        self.textureUsage = 0
+        self.diskUsage = 0
+        self.txUsage = 0
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.textures)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(textureColumns)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return textureColumns[section][1]
+        return None
+
+    def flags(self, index):
+        # Not editable, but we mark enabled flag so it is not grayed out
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        name = textureColumns[index.column()][0]
+        if role == QtCore.Qt.DisplayRole:
+            return self.text(row, name)
+        if role == QtCore.Qt.UserRole:
+            self.text(row, name)
+            return self.keys[name][row]
+        if role == QtCore.Qt.BackgroundRole:
+            return cellColors.get(self.states[name][row])
+        if role == QtCore.Qt.ForegroundRole:
+            return QtGui.QColor(QtCore.Qt.black) if self.states[name][row] != CELL_NORMAL else None
+        if role == QtCore.Qt.ToolTipRole:
+            return self.toolTip(row, name)
+        return None
+
+    def text(self, row, name):
+        """Display text of a cell (lazy cells are computed on the first request)
+        """
+        if self.texts[name][row] is None:
+            self.__computeLazyCell(row, name)
+        return self.texts[name][row]
 
+    def __set(self, row, name, text, key=None, state=CELL_NORMAL):
+        self.texts[name][row] = text
+        self.keys[name][row] = text if key is None else key
+        self.states[name][row] = state
 
-    def addFileTexture(self, file_tex):
-        """Add a file texture to the table
-        This method adds a new row to the table in the UI, fill the cells with
-        the data in a FileTexture object, and configures the operations
-        over the textures
+    def addTextures(self, textures):
+        """Append rows for some textures
 
         Args:
-            table_widget (QTableWidget): Table widget object in the UI
-            tex (FileTexture): FileTexture object
+            textures (FileTexture[]): List of FileTexture objects
         """
-        row = self.table_widget.rowCount()
-        self.table_widget.setRowCount(row+1)
-        #table_widget.setMinimumHeight(1)
-
-        self.fileTextureObjects.append(file_tex)
-        self.populateRow(row)
-
+        if not textures:
+            return
+        first = len(self.textures)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(textures) - 1)
+        for t in textures:
+            self.textures.append(t)
+            for c in textureColumns:
+                self.texts[c[0]].append(None)
+                self.keys[c[0]].append(None)
+                self.states[c[0]].append(CELL_NORMAL)
+            self.__computeRow(len(self.textures) - 1)
+        self.endInsertRows()
 
     def updateRow(self, row):
-        file_tex = self.fileTextureObjects[row]
-        file_tex.reCheck()
-        self.populateRow(row)
-
-
-    def populateRow(self, row):
+        """Recompute the cells of a row (after checking again its texture)
+        """
+        self.__removeFromTotals(row)
+        self.__computeRow(row)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(textureColumns) - 1))
 
-        file_tex = self.fileTextureObjects[row]
+    def invalidateColumn(self, name):
+        """Forget the values of a lazy column (e.g. texels per pixel after a camera change).
+        They are computed again when shown
+        """
+        for row in range(len(self.textures)):
+            self.texts[name][row] = None
+        self.cellErrors = { k: v for k, v in self.cellErrors.items() if k[1] != name }
+        col = columnIndex[name]
+        if self.textures:
+            self.dataChanged.emit(self.index(0, col), self.index(len(self.textures) - 1, col))
+
+    def updateDuplicates(self):
+        """Update the duplicate column from the duplicate flags of the textures
+
+        Returns:
+            int: Number of duplicated textures
+        """
+        num_dupes = 0
+        for row, file_tex in enumerate(self.textures):
+            if file_tex.duplicate:
+                num_dupes = num_dupes + 1
+            self.__set(row, "dup", "X" if file_tex.duplicate else "")
+        if self.textures:
+            col = columnIndex["dup"]
+            self.dataChanged.emit(self.index(0, col), self.index(len(self.textures) - 1, col))
+        return num_dupes
+
+    def __removeFromTotals(self, row):
+        if self.states["status"][row] == CELL_ERROR:
+            self.numErrors = self.numErrors - 1
+        self.textureUsage = self.textureUsage - (self.keys["resolution"][row] or 0)
+        self.diskUsage = self.diskUsage - (self.keys["disk"][row] or 0)
+        self.txUsage = self.txUsage - (self.keys["tx"][row] or 0)
+
+    def __computeRow(self, row):
+        file_tex = self.textures[row]
 
         # Node name
-        col = 0
-        self.addTextCell(row, col, file_tex.nodeName)
+        self.__set(row, "node", file_tex.nodeName)
 
         # Status
-        col = col+1
-        status = "OK"
-        bgcolor = QtCore.Qt.green
-        fgcolor = QtCore.Qt.black
         if not file_tex.valid():
-            status = "ERROR"
-            bgcolor = QtCore.Qt.red
+            self.__set(row, "status", "ERROR", 2, CELL_ERROR)
             self.numErrors = self.numErrors + 1
         elif file_tex.warnings:
-            status = "WARN"
-            bgcolor = QtGui.QColor(255,127,0)   # Orange
-        cell = self.addTextCell(row, col, status)
-        cell.setBackground(bgcolor)
-        cell.setForeground(fgcolor)
-        self.table_widget.item(row, col).setToolTip(file_tex.errorMessage)
+            self.__set(row, "status", "WARN", 1, CELL_WARNING)
+        else:
+            self.__set(row, "status", "OK", 0, CELL_OK)
 
         # Duplicate
-        col = col+1
-        status = ""
-        if file_tex.duplicate:
-            status = "X"
-            self.numDupes = self.numDupes + 1
-        cell = self.addTextCell(row, col, status)
+        self.__set(row, "dup", "X" if file_tex.duplicate else "")
 
         # Target name
-        col = col+1
         text = file_tex.target + "." + file_tex.channel
-        cell = self.addTextCell(row, col, text)
         if text == ".":
-            cell.setBackground(QtCore.Qt.red)
-            cell.setForeground(QtCore.Qt.black)
-            cell.setText("NO CONNECTION")
+            self.__set(row, "target", "NO CONNECTION", "", CELL_ERROR)
+        else:
+            self.__set(row, "target", text)
 
         # Shading group
-        col = col+1
-        self.addTextCell(row, col, file_tex.shadingGroup)
+        self.__set(row, "shadingGroup", file_tex.shadingGroup)
 
         # File name
-        col = col+1
-        filename = file_tex.fileName
-        cell = self.addTextCell(row, col, filename)
+        state = CELL_NORMAL
         if file_tex.missingFile():
-            filename = "FILE NOT FOUND"
-            bgcolor = QtCore.Qt.red
-            fgcolor = QtCore.Qt.black
-            cell.setBackground(bgcolor)
-            cell.setForeground(fgcolor)
-        # TO-DO: set color to naming error condition
-        if not file_tex.missingFile():
-            if not file_tex.verifyTextureName():
-                bgcolor = QtGui.QColor(255,127,0)   # Orange
-                fgcolor = QtCore.Qt.black
-                cell.setBackground(bgcolor)
-                cell.setForeground(fgcolor)
-        self.table_widget.item(row, col).setToolTip(file_tex.fullPath)
+            state = CELL_ERROR
+        elif not file_tex.verifyTextureName():
+            # TO-DO: set color to naming error condition
+            state = CELL_WARNING
+        self.__set(row, "fileName", file_tex.fileName, None, state)
 
         # Projection
-        col = col+1
-        txt = ""
-        if file_tex.throughProjection:
-            txt = "X"
-        cell = self.addTextCell(row, col, txt)
+        self.__set(row, "projection", "X" if file_tex.throughProjection else "")
 
         # Map type
-        col = col+1
-        cell = self.addTextCell(row, col, file_tex.mapType)
-        if file_tex.mapType == "unknown" or "normal" in file_tex.errors or "mapType" in file_tex.errors:
-            bgcolor = QtCore.Qt.red
-            fgcolor = QtCore.Qt.black
-            cell.setBackground(bgcolor)
-            cell.setForeground(fgcolor)
+        state = CELL_ERROR if file_tex.mapType == "unknown" or "normal" in file_tex.errors or "mapType" in file_tex.errors else CELL_NORMAL
+        self.__set(row, "mapType", file_tex.mapType, None, state)
 
         # Resolution
-        col = col+1
-        cell = self.addTextCell(row, col, file_tex.buildResolutionString())
-        tooltip = str(file_tex.resX) + "x" + str(file_tex.resY)
-        self.table_widget.item(row, col).setToolTip(tooltip)
+        num_texels = file_tex.resX * file_tex.resY
+        self.textureUsage = self.textureUsage + num_texels
+        self.__set(row, "resolution", file_tex.buildResolutionString(), num_texels)
 
         # Color space
-        col = col+1
-        if False:
-            combo_box = QtWidgets.QComboBox()
-            combo_box.addItem(file_tex.colorSpace)
-            combo_box.addItem("other")
-            combo_box.addItem("another")
-            #flags = QtCore.Qt.ItemIsEnabled # Not editable, but we mark enabled flag so it is not grayed out
-            #cell.setFlags(flags)
-            table_widget.setCellWidget(row, col, combo_box)
-            table_widget.resizeColumnToContents(col)
-            if not file_tex.valid() and "colorSpace" in file_tex.errors:
-                pal = combo_box.palette()
-                pal.setColor(QtGui.QPalette.Button, QtGui.QColor(255,0,0))
-                #pal.setColor(QtGui.QPalette.Text, QtGui.QColor(127,127,127))
-                combo_box.setPalette(pal)
-                #bgcolor = QtCore.Qt.red
-                #fgcolor = QtCore.Qt.black
-                #combo_box.setBackground(bgcolor)
-                #combo_box.setForeground(fgcolor)
-        else:
-            cell = self.addTextCell(row, col, file_tex.colorSpace)
-            if "colorSpace" in file_tex.errors:
-                bgcolor = QtCore.Qt.red
-                fgcolor = QtCore.Qt.black
-                cell.setBackground(bgcolor)
-                cell.setForeground(fgcolor)
+        self.__set(row, "colorSpace", file_tex.colorSpace, None, CELL_ERROR if "colorSpace" in file_tex.errors else CELL_NORMAL)
 
         # File format
-        col = col+1
-        cell = self.addTextCell(row, col, file_tex.fileFormat)
-        if "fileFormat" in file_tex.errors:
-            bgcolor = QtCore.Qt.red
-            fgcolor = QtCore.Qt.black
-            cell.setBackground(bgcolor)
-            cell.setForeground(fgcolor)
+        self.__set(row, "format", file_tex.fileFormat, None, CELL_ERROR if "fileFormat" in file_tex.errors else CELL_NORMAL)
 
         # Version
-        col = col+1
-        cell = self.addTextCell(row, col, str(file_tex.version))
+        self.__set(row, "version", str(file_tex.version), file_tex.version)
 
         # Source
-        col = col+1
-        cell = self.addTextCell(row, col, tlc.shading.textureanalyzer.imgSrcName[file_tex.imgSrc])
-        if file_tex.imgSrc == tlc.shading.textureanalyzer.ImageSource.IMG_SRC_UNKNOWN:
-            bgcolor = QtCore.Qt.red
-            fgcolor = QtCore.Qt.black
-            cell.setBackground(bgcolor)
-            cell.setForeground(fgcolor)
+        unknown = file_tex.imgSrc == tlc.shading.textureanalyzer.ImageSource.IMG_SRC_UNKNOWN
+        self.__set(row, "source", tlc.shading.textureanalyzer.imgSrcName[file_tex.imgSrc], None, CELL_ERROR if unknown else CELL_NORMAL)
 
         # Element ID
-        col = col+1
-        cell = self.addTextCell(row, col, file_tex.elementID)
+        self.__set(row, "elementID", file_tex.elementID)
 
-        # Memory usage
-        col = col+1
-        num_texels = file_tex.resX * file_tex.resY
-        self.textureUsage = self.textureUsage + num_texels
-        bytes_per_pixel = file_tex.bytesPerPixel()
-        mu = num_texels * bytes_per_pixel
-        cell = self.addTextCell(row, col, formatUnitsBinary(mu, "B"))
-        self.memoryUsage = self.memoryUsage + mu
+        # Memory usage. Mipmapped memory of all the UDIM tiles (files shared by several nodes are counted once in the total)
+        mu = file_tex.addToMemoryReport(self.memoryReport).memory["mipmapped"]
+        self.__set(row, "memory", formatUnitsBinary(mu, "B"), mu)
 
         # Disk usage
-        col = col+1
-        if os.path.isfile(file_tex.fullPath):
-            tex_st = os.stat(file_tex.fullPath)
-            du = tex_st.st_size
-        else:
-            du = 0
-        cell = self.addTextCell(row, col, formatUnitsBinary(du, "B"))
-        if du == 0:
-            bgcolor = QtCore.Qt.red
-            fgcolor = QtCore.Qt.black
-            cell.setBackground(bgcolor)
-            cell.setForeground(fgcolor)
-
+        du = file_tex.fileSize
         self.diskUsage = self.diskUsage + du
+        self.__set(row, "disk", formatUnitsBinary(du, "B"), du, CELL_ERROR if du == 0 else CELL_NORMAL)
 
         # .tx disk usage
-        col = col+1
-        txu = 0
         split_tex_path = os.path.splitext(file_tex.fullPath)
         tx_path = split_tex_path[0] + "_" + file_tex.colorSpace + "_" + self.renderColorSpace + split_tex_path[1] + ".tx"
-        if os.path.isfile(tx_path):
-            tex_st = os.stat(tx_path)
-            txu = tex_st.st_size
-        cell = self.addTextCell(row, col, formatUnitsBinary(txu, "B"))
-        if txu == 0:
-            bgcolor = QtCore.Qt.red
-            fgcolor = QtCore.Qt.black
-            cell.setBackground(bgcolor)
-            cell.setForeground(fgcolor)
+        txu = tlc.shading.textureanalyzer.getMetadataCache().txSize(tx_path)
         self.txUsage = self.txUsage + txu
+        self.__set(row, "tx", formatUnitsBinary(txu, "B"), txu, CELL_ERROR if txu == 0 else CELL_NORMAL)
+
+        # Texel density, texels per pixel and meshes are computed when shown
+        for name in lazyColumns:
+            self.texts[name][row] = None
+            self.cellErrors.pop((row, name), None)
+
+    def __computeLazyCell(self, row, name):
+        file_tex = self.textures[row]
+        if name == "texelDensity":
+            td = 0
+            ntd = file_tex.getNormalizedTexelDensity()
+            if ntd:
+                mean_res = (file_tex.resX+file_tex.resY)/2.
+                td = ntd * mean_res
+            self.__set(row, name, "%.2f" % round(td,2) if td else "unknown", td)
+        elif name == "tpp":
+            self.text(row, "texelDensity")
+            td = self.keys["texelDensity"][row]
+            tpp = [ 0, 0 ]
+            self.cellErrors.pop((row, name), None)
+            if td > 0. and self.camera is not None:
+                try:
+                    tpp = file_tex.getTexelsPerPixel(self.camera, td)
+                except Exception as e:
+                    # Not shown as "-" (not visible), so a broken camera setup or estimator can be told apart
+                    log.exception("Texels per pixel failed for %s", file_tex.nodeName)
+                    self.cellErrors[(row, name)] = "Texels per pixel failed: " + str(e)
+                    self.__set(row, name, "ERROR", -1, CELL_ERROR)
+                    return
+            if tpp[0] == tpp[1]:
+                tpp_text = "-" if tpp[0] == 0 else "%.2f" % round(tpp[0],2)
+            else:
+                tpp_text = "%.2f - %.2f" %( round(tpp[0],2), round(tpp[1],2) )
+            self.__set(row, name, tpp_text, tpp[1])
+        elif name == "meshes":
+            meshes = file_tex.getMeshes()
+            count = len(meshes) if meshes else 0
+            self.__set(row, name, str(count) + " nodes" if count else "", count)
+
+    def toolTip(self, row, name):
+        file_tex = self.textures[row]
+        if name == "status":
+            return file_tex.errorMessage
+        if name == "fileName":
+            return file_tex.fullPath
+        if name == "resolution":
+            return str(file_tex.resX) + "x" + str(file_tex.resY)
+        if name == "memory":
+            key = self.memoryReport.nodes.get(file_tex.nodeName)
+            if key is None:
+                return None
+            tex_mem = self.memoryReport.textures[key]
+            tooltip = "\n".join(m + ": " + formatUnitsBinary(tex_mem.memory[m], "B") for m in tlc.shading.texturememory.memoryModes)
+            if len(tex_mem.files) > 1:
+                tooltip += "\n" + str(len(tex_mem.files)) + " UDIM tiles"
+            return tooltip
+        if (row, name) in self.cellErrors:
+            return self.cellErrors[(row, name)]
+        if name == "tpp" and self.keys["tpp"][row]:
+            stats = file_tex.getTexelsPerPixelStats(self.camera, self.keys["texelDensity"][row])
+            lines = []
+            for mesh, st in stats.items():
+                lines.append(mesh + ": " + " / ".join("p" + str(p) + " %.2f" % v for p, v in st["percentiles"].items()) +
+                             " (" + str(int(round(st["visible"] * 100))) + "% visible)")
+            return "\n".join(lines) if lines else None
+        if name == "meshes" and self.keys["meshes"][row]:
+            return "Texture applied to:\n" + "\n".join(file_tex.getMeshes())
+        return None
+
+
+class TextureFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """Sorting and filtering of the texture table
+
+    Rows are sorted by the sort keys of the model (UserRole) and filtered by
+    a text (matched against the non-lazy filterColumns, so filtering does not
+    compute the expensive cells) and optionally by status
+    """
 
-        # Texel density
-        col = col+1
-        ntd_text = "unknown"
-        td = 0
-        ntd = file_tex.getNormalizedTexelDensity()
-        if ntd:
-            mean_res = (file_tex.resX+file_tex.resY)/2.
-            td = ntd * mean_res
-            ntd_text = "%.2f" % round(td,2)
-        cell = self.addTextCell(row, col, ntd_text)
-
-        # Texels per pixel
-        col = col+1
-        cell = self.addTextCell(row, col, "-")
-        self.updateTexelsPerPixelInRow(row)
-
-        # Meshes
-        col = col+1
-        cell = self.addTextCell(row, col, "")
-        meshes = file_tex.getMeshes()
-        if meshes:
-            cell.setText(str(len(meshes)) + " nodes")
-            tooltip_msg = "Texture applied to:"
-            for n in meshes:
-                tooltip_msg += "\n" + n
-            self.table_widget.item(row, col).setToolTip(tooltip_msg)
+    def __init__(self, parent=None):
+        super(TextureFilterProxyModel, self).__init__(parent)
+        self.setSortRole(QtCore.Qt.UserRole)
+        self.filterString = ""
+        self.issuesOnly = False
 
+    def setFilter(self, text, issuesOnly=False):
+        """Set the filter
 
-    def populateUI(self, textures):
-        """Clear the tables and repopulate them from textures in current scene
+        Args:
+            text (str): Text contained in any of the filterColumns (case insensitive)
+            issuesOnly (bool, optional): Show only textures with errors or warnings. Defaults to False.
         """
-        # Clear the tables
-        self.ui.texCheckerTableWidget.setRowCount(0)
-        self.fileTextureObjects.clear()
+        self.filterString = text.lower()
+        self.issuesOnly = bool(issuesOnly)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, sourceRow, sourceParent):
+        model = self.sourceModel()
+        if self.issuesOnly and model.states["status"][sourceRow] == CELL_OK:
+            return False
+        if not self.filterString:
+            return True
+        return any(self.filterString in (model.texts[c][sourceRow] or "").lower() for c in filterColumns)
+
+    def lessThan(self, left, right):
+        a = left.data(QtCore.Qt.UserRole)
+        b = right.data(QtCore.Qt.UserRole)
+        try:
+            return a < b
+        except TypeError:
+            # Mixed or missing keys
+            return str(a) < str(b)
 
-        # Global settings
+
+class TextureAnalyzerUI(qtutils.CheckerWindow):
+    """User interface for TextureAnalyzer
+    
+    The table is a QTableView over a TextureTableModel (through a
+    TextureFilterProxyModel for sorting and filtering). Row indices in the
+    methods below are rows of the model (see sourceRow)
+
+    https://doc.qt.io/qtforpython-6/PySide6/QtCore/QAbstractTableModel.html
+
+    """
+
+    scanBatchSize = 256
+    """Maximum number of rows added in each deferred callback
+    """
+
+
+    def __init__(self, parent=tlc.common.qtutils.getMayaMainWindow()):
+        """Constructor
+        """
+        # .ui file saved from Qt Designer is supposed to be named this way:
+        #   "textureanalyzer_ui.py" --> "textureanalyzer.ui"
+        ui_file = os.path.basename(__file__).split(".")[0].replace("_", ".")
+        title = "Texture analyzer"
+        super(TextureAnalyzerUI, self).__init__(os.path.dirname(__file__) + "/" + ui_file, title, parent)
+        self.model = TextureTableModel(self)
+        self.proxyModel = TextureFilterProxyModel(self)
+        self.proxyModel.setSourceModel(self.model)
+        self.setGeometry(100, 100, 1500, 800)
+        # Status line. Experimental code. May be moved to a superclass or an external class in the future
+        self.ui.statusLine.setText("Texture analyzer ready!")
+        self.ui.statusLine.setReadOnly(True)
+        #self.ui.statusLine.setBackgroundColor(QtCore.Qt.green)
+        self.table_view = self.ui.texCheckerTableView
+        self.table_view.setModel(self.proxyModel)
+        self.table_view.setSortingEnabled(True)
+        self.table_view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table_view.verticalHeader().setDefaultSectionSize(self.table_view.fontMetrics().height() + 6)
+        self.resized = False
+        self.numDupes = 0
+        self.memoryUsage = 0
         self.renderColorSpace = cmds.colorManagementPrefs(q=True, renderingSpaceName=True)
-        self.camera.configure(self.ui.cameraComboBox.currentText())
+        self.camera = tlc.shading.textureanalyzer.RenderCamera()
+        self.scan = None
+        """Analysis in progress (TextureScan)
+        """
+        self.scanStartTime = 0
+        self.scanMessage = ""
+        self.updateCameraList()
 
-        # Set columns
-        col_labels = ["Node", "Status", "Dup", "Target", "Shading Group", "File name", "Pjtd", "Map type", "Res", "Color space", "Format", "Ver", "Source", "ElementID", "Memory usage", "Disk usage", ".tx size", "Texel density", "Texel/pixel", "Meshes"]
-        self.ui.texCheckerTableWidget.setColumnCount(len(col_labels))
-        self.ui.texCheckerTableWidget.setHorizontalHeaderLabels(col_labels)
+    @property
+    def fileTextureObjects(self):
+        """FileTexture objects in the table (in model order)
+        """
+        return self.model.textures
 
-        self.numErrors = 0
+    def resizeTable(self):
+        # Sizes from the first rows only (lazy cells are not computed for the rest)
+        self.table_view.horizontalHeader().setResizeContentsPrecision(64)
+        self.table_view.resizeColumnsToContents()
+
+    def sourceRow(self, index):
+        """Row of the model for an index of the view
+        """
+        return self.proxyModel.mapToSource(index).row()
+
+    def addFileTexture(self, file_tex):
+        """Add a file texture to the table
+
+        Args:
+            file_tex (FileTexture): FileTexture object
+        """
+        self.model.addTextures([ file_tex ])
+
+
+    def updateRow(self, row, connectionsChanged=False):
+        """Check again the texture of a row and update its cells
+
+        Args:
+            row (int): Row (model index)
+            connectionsChanged (bool, optional): The shading network may have changed (a new snapshot is taken). Defaults to False (only attributes changed, the snapshot of the scan is reused).
+        """
+        file_tex = self.fileTextureObjects[row]
+        file_tex.reCheck(None if connectionsChanged else file_tex.graph)
+        self.model.updateRow(row)
+        self.updateTotals()
+
+
+    def clearUI(self):
+        """Clear the tables and the totals before populating them
+        """
+        # Global settings
+        self.renderColorSpace = cmds.colorManagementPrefs(q=True, renderingSpaceName=True)
+
+        self.model.clear(tlc.shading.texturememory.MemoryReport(tlc.shading.textureanalyzer.getMetadataCache().readImageHeader),
+                         self.renderColorSpace, self.camera)
+        self.configureCamera()
         self.numDupes = 0
-        self.textureUsage = 0
         self.memoryUsage = 0
-        self.diskUsage = 0
-        self.txUsage = 0
 
-        for tex in textures:
-            self.addFileTexture(tex)
+    def updateTotals(self):
+        """Update the totals of the textures in the table
+        """
+        self.memoryUsage = self.model.memoryReport.sceneTotal()
 
-        self.ui.errorText.setText(str(self.numErrors) + "/" + str(len(textures)))
+        self.ui.errorText.setText(str(self.model.numErrors) + "/" + str(len(self.fileTextureObjects)))
         self.ui.dupesText.setText(str(self.numDupes))
-        self.ui.textureUsageText.setText(formatUnits(self.textureUsage, "pixels"))
+        self.ui.textureUsageText.setText(formatUnits(self.model.textureUsage, "pixels"))
         self.ui.memoryUsageText.setText(formatUnitsBinary(self.memoryUsage, "Bytes"))
-        self.ui.diskUsageText.setText(formatUnitsBinary(self.diskUsage, "Bytes"))
-        self.ui.txUsageText.setText(formatUnitsBinary(self.txUsage, "Bytes"))
+        self.ui.diskUsageText.setText(formatUnitsBinary(self.model.diskUsage, "Bytes"))
+        self.ui.txUsageText.setText(formatUnitsBinary(self.model.txUsage, "Bytes"))
 
-        if not self.resized:
-            #self.ui.texCheckerTableWidget.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        if not self.resized and self.fileTextureObjects:
             self.resizeTable()
             self.resized = True
 
+    def updateDuplicates(self):
+        """Check duplicated textures in the table and update their column
+        """
+        tlc.shading.textureanalyzer.checkDuplicatedFileTextureNodes(self.fileTextureObjects)
+        self.numDupes = self.model.updateDuplicates()
+
+    def populateUI(self, textures):
+        """Clear the tables and repopulate them from textures in current scene
+        """
+        self.clearUI()
+        self.model.addTextures(textures)
+        self.updateTotals()
+
     def createConnections(self):
         """Connect buttons to functions
         """
         self.ui.closeButton.clicked.connect(self.close)
         self.ui.checkButton.clicked.connect(self.checkButton)
         self.ui.fixPathButton.clicked.connect(self.fixPathsButton)
+        self.ui.cancelButton.clicked.connect(self.cancelScan)
+        self.ui.filterText.textChanged.connect(self.filterChanged)
+        self.ui.issuesOnlyCheckBox.toggled.connect(self.filterChanged)
+        self.ui.playbackRangeCheckBox.toggled.connect(self.cameraChange)
+        self.ui.occlusionCheckBox.toggled.connect(self.cameraChange)
 
-        self.ui.texCheckerTableWidget.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-        self.ui.texCheckerTableWidget.customContextMenuRequested.connect(self.openMenuAstonishing)
-        self.ui.texCheckerTableWidget.cellDoubleClicked.connect(self.cellDoubleClicked)
+        self.ui.texCheckerTableView.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.ui.texCheckerTableView.customContextMenuRequested.connect(self.openMenuAstonishing)
+        self.ui.texCheckerTableView.doubleClicked.connect(self.cellDoubleClicked)
 
 
+    def filterChanged(self, *args):
+        """Filter text or issues-only checkbox changed
+        """
+        self.proxyModel.setFilter(self.ui.filterText.text(), self.ui.issuesOnlyCheckBox.isChecked())
+
     def openMenuAstonishing(self, pos):
-        index = self.ui.texCheckerTableWidget.indexAt(pos)
-        if index.column() in [0, 1, 5]:
-            self.contextMenuFileTextureNode(index, pos)
-        elif index.column() == 9:
-            self.contextMenuColorSpace(index, pos)
-        elif index.column() == 19:
-            self.contextMenuFileTextureGeometry(index, pos)
-
-    def contextMenuFileTextureNode(self, index, pos):
-        cell = self.ui.texCheckerTableWidget.itemFromIndex(index)
+        index = self.ui.texCheckerTableView.indexAt(pos)
+        if not index.isValid():
+            return
+        row = self.sourceRow(index)
+        if index.column() in [ columnIndex["node"], columnIndex["status"], columnIndex["fileName"] ]:
+            self.contextMenuFileTextureNode(row, pos)
+        elif index.column() == columnIndex["colorSpace"]:
+            self.contextMenuColorSpace(row, pos)
+        elif index.column() == columnIndex["meshes"]:
+            self.contextMenuFileTextureGeometry(row, pos)
+
+    def contextMenuFileTextureNode(self, row, pos):
         menu = QtWidgets.QMenu()
         action1 = QtGui.QAction("Select")
-        action1.triggered.connect(lambda: self.selectTexture(index.row()))
+        action1.triggered.connect(lambda: self.selectTexture(row))
         menu.addAction(action1)
         action2 = QtGui.QAction("Preview")
-        action2.triggered.connect(lambda: self.previewTexture(index.row()))
+        action2.triggered.connect(lambda: self.previewTexture(row))
         menu.addAction(action2)
         action3 = QtGui.QAction("Open folder")
-        action3.triggered.connect(lambda: self.openFolder(index.row()))
+        action3.triggered.connect(lambda: self.openFolder(row))
         menu.addAction(action3)
-        if "alpha" in self.fileTextureObjects[index.row()].errors:
+        if "alpha" in self.fileTextureObjects[row].errors:
             action4 = QtGui.QAction("Fix alpha channel")
-            action4.triggered.connect(lambda: self.fixAlphaFromLuminance(index.row()))
+            action4.triggered.connect(lambda: self.fixAlphaFromLuminance(row))
             menu.addAction(action4)
-        if "colorSpace" in self.fileTextureObjects[index.row()].errors:
+        if "colorSpace" in self.fileTextureObjects[row].errors:
             action5 = QtGui.QAction("Fix colorspace")
-            action5.triggered.connect(lambda: self.fixColorSpace(index.row()))
+            action5.triggered.connect(lambda: self.fixColorSpace(row))
             menu.addAction(action5)
         action6 = QtGui.QAction("Recheck")
-        action6.triggered.connect(lambda: self.recheckTexture(index.row()))
+        action6.triggered.connect(lambda: self.recheckTexture(row))
         menu.addAction(action6)
-        if self.fileTextureObjects[index.row()].missingFile():
+        if self.fileTextureObjects[row].missingFile():
             action7 = QtGui.QAction("Fix path")
-            action7.triggered.connect(lambda: self.fixPath(index.row()))
+            action7.triggered.connect(lambda: self.fixPath(row))
             menu.addAction(action7)
         #menu.setTearOffEnabled(True)
-        #menu.popup(self.ui.texCheckerTableWidget.viewport().mapToGlobal(pos))
-        menu.exec_(self.ui.texCheckerTableWidget.viewport().mapToGlobal(pos))
+        #menu.popup(self.ui.texCheckerTableView.viewport().mapToGlobal(pos))
+        menu.exec_(self.ui.texCheckerTableView.viewport().mapToGlobal(pos))
 
-    def contextMenuColorSpace(self, index, pos):
-        if "colorSpace" in self.fileTextureObjects[index.row()].errors:
-            cell = self.ui.texCheckerTableWidget.itemFromIndex(index)
+    def contextMenuColorSpace(self, row, pos):
+        if "colorSpace" in self.fileTextureObjects[row].errors:
             menu = QtWidgets.QMenu()
             action1 = QtGui.QAction("Fix ColorSpace")
-            action1.triggered.connect(lambda: self.fixColorSpace(index.row()))
+            action1.triggered.connect(lambda: self.fixColorSpace(row))
             menu.addAction(action1)
             #menu.setTearOffEnabled(True)
-            #menu.popup(self.ui.texCheckerTableWidget.viewport().mapToGlobal(pos))
-            menu.exec_(self.ui.texCheckerTableWidget.viewport().mapToGlobal(pos))
+            #menu.popup(self.ui.texCheckerTableView.viewport().mapToGlobal(pos))
+            menu.exec_(self.ui.texCheckerTableView.viewport().mapToGlobal(pos))
 
-    def contextMenuFileTextureGeometry(self, index, pos):
-        cell = self.ui.texCheckerTableWidget.itemFromIndex(index)
-        meshes = self.fileTextureObjects[index.row()].getMeshes()
+    def contextMenuFileTextureGeometry(self, row, pos):
+        meshes = self.fileTextureObjects[row].getMeshes() or []
         menu = QtWidgets.QMenu()
         actions = []
         mesh_names = []
@@ -471,37 +696,101 @@ class TextureAnalyzerUI(qtutils.CheckerWindow):
             action.triggered.connect(partial(self.selectGeometry, m))
             menu.addAction(action)
             actions.append(action)  # We need to store the actions, otherwise only one will be present in the QMenu
-        menu.exec_(self.ui.texCheckerTableWidget.viewport().mapToGlobal(pos))
+        menu.exec_(self.ui.texCheckerTableView.viewport().mapToGlobal(pos))
 
-    def cellDoubleClicked(self, row, col):
-        if col == 0:
+    def cellDoubleClicked(self, index):
+        row = self.sourceRow(index)
+        col = index.column()
+        if col == columnIndex["node"]:
             # Texure node
-            #cell = self.ui.texCheckerTableWidget.item(row, col)
             self.selectTexture(row)
-        elif col == 3:
+        elif col == columnIndex["target"]:
             # Target (material or light source)
             self.selectTarget(row)
-        elif col == 4:
+        elif col == columnIndex["shadingGroup"]:
             # Shading group (shading engine)
             self.selectShadingGroup(row)
-        elif col == 19:
+        elif col == columnIndex["meshes"]:
             # Meshes
             self.selectAllGeometry(row)
 
     def checkButton(self):
         """Check button function/callback
         """
-        start_time = time.time()
+        self.startScan()
+
+    def startScan(self, message=""):
+        """Start the analysis of the textures in the scene. The textures are
+        checked in a worker thread, and the rows are added progressively
+        from callbacks deferred to Maya's idle time
+
+        Args:
+            message (str, optional): Message shown in the status line when the analysis ends. Defaults to "".
+        """
+        self.cancelScan()
+        self.scanStartTime = time.time()
+        self.scanMessage = message
         self.ui.statusLine.setText("Analyzing textures in scene...")
-        textures = tlc.shading.textureanalyzer.getAllFileTextureNodesInScene()
-        tlc.shading.textureanalyzer.checkDuplicatedFileTextureNodes(textures)
-        self.ui.statusLine.setText("Presenting analysis results...")
-        textureanalyzer_ui.populateUI(textures)
-        end_time = time.time()
-        elapsed_time = end_time - start_time
-        msg = "Analysis complete! (" + f"{elapsed_time:.2}" + " s)"
+        self.clearUI()
+        self.scan = tlc.shading.textureanalyzer.TextureScan(self.scanResultsAvailable)
+        self.ui.progressBar.setRange(0, max(len(self.scan.paths), 1))
+        self.ui.progressBar.setValue(0)
+        self.ui.cancelButton.setEnabled(True)
+        self.ui.checkButton.setEnabled(False)
+        self.scan.start()
+
+    def scanResultsAvailable(self):
+        """Called from the scan thread. Schedule the update of the table in the main thread
+        """
+        maya.utils.executeDeferred(self.addScanResults)
+
+    def addScanResults(self):
+        """Add the rows of the textures checked (deferred callback, in the main thread)
+        """
+        scan = self.scan
+        if scan is None:
+            return
+        # Rows are added in batches so the UI keeps responding
+        self.model.addTextures(scan.takeResults(self.scanBatchSize))
+        self.ui.progressBar.setValue(len(self.fileTextureObjects))
+        if scan.finished:
+            self.finishScan()
+        elif not scan.results.empty():
+            maya.utils.executeDeferred(self.addScanResults)
+
+    def finishScan(self):
+        """Update duplicates and totals once all the rows have been added
+        """
+        scan = self.scan
+        self.scan = None
+        self.ui.cancelButton.setEnabled(False)
+        self.ui.checkButton.setEnabled(True)
+        self.updateDuplicates()
+        self.updateTotals()
+        # Visibility is computed (on the first texels per pixel request) for the meshes of the textures only
+        if self.camera.setObjects(self.textureMeshes()):
+            self.model.invalidateColumn("tpp")
+        elapsed_time = time.time() - self.scanStartTime
+        if scan.error:
+            msg = "Analysis failed: " + str(scan.error)
+        elif scan.cancelled.is_set():
+            msg = "Analysis cancelled (" + str(len(self.fileTextureObjects)) + "/" + str(len(scan.paths)) + " textures)"
+        else:
+            msg = "Analysis complete! (" + f"{elapsed_time:.2}" + " s)"
+        if self.scanMessage:
+            msg = self.scanMessage + " " + msg
         self.ui.statusLine.setText(msg)
 
+    def cancelScan(self):
+        """Cancel the analysis in progress (the rows already added are kept)
+        """
+        if self.scan is not None:
+            self.scan.cancel()
+
+    def closeEvent(self, event):
+        self.cancelScan()
+        super(TextureAnalyzerUI, self).closeEvent(event)
+
     def fixPathsButton(self):
         """Fix-paths button function/callback
         """
@@ -514,15 +803,14 @@ class TextureAnalyzerUI(qtutils.CheckerWindow):
                 else:
                     paths_not_fixed += 1
         #tlc.shading.textureanalyzer.clipTexturePathToSourceImages()
-        self.checkButton()
         msg = ""
         if paths_fixed == 0 and paths_not_fixed == 0:
             msg += "Nothing to fix."
         if paths_fixed > 0:
             msg += str(paths_fixed) + " file paths fixed. "
         if paths_not_fixed > 0:
-            msg += str(paths_not_fixed) + " paths could not be found"
-        self.ui.statusLine.setText(msg)
+            msg += str(paths_not_fixed) + " paths could not be found."
+        self.startScan(msg)
 
     def selectTexture(self, row):
         cmds.select(self.fileTextureObjects[row].nodeName)
@@ -534,7 +822,8 @@ class TextureAnalyzerUI(qtutils.CheckerWindow):
         os.startfile(os.path.dirname(self.fileTextureObjects[row].fullPath))
 
     def recheckTexture(self, row):
-        self.updateRow(row)
+        # The user may have changed anything in the scene
+        self.updateRow(row, connectionsChanged=True)
 
     def fixAlphaFromLuminance(self, row):
         file_tex = self.fileTextureObjects[row]
@@ -556,13 +845,11 @@ class TextureAnalyzerUI(qtutils.CheckerWindow):
     def fixColorSpace(self, row):
         file_tex = self.fileTextureObjects[row]
         file_tex.fixColorSpace()
-        file_tex.reCheck()
         self.updateRow(row)
 
     def fixPath(self, row):
         file_tex = self.fileTextureObjects[row]
         file_tex.fixFilePath()
-        file_tex.reCheck()
         self.updateRow(row)
 
     def updateCameraList(self):
@@ -573,41 +860,40 @@ class TextureAnalyzerUI(qtutils.CheckerWindow):
             if cmds.getAttr(c+".renderable"):
                 self.ui.cameraComboBox.addItem(c)
 
-    def cameraChange(self, new_camera):
-        if new_camera:
-            self.camera.configure(new_camera)
-            self.updateTexelsPerPixel()
+    def textureMeshes(self):
+        """Meshes using the textures in the table
 
-    def updateTexelsPerPixelInRow(self, row):
-        col = 18  # TPP column index
-        item = self.table_widget.item(row, col)
-        try:
-            td = float(self.table_widget.item(row, 17).text())  # to-do TD may be a file_tex attribute @TO-DO!!!
-            if td > 0.:
-                file_tex = self.fileTextureObjects[row]
-                tpp = file_tex.getTexelsPerPixel(self.camera, td)
-                if tpp[0] == tpp[1]:
-                    if tpp[0] == 0:
-                        tpp_text = "-"
-                    else:
-                        tpp_text = "%.2f" % round(tpp[0],2)
-                else:
-                    tpp_text = "%.2f - %.2f" %( round(tpp[0],2), round(tpp[1],2) )
-            else:
-                tpp_text = "-"
-            item.setText(tpp_text)
-        except:
-            item.setText("-")
+        Returns:
+            str[]: Transform nodes of the meshes
+        """
+        meshes = dict()
+        for file_tex in self.fileTextureObjects:
+            for m in file_tex.getMeshes() or []:
+                meshes[m] = True
+        return list(meshes)
+
+    def configureCamera(self):
+        """Configure the camera from the camera settings in the UI (camera,
+        playback range and occlusion). The visibility of the meshes of the
+        textures in the table is computed when texels per pixel are shown
+        """
+        frames = None
+        if self.ui.playbackRangeCheckBox.isChecked():
+            frames = tlc.shading.texelsperpixel.TexelsPerPixelEstimator.playbackFrames()
+        self.camera.configure(self.ui.cameraComboBox.currentText(), frames, self.ui.occlusionCheckBox.isChecked(),
+                              self.textureMeshes())
+
+    def cameraChange(self, *args):
+        if self.ui.cameraComboBox.currentText():
+            self.configureCamera()
+            self.updateTexelsPerPixel()
 
     def updateTexelsPerPixel(self):
-        start_time = time.time()
-        self.ui.statusLine.setText("Recomputing texels per pixel...")
-        for row in range(self.table_widget.rowCount()):
-            self.updateTexelsPerPixelInRow(row)
-        end_time = time.time()
-        elapsed_time = end_time - start_time
-        msg = "Texels per pixel computation complete! (" + f"{elapsed_time:.2}" + " s)"
-        self.ui.statusLine.setText(msg)
+        """Recompute texels per pixel (e.g. after a camera change). Values
+        are computed again as their cells are shown
+        """
+        self.model.invalidateColumn("tpp")
+        self.ui.statusLine.setText("Texels per pixel updated for camera " + self.ui.cameraComboBox.currentText())
 
 
 def run():
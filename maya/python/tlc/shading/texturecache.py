@@ -0,0 +1,308 @@
+"""
+Persistent texture metadata cache.
+
+This module stores the metadata of texture files (header properties, size,
+content hash and presence of .tx files) in an SQLite database, so analyzing
+again a scene, or another scene sharing library textures, does not need to
+access and decode the files again. Entries are keyed by path, size and
+modification time, and are only invalidated when the file changes.
+
+The presence of .tx files is validated by the modification time of their
+directory (which changes when files are added or removed).
+
+New entries are written in batches (a single transaction per scan, see
+flush), not one transaction per file. If the database cannot be written
+(read-only file, or locked by another Maya session), the cache keeps working
+without storing new entries.
+
+It does not depend on Maya. In Maya, textureanalyzer keeps a cache in the
+cache directory of the current project.
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import tlc.common.tracing as tracing
+import tlc.shading.imageheader as imageheader
+
+
+log = tracing.getLogger(__name__)
+
+
+cacheFileName = "tlc_texture_metadata.sqlite"
+"""File name of the cache database (inside the cache directory of the project)
+"""
+
+schemaVersion = 1
+"""Version of the database tables. Older databases are discarded
+"""
+
+maxPendingWrites = 1024
+"""Entries written before the pending transaction is committed (besides the explicit flush)
+"""
+
+maxPendingTime = 5.
+"""Seconds a transaction may stay pending before it is committed with the next write
+"""
+
+lockTimeout = 1.
+"""Seconds waiting for the database locked by another process before giving up writing
+"""
+
+
+class FileMetadata():
+    """Metadata of a texture file
+    """
+
+    def __init__(self, path, size, mtime, info=None, contentHash=None):
+        self.path = path
+        self.size = size
+        """File size in bytes
+        """
+        self.mtime = mtime
+        """Modification time (ns)
+        """
+        self.info = info
+        """Properties read from the header (imageheader.ImageInfo, None if not supported)
+        """
+        self.contentHash = contentHash
+        """SHA-1 of the file contents (None until requested)
+        """
+
+
+def _fileKey(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+class TextureMetadataCache():
+    """Texture metadata cache (SQLite database)
+    """
+
+    def __init__(self, dbPath=":memory:"):
+        """Constructor
+
+        Args:
+            dbPath (str, optional): Database file path. Defaults to ":memory:" (not persistent).
+        """
+        self.dbPath = dbPath
+        self.lock = threading.Lock()
+        """Lock serializing the access to the database (which may be used from worker threads)
+        """
+        self.dirTimes = dict()
+        """Modification times of the directories checked in this session
+        """
+        self.readable = True
+        """Entries are read from the database (False after a read failed, e.g. locked by another process)
+        """
+        self.writable = True
+        """New entries are stored (False after a write failed)
+        """
+        self.pendingWrites = 0
+        self.pendingSince = 0.
+        self.db = sqlite3.connect(dbPath, timeout=lockTimeout, check_same_thread=False)
+        with self.lock, self.db:
+            version = self.db.execute("PRAGMA user_version").fetchone()[0]
+            if version != schemaVersion:
+                self.db.execute("DROP TABLE IF EXISTS files")
+                self.db.execute("DROP TABLE IF EXISTS tx")
+                self.db.execute("PRAGMA user_version = " + str(schemaVersion))
+            self.db.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, info TEXT, hash TEXT)")
+            self.db.execute("CREATE TABLE IF NOT EXISTS tx (path TEXT PRIMARY KEY, dirMtime INTEGER, size INTEGER)")
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.db.close()
+
+    def __read(self, sql, args):
+        """Query a row. Errors are reported as a cache miss
+        """
+        with self.lock:
+            if not self.readable:
+                return None
+            try:
+                return self.db.execute(sql, args).fetchone()
+            except sqlite3.Error as e:
+                # Do not wait for the database again in this session
+                log.warning("Texture metadata cache not readable (%s) in %s. Files will be read again", e, self.dbPath)
+                self.readable = False
+                self.writable = False
+                return None
+
+    def __write(self, sql, args):
+        """Execute a statement in the pending transaction (committed by flush,
+        or when too many entries or too much time are pending)
+        """
+        with self.lock:
+            if not self.writable:
+                return
+            try:
+                self.db.execute(sql, args)
+                if not self.pendingWrites:
+                    self.pendingSince = time.monotonic()
+                self.pendingWrites += 1
+                if self.pendingWrites >= maxPendingWrites or time.monotonic() - self.pendingSince > maxPendingTime:
+                    self.__commit()
+            except sqlite3.Error as e:
+                self.__writeFailed(e)
+
+    def __commit(self):
+        self.db.commit()
+        self.pendingWrites = 0
+
+    def __writeFailed(self, error):
+        # Keep working without storing the new entries (e.g. read-only database or locked by another session)
+        log.warning("Texture metadata cache not writable (%s) in %s. New entries will not be stored", error, self.dbPath)
+        self.writable = False
+        self.pendingWrites = 0
+        try:
+            self.db.rollback()
+        except sqlite3.Error:
+            pass
+
+    def flush(self):
+        """Commit the entries written since the last flush (e.g. at the end of a scan)
+        """
+        with self.lock:
+            if not self.pendingWrites:
+                return
+            try:
+                self.__commit()
+            except sqlite3.Error as e:
+                self.__writeFailed(e)
+
+    def lookup(self, path):
+        """Get the metadata of a file (read from the cache if the file did not change)
+
+        Args:
+            path (str): File path
+
+        Returns:
+            FileMetadata: File metadata (None if the file does not exist or cannot be read)
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not os.access(path, os.R_OK):
+            return None
+        key = _fileKey(path)
+        row = self.__read("SELECT info, hash FROM files WHERE path=? AND size=? AND mtime=?", (key, st.st_size, st.st_mtime_ns))
+        if row:
+            info = imageheader.ImageInfo.fromDict(json.loads(row[0])) if row[0] else None
+            return FileMetadata(path, st.st_size, st.st_mtime_ns, info, row[1])
+        # New or modified file
+        info = imageheader.readImageHeader(path)
+        self.__write("INSERT OR REPLACE INTO files (path, size, mtime, info, hash) VALUES (?, ?, ?, ?, NULL)",
+                     (key, st.st_size, st.st_mtime_ns, json.dumps(info.toDict()) if info else None))
+        return FileMetadata(path, st.st_size, st.st_mtime_ns, info)
+
+    def readImageHeader(self, path):
+        """Get the header properties of an image file (see imageheader.readImageHeader)
+
+        Args:
+            path (str): File path
+
+        Returns:
+            imageheader.ImageInfo: Image properties (None if not available)
+        """
+        meta = self.lookup(path)
+        return meta.info if meta else None
+
+    def contentHash(self, path):
+        """Get the SHA-1 of the contents of a file (computed only once per version of the file)
+
+        Args:
+            path (str): File path
+
+        Returns:
+            str: Hexadecimal digest (None if the file cannot be read)
+        """
+        meta = self.lookup(path)
+        if meta is None:
+            return None
+        if meta.contentHash:
+            return meta.contentHash
+        sha = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha.update(block)
+        digest = sha.hexdigest()
+        self.__write("UPDATE files SET hash=? WHERE path=? AND size=? AND mtime=?", (digest, _fileKey(path), meta.size, meta.mtime))
+        return digest
+
+    def __dirMtime(self, directory):
+        if directory not in self.dirTimes:
+            try:
+                self.dirTimes[directory] = os.stat(directory).st_mtime_ns
+            except OSError:
+                self.dirTimes[directory] = -1
+        return self.dirTimes[directory]
+
+    def txSize(self, path):
+        """Get the size of a .tx file (0 if it does not exist)
+
+        The result is reused while the directory of the file is not modified.
+        The modification times of the directories are checked once per session
+        (see refresh).
+
+        Args:
+            path (str): .tx file path
+
+        Returns:
+            int: File size in bytes
+        """
+        key = _fileKey(path)
+        dir_mtime = self.__dirMtime(os.path.dirname(key))
+        row = self.__read("SELECT size FROM tx WHERE path=? AND dirMtime=?", (key, dir_mtime))
+        if row:
+            return row[0]
+        size = os.path.getsize(path) if os.path.isfile(path) else 0
+        self.__write("INSERT OR REPLACE INTO tx (path, dirMtime, size) VALUES (?, ?, ?)", (key, dir_mtime, size))
+        return size
+
+    def refresh(self):
+        """Forget the modification times of the directories checked (to detect
+        new .tx files) and commit the pending entries
+        """
+        self.dirTimes.clear()
+        self.flush()
+
+    def prune(self):
+        """Remove the entries of files that no longer exist
+
+        Returns:
+            int: Number of entries removed
+        """
+        self.flush()
+        with self.lock:
+            paths = [ r[0] for r in self.db.execute("SELECT path FROM files") ]
+        missing = [ (p,) for p in paths if not os.path.isfile(p) ]
+        with self.lock:
+            try:
+                with self.db:
+                    self.db.executemany("DELETE FROM files WHERE path=?", missing)
+            except sqlite3.Error as e:
+                self.__writeFailed(e)
+                return 0
+        return len(missing)
@@ -0,0 +1,300 @@
+"""
+Texture memory estimation.
+
+This module estimates the memory needed to load textures in a renderer or
+GPU from the properties of the image files (see imageheader), taking into
+account bit depth, mip chains, tiling of .tx files and UDIM tiles. Textures
+are added to a report, which computes totals per texture, material and
+asset, and a scene total counting only once the files shared by several
+nodes.
+
+Memory budgets (modes):
+    uncompressed: full resolution level only
+    mipmapped: full mip chain (the levels stored in the file or generated by the renderer), padded to the tile size of tiled files
+    bcn: full mip chain block compressed (BC1/BC4 for 8-bit RGB/gray, BC5 for two channels, BC6H for HDR and BC7 for RGBA)
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import re
+import glob
+import tlc.shading.imageheader as imageheader
+
+
+memoryModes = [ "uncompressed", "mipmapped", "bcn" ]
+"""Memory budgets computed
+"""
+
+udimToken = "<UDIM>"
+udimPattern = re.compile(r"(?<!\d)(1\d{3})(?!\d)")
+"""UDIM tile number in file names (1001-1999)
+"""
+
+
+def mipChain(width, height, levels=0):
+    """Resolutions of the levels of a mip chain
+
+    Args:
+        width (int): Width of the full resolution level
+        height (int): Height of the full resolution level
+        levels (int, optional): Number of levels. Defaults to 0 (full chain, down to 1x1).
+
+    Returns:
+        list: List of (width, height) tuples
+    """
+    chain = [ (width, height) ]
+    while (width > 1 or height > 1) and (not levels or len(chain) < levels):
+        width = max(width // 2, 1)
+        height = max(height // 2, 1)
+        chain.append((width, height))
+    return chain
+
+
+def bcnBlockBytes(info):
+    """Size of a 4x4 block in the block compression format used for an image
+
+    Args:
+        info (ImageInfo): Image properties
+
+    Returns:
+        int: Bytes per block (8 for BC1/BC4, 16 for BC5/BC6H/BC7)
+    """
+    if info.sampleFormat in ("half", "float") or info.bitDepth > 8:
+        # BC6H (HDR, no alpha)
+        return 16
+    if info.channels == 1:
+        return 8   # BC4
+    if info.channels == 2:
+        return 16   # BC5
+    if info.channels >= 4 or info.hasAlpha:
+        return 16   # BC7
+    return 8   # BC1
+
+
+def imageMemory(info, mode="mipmapped"):
+    """Memory needed to load an image
+
+    Args:
+        info (ImageInfo): Image properties
+        mode (str, optional): Memory budget (see memoryModes). Defaults to "mipmapped".
+
+    Returns:
+        int: Size in bytes
+    """
+    if mode == "uncompressed":
+        levels = [ (info.width, info.height) ]
+    else:
+        # Mipmapped files keep their levels, the renderer generates the full chain for the others
+        levels = mipChain(info.width, info.height, info.mipLevels if info.mipLevels > 1 else 0)
+    if mode == "bcn":
+        block = bcnBlockBytes(info)
+        return sum(((w + 3) // 4) * ((h + 3) // 4) * block for w, h in levels)
+    # Channels of less than 8 bits (and palettes) are expanded when loaded
+    bytes_per_pixel = info.channels * max(info.bitDepth, 8) // 8
+    total = 0
+    for w, h in levels:
+        if info.tiled and info.tileWidth and info.tileHeight and mode != "uncompressed":
+            # Tiles are loaded whole, even at the borders
+            w = -(-w // info.tileWidth) * info.tileWidth
+            h = -(-h // info.tileHeight) * info.tileHeight
+        total += w * h * bytes_per_pixel
+    return total
+
+
+def textureKey(path):
+    """Key identifying the files of a texture (to count shared textures once)
+    """
+    return os.path.normcase(os.path.abspath(path))
+
+
+def udimTiles(path):
+    """Find the files of the UDIM tiles of a texture
+
+    Args:
+        path (str): Texture path, containing either the <UDIM> token or the number of a tile
+
+    Returns:
+        str[]: Paths of the existing tile files (sorted). The path itself if it is not an UDIM texture
+    """
+    directory, name = os.path.split(path)
+    if udimToken in name:
+        pattern = name.replace(udimToken, "[1-9][0-9][0-9][0-9]")
+    else:
+        matches = list(udimPattern.finditer(name))
+        if not matches:
+            return [ path ]
+        # The last number in the name is the tile
+        m = matches[-1]
+        pattern = glob.escape(name[:m.start()]) + "[1-9][0-9][0-9][0-9]" + glob.escape(name[m.end():])
+    tiles = sorted(glob.glob(os.path.join(glob.escape(directory), pattern)))
+    return tiles if tiles else [ path ]
+
+
+class TextureMemory():
+    """Memory usage of a texture file (all its UDIM tiles)
+    """
+
+    def __init__(self, path, udim=False, info=None, readHeader=imageheader.readImageHeader):
+        """Constructor
+
+        Args:
+            path (str): Texture path
+            udim (bool, optional): The texture is split in UDIM tiles. Defaults to False.
+            info (ImageInfo, optional): Properties of the image (of the first tile) if already read. Defaults to None.
+            readHeader (function, optional): Function reading the properties of an image file. Defaults to imageheader.readImageHeader.
+        """
+        self.path = path
+        self.files = udimTiles(path) if udim else [ path ]
+        """Files loaded (UDIM tiles)
+        """
+        self.missing = []
+        """Files whose header could not be read
+        """
+        self.memory = dict.fromkeys(memoryModes, 0)
+        """Size in bytes per memory budget
+        """
+        for f in self.files:
+            file_info = info if info and f == path else readHeader(f)
+            if file_info is None:
+                self.missing.append(f)
+                continue
+            for mode in memoryModes:
+                self.memory[mode] += imageMemory(file_info, mode)
+
+
+class MemoryReport():
+    """Texture memory usage of a scene, grouped by texture, material and asset
+    """
+
+    def __init__(self, readHeader=imageheader.readImageHeader):
+        """Constructor
+
+        Args:
+            readHeader (function, optional): Function reading the properties of an image file (e.g. from a metadata cache). Defaults to imageheader.readImageHeader.
+        """
+        self.readHeader = readHeader
+        self.textures = dict()
+        """Map of texture key to TextureMemory
+        """
+        self.users = dict()
+        """Map of texture key to list of (node, material, asset) using it
+        """
+        self.nodes = dict()
+        """Map of texture node name to texture key
+        """
+
+    def add(self, node, path, material="", assets=(), udim=False, info=None):
+        """Add a texture node
+
+        Args:
+            node (str): Texture node name
+            path (str): Texture path
+            material (str, optional): Material using the texture. Defaults to "".
+            assets (str[], optional): Assets using the texture. Defaults to ().
+            udim (bool, optional): The texture is split in UDIM tiles. Defaults to False.
+            info (ImageInfo, optional): Properties of the image if already read. Defaults to None.
+
+        Returns:
+            TextureMemory: Memory usage of the texture (shared with other nodes using the same file)
+        """
+        self.remove(node)
+        key = textureKey(path)
+        self.nodes[node] = key
+        if key not in self.textures:
+            self.textures[key] = TextureMemory(path, udim, info, self.readHeader)
+            self.users[key] = []
+        for asset in (assets or [ "" ]):
+            self.users[key].append((node, material, asset))
+        return self.textures[key]
+
+    def remove(self, node):
+        """Remove a texture node (e.g. before adding it again after changing its path)
+
+        Args:
+            node (str): Texture node name
+        """
+        key = self.nodes.pop(node, None)
+        if key is None:
+            return
+        self.users[key] = [ u for u in self.users[key] if u[0] != node ]
+        if not self.users[key]:
+            del self.users[key]
+            del self.textures[key]
+
+    def textureMemory(self, node, mode="mipmapped"):
+        """Memory usage of the texture of a node
+
+        Returns:
+            int: Size in bytes (0 if the node was not added)
+        """
+        if node not in self.nodes:
+            return 0
+        return self.textures[self.nodes[node]].memory[mode]
+
+    def __groupTotals(self, index, mode):
+        totals = dict()
+        for key, users in self.users.items():
+            # Files shared inside a group are counted once
+            for group in set(u[index] for u in users):
+                totals[group] = totals.get(group, 0) + self.textures[key].memory[mode]
+        return totals
+
+    def materialTotals(self, mode="mipmapped"):
+        """Memory usage per material
+
+        Returns:
+            dict: Map of material name to size in bytes
+        """
+        return self.__groupTotals(1, mode)
+
+    def assetTotals(self, mode="mipmapped"):
+        """Memory usage per asset
+
+        Returns:
+            dict: Map of asset name to size in bytes
+        """
+        return self.__groupTotals(2, mode)
+
+    def sceneTotal(self, mode="mipmapped"):
+        """Memory usage of the whole scene (files shared by several nodes are counted once)
+
+        Returns:
+            int: Size in bytes
+        """
+        return sum(t.memory[mode] for t in self.textures.values())
+
+    def naiveTotal(self, mode="mipmapped"):
+        """Memory usage adding every texture node (without deduplication)
+
+        Returns:
+            int: Size in bytes
+        """
+        return sum(self.textures[key].memory[mode] * len(set(u[0] for u in users)) for key, users in self.users.items())
+
+    def assetsOverBudget(self, budget, mode="mipmapped"):
+        """Assets whose textures exceed a memory budget
+
+        Args:
+            budget (int): Budget in bytes
+            mode (str, optional): Memory budget (see memoryModes). Defaults to "mipmapped".
+
+        Returns:
+            dict: Map of asset name to size in bytes (of the assets over budget)
+        """
+        return { a: m for a, m in self.assetTotals(mode).items() if a and m > budget }
@@ -0,0 +1,306 @@
+"""
+Visibility of meshes from a render camera.
+
+This module finds the meshes seen by a camera without using the viewport
+(no lookThru or selection from screen), so it works in batch (mayapy) and
+does not change the view or the selection of the user. The bounding box of
+each mesh is transformed to the space of the camera at every frame and
+tested against the planes of the view frustum, built from the focal length,
+film aperture, film fit, clipping planes and render resolution (a box for
+orthographic cameras, see texelsperpixel.CameraView).
+
+Optionally, meshes hidden behind others are discarded using a coarse depth
+raster of the scene: the triangles of the meshes inside the frustum are
+rasterized at low resolution (depth tested at the centers of the cells),
+and a mesh is occluded when the raster is closer to the camera than its
+bounding box in all the cells covered by the box on screen.
+
+Usage:
+
+    engine = VisibilityEngine("cameraShape1", frames=[ 1, 2, 3 ], occlusion=True)
+    engine.visibleObjects()
+"""
+"""
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+import maya.api.OpenMaya as om  # Maya Python API 2.0
+import maya.cmds as cmds
+import tlc.modeling.meshanalysis as meshanalysis
+import tlc.modeling.meshcheck as meshcheck
+import tlc.shading.texelsperpixel as texelsperpixel
+
+
+defaultRasterWidth = 160
+"""Width in cells of the depth raster used for occlusion (the height follows the image aspect ratio)
+"""
+
+
+def boxCorners(bbox):
+    """Corners of a bounding box
+
+    Args:
+        bbox (float[6]): xmin, ymin, zmin, xmax, ymax, zmax
+
+    Returns:
+        float[8][3]: Corner positions
+    """
+    bbox = np.asarray(bbox, dtype=np.float64)
+    select = np.array([ [ (i >> axis) & 1 for axis in range(3) ] for i in range(8) ], dtype=bool)
+    return np.where(select, bbox[3:], bbox[:3])
+
+
+def frustumPlanes(view):
+    """Planes of the view frustum in camera space. Points inside the frustum
+    are on the positive side of all of them (normal . p + d >= 0)
+
+    Args:
+        view (texelsperpixel.CameraView): Camera parameters
+
+    Returns:
+        (float[6][3], float[6]): Plane normals and offsets (left, right, bottom, top, near, far)
+    """
+    if view.orthographic:
+        # Box shaped
+        hx = view.viewWidth / 2.
+        hy = view.viewHeight / 2.
+        normals = np.array([ [ 1., 0., 0. ], [ -1., 0., 0. ], [ 0., 1., 0. ], [ 0., -1., 0. ], [ 0., 0., -1. ], [ 0., 0., 1. ] ])
+        offsets = np.array([ hx, hx, hy, hy, -view.nearClip, view.farClip ])
+        return normals, offsets
+    tx = view.filmWidth / (2. * view.focalLength)
+    ty = view.filmHeight / (2. * view.focalLength)
+    # Cameras look down their -Z axis
+    normals = np.array([ [ 1., 0., -tx ], [ -1., 0., -tx ], [ 0., 1., -ty ], [ 0., -1., -ty ], [ 0., 0., -1. ], [ 0., 0., 1. ] ])
+    offsets = np.array([ 0., 0., 0., 0., -view.nearClip, view.farClip ])
+    return normals, offsets
+
+
+class VisibilityEngine():
+    """Visibility of the meshes of the scene from a camera, at one or several frames
+    """
+
+    def __init__(self, camera, frames=None, occlusion=False, rasterWidth=defaultRasterWidth, objects=None):
+        """Constructor. Compute the visibility
+
+        Args:
+            camera (str): Camera (shape or transform) node name
+            frames (float[], optional): Frames evaluated. Defaults to None (current time only).
+            occlusion (bool, optional): Discard meshes hidden behind others. Defaults to False.
+            rasterWidth (int, optional): Width of the depth raster used for occlusion. Defaults to defaultRasterWidth.
+            objects (str[], optional): Mesh (transform) nodes tested. Defaults to all the meshes in the scene.
+        """
+        self.camera = camera
+        self.frames = list(frames) if frames else [ None ]
+        """Frames evaluated (None is the current time)
+        """
+        self.views = [ texelsperpixel.CameraView(camera, f) for f in self.frames ]
+        """Camera parameters at each frame
+        """
+        self.occlusion = occlusion
+        self.rasterWidth = rasterWidth
+        self.objects = list(objects) if objects is not None else self.__sceneMeshes()
+        """Mesh (transform) nodes tested
+        """
+        self.__index = { o: j for j, o in enumerate(self.objects) }
+        self.meshData = [ self.__getMeshData(o) for o in self.objects ]
+        self.matrices = None
+        """World matrices of the objects at each frame (frames x objects x 4 x 4)
+        """
+        self.visibility = dict()
+        """Map of object name to visibility at each frame (bool[])
+        """
+        self.compute()
+
+    @staticmethod
+    def __sceneMeshes():
+        objects = []
+        for shape in cmds.ls(type="mesh", long=True) or []:
+            if cmds.getAttr(shape + ".intermediateObject"):
+                continue
+            parent = cmds.listRelatives(shape, parent=True)[0]
+            if parent not in objects:
+                objects.append(parent)
+        return objects
+
+    def __getMeshData(self, obj):
+        sel = om.MSelectionList()
+        sel.add(obj)
+        dag = sel.getDagPath(0)
+        try:
+            dag.extendToShape()
+        except:
+            # No shape!
+            return None
+        if dag.apiType() != om.MFn.kMesh:
+            return None
+        buffers = [ "faces", "points" ] if self.occlusion else [ "points" ]
+        return meshcheck.getMeshData(dag, buffers)
+
+    def compute(self):
+        """Compute the visibility of the objects at every frame
+        """
+        valid = [ j for j, m in enumerate(self.meshData) if m is not None and len(m.points) ]
+        visible = np.zeros((len(self.frames), len(self.objects)), dtype=bool)
+        if valid:
+            corners = np.array([ boxCorners(np.concatenate((self.meshData[j].points.min(axis=0), self.meshData[j].points.max(axis=0))))
+                                 for j in valid ])
+            # Read once per frame for all the objects (reused by the texels per pixel estimator)
+            self.matrices = np.zeros((len(self.frames), len(self.objects), 4, 4))
+            self.matrices[:, valid] = texelsperpixel.worldMatrices([ self.objects[j] for j in valid ], self.frames)
+            world = self.matrices[:, valid]
+            for i, view in enumerate(self.views):
+                # Object to camera space, all the objects at once
+                to_camera = world[i] @ view.viewMatrix
+                cam_corners = np.einsum("ocj,ojk->ock", corners, to_camera[:, :3, :3]) + to_camera[:, None, 3, :3]
+                normals, offsets = frustumPlanes(view)
+                dist = cam_corners @ normals.T + offsets
+                # Outside when all the corners are outside the same plane
+                inside = ~np.any(np.all(dist < 0., axis=1), axis=1)
+                if self.occlusion and np.any(inside):
+                    inside_objects = np.flatnonzero(inside)
+                    raster = self.depthRaster(view, [ valid[k] for k in inside_objects ], world[i, inside_objects])
+                    for k, corners_k in zip(inside_objects, cam_corners[inside_objects]):
+                        if self.__occluded(view, raster, corners_k):
+                            inside[k] = False
+                visible[i, valid] = inside
+        for j, o in enumerate(self.objects):
+            self.visibility[o] = visible[:, j]
+
+    def __rasterSize(self, view):
+        return self.rasterWidth, max(int(round(self.rasterWidth * view.height / float(view.width))), 1)
+
+    def depthRaster(self, view, objects, worldMatrices):
+        """Rasterize the depth of the triangles of some objects at low resolution
+
+        Triangles crossing the near plane are skipped (they do not occlude).
+
+        Args:
+            view (texelsperpixel.CameraView): Camera parameters
+            objects (int[]): Indices of the objects
+            worldMatrices (float[][4][4]): World matrices of the objects
+
+        Returns:
+            float[][]: Depth per cell (rows from the bottom of the image, inf where there is nothing)
+        """
+        width, height = self.__rasterSize(view)
+        raster = np.full(width * height, np.inf)
+        for j, matrix in zip(objects, worldMatrices):
+            mesh = self.meshData[j]
+            world_points = mesh.points @ matrix[:3, :3] + matrix[3, :3]
+            x, y, depth = view.project(world_points)
+            x = x * width / view.width
+            y = y * height / view.height
+            _, a, b, c = meshanalysis.fanTriangles(mesh.faceVertexCounts)
+            tris = np.stack((mesh.faceVertexIndices[a], mesh.faceVertexIndices[b], mesh.faceVertexIndices[c]), axis=1)
+            tris = tris[np.all(depth[tris] >= view.nearClip, axis=1)]
+            if not len(tris):
+                continue
+            tx = x[tris]
+            ty = y[tris]
+            tz = depth[tris]
+            # Cells whose centers are inside the bounding rectangle of each triangle
+            x0 = np.clip(np.ceil(tx.min(axis=1) - .5), 0, width).astype(np.int64)
+            x1 = np.clip(np.floor(tx.max(axis=1) - .5), -1, width - 1).astype(np.int64)
+            y0 = np.clip(np.ceil(ty.min(axis=1) - .5), 0, height).astype(np.int64)
+            y1 = np.clip(np.floor(ty.max(axis=1) - .5), -1, height - 1).astype(np.int64)
+            cols = np.maximum(x1 - x0 + 1, 0)
+            rows = np.maximum(y1 - y0 + 1, 0)
+            num_cells = cols * rows
+            tri = np.repeat(np.arange(len(tris)), num_cells)
+            if not len(tri):
+                continue
+            local = np.arange(len(tri)) - meshanalysis.faceOffsets(num_cells)[tri]
+            cx = x0[tri] + local % cols[tri]
+            cy = y0[tri] + local // cols[tri]
+            px = cx + .5
+            py = cy + .5
+            # Barycentric coordinates of the cell centers (both windings)
+            ax, ay = tx[tri, 0], ty[tri, 0]
+            bx, by = tx[tri, 1], ty[tri, 1]
+            qx, qy = tx[tri, 2], ty[tri, 2]
+            area = (bx - ax) * (qy - ay) - (qx - ax) * (by - ay)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                l1 = ((px - ax) * (qy - ay) - (qx - ax) * (py - ay)) / area
+                l2 = ((bx - ax) * (py - ay) - (px - ax) * (by - ay)) / area
+                l0 = 1. - l1 - l2
+                inside = (area != 0.) & (l0 >= 0.) & (l1 >= 0.) & (l2 >= 0.)
+                if view.orthographic:
+                    cell_depth = l0 * tz[tri, 0] + l1 * tz[tri, 1] + l2 * tz[tri, 2]
+                else:
+                    # Perspective correct depth (1/depth is linear in screen space)
+                    cell_depth = 1. / (l0 / tz[tri, 0] + l1 / tz[tri, 1] + l2 / tz[tri, 2])
+            np.minimum.at(raster, (cy * width + cx)[inside], cell_depth[inside])
+        return raster.reshape(height, width)
+
+    def __occluded(self, view, raster, cameraCorners):
+        depth = -cameraCorners[:, 2]
+        if np.any(depth < view.nearClip):
+            # The box crosses the near plane (or the camera is inside it)
+            return False
+        height, width = raster.shape
+        x, y, _ = view.projectCamera(cameraCorners)
+        x = x / view.width
+        y = y / view.height
+        x0 = int(np.clip(np.floor(x.min() * width), 0, width - 1))
+        x1 = int(np.clip(np.floor(x.max() * width), 0, width - 1))
+        y0 = int(np.clip(np.floor(y.min() * height), 0, height - 1))
+        y1 = int(np.clip(np.floor(y.max() * height), 0, height - 1))
+        return bool(np.all(raster[y0:y1 + 1, x0:x1 + 1] < depth.min()))
+
+    def worldMatrices(self, obj):
+        """World matrices of an object at every frame, as read by compute
+
+        Args:
+            obj (str): Object (transform) name
+
+        Returns:
+            float[][4][4]: Matrix per frame (None if the object was not tested)
+        """
+        j = self.__index.get(obj)
+        if self.matrices is None or j is None:
+            return None
+        if self.meshData[j] is None or not len(self.meshData[j].points):
+            return None
+        return self.matrices[:, j]
+
+    def isVisible(self, obj, frame=None):
+        """Check whether an object is seen by the camera
+
+        Args:
+            obj (str): Object (transform) name
+            frame (float, optional): Frame (one of self.frames). Defaults to None (any of the frames).
+
+        Returns:
+            bool: True if the object is visible
+        """
+        if obj not in self.visibility:
+            return False
+        if frame is None:
+            return bool(np.any(self.visibility[obj]))
+        return bool(self.visibility[obj][self.frames.index(frame)])
+
+    def visibleObjects(self, frame=None):
+        """Objects seen by the camera
+
+        Args:
+            frame (float, optional): Frame (one of self.frames). Defaults to None (visible in any of the frames).
+
+        Returns:
+            str[]: Object (transform) names
+        """
+        return [ o for o in self.objects if self.isVisible(o, frame) ]
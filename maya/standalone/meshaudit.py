@@ -0,0 +1,275 @@
+"""
+
+Batch mesh audit of the assets of a project
+
+Opens the last published version of every MODELING task of every asset in
+a project, runs the mesh checker on it and writes the results (one row per
+mesh and one row per asset file) to CSV and columnar (Parquet) files.
+
+Scenes are processed in parallel by a pool of worker processes (each one
+running its own Maya standalone session).
+
+Usage:
+    mayapy meshaudit.py -p <project_dir> -o <output_dir> [-j <workers>]
+
+This file is part of TLC (https://github.com/jtaibo/TallerCreacionTools).
+Copyright (c) 2026 Universidade da Coruña
+Copyright (c) 2026 Javier Taibo <javier.taibo@udc.es>
+
+This program is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+
+import os
+import csv
+import argparse
+import time
+import datetime
+import multiprocessing
+
+
+default_output_dir = "."
+
+modelingTasks = [ "LOWPOLY", "MIDPOLY", "HIGHPOLY" ]
+"""MODELING tasks audited by default
+"""
+
+
+def initWorker():
+    """Initialize a worker process (start Maya standalone)
+    """
+    import maya.standalone
+    maya.standalone.initialize("Python")
+
+
+def auditScene(job):
+    """Open a scene and run the mesh checker on all its meshes
+    (this function runs in the worker processes)
+
+    Args:
+        job (dict): Asset information (projID, assetType, assetID, task, file)
+
+    Returns:
+        (dict, dict[]): Asset record and mesh records
+    """
+    # These python modules must be imported after initializing Maya Python
+    import maya.cmds as cmds
+    import tlc.modeling.meshcheck
+
+    start_time = time.perf_counter()
+    asset_record = dict(job)
+    mesh_records = []
+    try:
+        cmds.file(job["file"], open=True, force=True)
+        checker = tlc.modeling.meshcheck.MeshChecker()
+        # Scenes are already processed in parallel
+        checker.numThreads = 1
+        cmds.select(cmds.ls(assemblies=True), replace=True)
+        checker.analyze()
+        asset_record["status"] = "OK"
+        asset_record.update(checker.getRecord())
+        for r in checker.getMeshRecords():
+            mesh_record = { "projID": job["projID"], "assetID": job["assetID"], "task": job["task"], "file": job["file"] }
+            mesh_record.update(r)
+            mesh_records.append(mesh_record)
+    except Exception as e:
+        asset_record["status"] = "ERROR: " + str(e)
+    asset_record["seconds"] = time.perf_counter() - start_time
+    return asset_record, mesh_records
+
+
+class ColumnarWriter():
+    """Columnar output of records
+
+    Records are written to a Parquet file when pyarrow is available.
+    Otherwise they are kept in columns and saved as a NumPy .npz file
+    when closing
+    """
+
+    def __init__(self, path, batchSize=1000):
+        """Constructor
+
+        Args:
+            path (str): Output file path (without extension)
+            batchSize (int, optional): Number of records written at once. Defaults to 1000.
+        """
+        self.path = path
+        self.batchSize = batchSize
+        self.columns = None
+        self.batch = []
+        self.writer = None
+        self.schema = None
+        try:
+            import pyarrow
+            import pyarrow.parquet
+            self.pa = pyarrow
+        except ImportError:
+            print("pyarrow not available. Columnar data will be saved as a NumPy .npz file")
+            self.pa = None
+
+    def write(self, record):
+        """Add a record
+
+        Args:
+            record (dict): Map of column name to value
+        """
+        if self.pa:
+            self.batch.append(record)
+            if len(self.batch) >= self.batchSize:
+                self.flush()
+        else:
+            if self.columns is None:
+                self.columns = { k: [] for k in record }
+            for k in self.columns:
+                self.columns[k].append(record.get(k))
+
+    def flush(self):
+        """Write pending records (Parquet only)
+        """
+        if not self.batch:
+            return
+        if self.writer is None:
+            table = self.pa.Table.from_pylist(self.batch)
+            self.schema = table.schema
+            self.writer = self.pa.parquet.ParquetWriter(self.path + ".parquet", self.schema)
+        else:
+            table = self.pa.Table.from_pylist(self.batch, schema=self.schema)
+        self.writer.write_table(table)
+        self.batch = []
+
+    def close(self):
+        """Write pending records and close the file
+        """
+        if self.pa:
+            self.flush()
+            if self.writer:
+                self.writer.close()
+        elif self.columns:
+            import numpy as np
+            np.savez_compressed(self.path + ".npz", **{ k: np.array(v) for k, v in self.columns.items() })
+
+
+class RecordWriter():
+    """Stream records to a CSV file and a columnar file
+    """
+
+    def __init__(self, path, fieldnames=None):
+        """Constructor
+
+        Args:
+            path (str): Output file path (without extension)
+            fieldnames (str[], optional): Column names. Defaults to the keys of the first record.
+        """
+        self.csvFile = open(path + ".csv", "w", newline="")
+        self.csvWriter = None
+        self.fieldnames = fieldnames
+        self.columnar = ColumnarWriter(path)
+
+    def write(self, record):
+        """Write a record
+
+        Args:
+            record (dict): Map of column name to value. Missing columns are left empty
+        """
+        if self.fieldnames is None:
+            self.fieldnames = list(record.keys())
+        if self.csvWriter is None:
+            self.csvWriter = csv.DictWriter(self.csvFile, fieldnames=self.fieldnames, extrasaction="ignore")
+            self.csvWriter.writeheader()
+        record = { k: record.get(k) for k in self.fieldnames }
+        self.csvWriter.writerow(record)
+        self.columnar.write(record)
+
+    def close(self):
+        """Close output files
+        """
+        self.csvFile.close()
+        self.columnar.close()
+
+
+def collectJobs(proj_dir, tasks):
+    """Collect last published MODELING versions of all the assets in a project
+
+    Args:
+        proj_dir (str): Project directory
+        tasks (str[]): MODELING task keys
+
+    Returns:
+        dict[]: One job (asset information and file) per scene
+    """
+    import tlc.common.pipeline
+
+    full_path = os.path.abspath(proj_dir)
+    proj = tlc.common.pipeline.DCCProject(os.path.basename(full_path), os.path.dirname(full_path))
+    proj.setAsActive()
+    assets = proj.getAssets()
+    print(len(assets), " assets found")
+
+    jobs = []
+    for a in assets:
+        for task in tasks:
+            path = a.getLastPublishedVersionPath("MODELING", task)
+            if path:
+                jobs.append({ "projID": proj.projID, "assetType": a.assetType, "assetID": a.assetID, "task": task, "file": path })
+    return jobs
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Audit meshes of the last published MODELING versions of all the assets in a project")
+    ap.add_argument("-p", "--proj_dir", required=True, help="Project directory")
+    ap.add_argument("-o", "--output", required=False, help="Output directory", default=default_output_dir)
+    ap.add_argument("-j", "--jobs", required=False, type=int, help="Number of worker processes", default=os.cpu_count())
+    ap.add_argument("-t", "--tasks", required=False, help="MODELING tasks to audit", nargs="+", default=modelingTasks)
+    args = ap.parse_args()
+
+    start_time = time.perf_counter()
+
+    if not os.path.isdir(args.output):
+        print("Output directory does not exist. Will be created.")
+        os.makedirs(args.output)
+
+    print("Starting Maya")
+    import maya.standalone
+    maya.standalone.initialize("Python")
+
+    jobs = collectJobs(args.proj_dir, args.tasks)
+    if not jobs:
+        print("No scenes to audit!")
+        exit(1)
+    print("Auditing " + str(len(jobs)) + " scenes with " + str(args.jobs) + " workers")
+
+    import tlc.modeling.meshcheck
+    asset_columns = [ "projID", "assetType", "assetID", "task", "file", "status", "seconds" ]
+    asset_columns += list(tlc.modeling.meshcheck.MeshChecker().getRecord().keys())
+    assets_out = RecordWriter(args.output + "/meshaudit_assets", asset_columns)
+    meshes_out = RecordWriter(args.output + "/meshaudit_meshes")
+    done = 0
+    # Workers are new processes starting their own Maya (forking this initialized session is not safe)
+    with multiprocessing.get_context("spawn").Pool(processes=args.jobs, initializer=initWorker) as pool:
+        # Results are streamed to the output files as soon as each scene is done
+        for asset_record, mesh_records in pool.imap_unordered(auditScene, jobs):
+            done += 1
+            print("[" + str(done) + "/" + str(len(jobs)) + "] " + asset_record["file"] + " : " + asset_record["status"])
+            assets_out.write(asset_record)
+            for r in mesh_records:
+                meshes_out.write(r)
+    assets_out.close()
+    meshes_out.close()
+
+    print("DONE!")
+    end_time = time.perf_counter()
+    print("Execution time: %s"%str(datetime.timedelta(seconds=end_time-start_time)))
+
+
+if __name__ == "__main__":
+    main()